@@ -0,0 +1,442 @@
+"""Benchmarks dos caminhos de busca do EnvLoader.
+
+Uso:
+    python benchmarks/run.py                       # tabela no terminal
+    python benchmarks/run.py --json results.json   # salva resultados em JSON
+    python benchmarks/run.py --compare base.json   # falha se houver regressão
+    python benchmarks/run.py -k get_list           # filtra casos por nome
+
+Os benchmarks usam o código de ``src/`` deste checkout, não a versão instalada.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from django_env_loader.envobserver import uninstall as uninstall_environ_observer  # noqa: E402
+from django_env_loader.envurl import parse_database_url  # noqa: E402
+from django_env_loader.exceptions import SecretNotFoundError  # noqa: E402
+from django_env_loader.loader import EnvConfig, EnvLoader  # noqa: E402
+
+# Prefixo único para não colidir com o ambiente da máquina
+ENV_PREFIX = "DJEL_BENCH_"
+
+
+@dataclass
+class Result:
+    """Resultado de um caso de benchmark (tempos em nanossegundos por operação)."""
+
+    name: str
+    loops: int
+    repeat: int
+    best_ns: float
+    median_ns: float
+    mean_ns: float
+
+
+@dataclass
+class Case:
+    """Caso de benchmark: ``setup`` prepara o estado e devolve a função medida."""
+
+    name: str
+    setup: Callable[[Path], Callable[[], object]]
+    min_time: float = 0.2
+
+
+CASES: list[Case] = []
+
+
+def case(
+    name: str, *, min_time: float = 0.2
+) -> Callable[..., Callable[[Path], Callable[[], object]]]:
+    """Registra um caso de benchmark."""
+
+    def decorator(
+        setup: Callable[[Path], Callable[[], object]],
+    ) -> Callable[[Path], Callable[[], object]]:
+        CASES.append(Case(name, setup, min_time))
+        return setup
+
+    return decorator
+
+
+def _loader(workdir: Path, **config: object) -> EnvLoader:
+    EnvLoader.reset_singleton()
+    secrets_dir = workdir / "secrets"
+    secrets_dir.mkdir(exist_ok=True)
+    return EnvLoader(EnvConfig(secrets_dir=secrets_dir, warn_on_missing=False, **config))  # type: ignore[arg-type]
+
+
+# ============================================================================
+# Casos
+# ============================================================================
+
+
+@case("get_hit_env")
+def _get_hit_env(workdir: Path) -> Callable[[], object]:
+    loader = _loader(workdir)
+    os.environ[f"{ENV_PREFIX}HIT"] = "value"
+    return lambda: loader.get(f"{ENV_PREFIX}HIT")
+
+
+@case("get_hit_env_no_secrets")
+def _get_hit_env_no_secrets(workdir: Path) -> Callable[[], object]:
+    loader = _loader(workdir)
+    os.environ[f"{ENV_PREFIX}HIT"] = "value"
+    return lambda: loader.get(f"{ENV_PREFIX}HIT", use_secrets=False)
+
+
+@case("get_required_hit")
+def _get_required_hit(workdir: Path) -> Callable[[], object]:
+    loader = _loader(workdir)
+    os.environ[f"{ENV_PREFIX}HIT"] = "value"
+    return lambda: loader.get(f"{ENV_PREFIX}HIT", required=True)
+
+
+@case("get_required_miss")
+def _get_required_miss(workdir: Path) -> Callable[[], object]:
+    loader = _loader(workdir)
+
+    def run() -> object:
+        try:
+            return loader.get(f"{ENV_PREFIX}MISSING", required=True)
+        except SecretNotFoundError:
+            return None
+
+    return run
+
+
+@case("get_hit_secret_cached")
+def _get_hit_secret(workdir: Path) -> Callable[[], object]:
+    loader = _loader(workdir)
+    (workdir / "secrets" / "BENCH_SECRET").write_text("secret-value")
+    return lambda: loader.get("BENCH_SECRET")
+
+
+@case("get_hit_secret_uncached")
+def _get_hit_secret_uncached(workdir: Path) -> Callable[[], object]:
+    loader = _loader(workdir, cache_secrets=False)
+    (workdir / "secrets" / "BENCH_SECRET").write_text("secret-value")
+    return lambda: loader.get("BENCH_SECRET")
+
+
+@case("get_miss")
+def _get_miss(workdir: Path) -> Callable[[], object]:
+    loader = _loader(workdir)
+    return lambda: loader.get(f"{ENV_PREFIX}MISSING", default="x")
+
+
+@case("get_miss_no_secrets")
+def _get_miss_no_secrets(workdir: Path) -> Callable[[], object]:
+    loader = _loader(workdir)
+    return lambda: loader.get(f"{ENV_PREFIX}MISSING", default="x", use_secrets=False)
+
+
+@case("get_prefixed_hit")
+def _get_prefixed_hit(workdir: Path) -> Callable[[], object]:
+    loader = _loader(workdir, prefix=ENV_PREFIX)
+    os.environ[f"{ENV_PREFIX}PREFIXED"] = "value"
+    return lambda: loader.get("PREFIXED")
+
+
+def _typed_case(
+    name: str, raw: str, call: Callable[[EnvLoader, str], object], **config: object
+) -> None:
+    def setup(workdir: Path) -> Callable[[], object]:
+        loader = _loader(workdir, **config)
+        key = f"{ENV_PREFIX}{name.upper()}"
+        os.environ[key] = raw
+        return lambda: call(loader, key)
+
+    CASES.append(Case(name, setup))
+
+
+_typed_case("get_bool", "true", lambda loader, key: loader.get_bool(key))
+_typed_case("get_int", "8080", lambda loader, key: loader.get_int(key))
+_typed_case("get_float", "3.14", lambda loader, key: loader.get_float(key))
+_typed_case("get_list", "a.com, b.com, c.com, d.com", lambda loader, key: loader.get_list(key))
+_typed_case("get_dict", "a=1,b=2,c=3,d=4", lambda loader, key: loader.get_dict(key))
+_typed_case(
+    "get_list_memoized",
+    "a.com, b.com, c.com, d.com",
+    lambda loader, key: loader.get_list(key),
+    memoize_typed=True,
+)
+_typed_case(
+    "get_dict_memoized",
+    "a=1,b=2,c=3,d=4",
+    lambda loader, key: loader.get_dict(key),
+    memoize_typed=True,
+)
+_typed_case("is_set", "value", lambda loader, key: loader.is_set(key))
+
+
+@case("frozen_get_bool")
+def _frozen_get_bool(workdir: Path) -> Callable[[], object]:
+    os.environ[f"{ENV_PREFIX}FROZEN"] = "true"
+    frozen = _loader(workdir).freeze()
+    return lambda: frozen.get_bool(f"{ENV_PREFIX}FROZEN")
+
+
+@case("frozen_attribute")
+def _frozen_attribute(workdir: Path) -> Callable[[], object]:
+    os.environ[f"{ENV_PREFIX}PORT"] = "8000"
+    frozen = _loader(workdir, prefix=ENV_PREFIX).freeze({"PORT": int})
+    return lambda: frozen.PORT
+
+
+@case("parse_database_url")
+def _parse_database_url(workdir: Path) -> Callable[[], object]:
+    # Resultado memorizado por URL: mede a consulta ao cache e a cópia devolvida
+    url = "postgres://app:secret@db:5432/app?conn_max_age=60&sslmode=require"
+    return lambda: parse_database_url(url)
+
+
+def _frozen_debug_case(name: str, *, observe: bool) -> None:
+    def setup(workdir: Path) -> Callable[[], object]:
+        os.environ[f"{ENV_PREFIX}FROZEN"] = "true"
+        loader = _loader(workdir, prefix=ENV_PREFIX, observe_environ=observe)
+        frozen = loader.freeze(debug=True)
+        return lambda: frozen.get_bool("FROZEN")
+
+    CASES.append(Case(name, setup))
+
+
+_frozen_debug_case("frozen_debug_get_bool", observe=False)
+_frozen_debug_case("frozen_debug_get_bool_observed", observe=True)
+
+
+@case("get_all")
+def _get_all(workdir: Path) -> Callable[[], object]:
+    loader = _loader(workdir)
+    return lambda: loader.get_all()
+
+
+@case("get_all_prefixed")
+def _get_all_prefixed(workdir: Path) -> Callable[[], object]:
+    loader = _loader(workdir, prefix=ENV_PREFIX)
+    return lambda: loader.get_all()
+
+
+@case("get_all_prefixed_observed")
+def _get_all_prefixed_observed(workdir: Path) -> Callable[[], object]:
+    for i in range(10):
+        os.environ[f"{ENV_PREFIX}APP_{i}"] = "value"
+    loader = _loader(workdir, prefix=f"{ENV_PREFIX}APP_", observe_environ=True)
+    return lambda: loader.get_all()
+
+
+@case("get_all_prefixed_large_env")
+def _get_all_prefixed_large_env(workdir: Path) -> Callable[[], object]:
+    # Ambiente grande (container com muitas variáveis) e poucas com o prefixo
+    for i in range(2000):
+        os.environ[f"DJEL_NOISE_{i}"] = "x"
+    for i in range(10):
+        os.environ[f"{ENV_PREFIX}APP_{i}"] = "value"
+    loader = _loader(workdir, prefix=f"{ENV_PREFIX}APP_")
+    return lambda: loader.get_all()
+
+
+def _env_file_case(lines: int, parser: str = "auto", *, snapshot: bool = False) -> None:
+    def setup(workdir: Path) -> Callable[[], object]:
+        env_file = workdir / f"large_{lines}.env"
+        with env_file.open("w") as f:
+            for i in range(lines):
+                if i % 10 == 0:
+                    f.write(f"# comentário {i}\n")
+                f.write(f'{ENV_PREFIX}FILE_{i}="value number {i}"\n')
+        loader = _loader(
+            workdir,
+            env_file=env_file,
+            override_existing=True,
+            env_parser=parser,
+            env_snapshot=snapshot,
+        )
+
+        def run() -> object:
+            loader._load_env_file()
+            return None
+
+        return run
+
+    suffix = "" if parser == "auto" else f"_{parser}"
+    if snapshot:
+        suffix += "_snapshot"
+    CASES.append(Case(f"load_env_file_{lines}{suffix}", setup, min_time=0.5))
+
+
+_env_file_case(100)
+_env_file_case(1000)
+_env_file_case(100, "dotenv")
+_env_file_case(1000, snapshot=True)
+
+
+@case("cold_import", min_time=1.0)
+def _cold_import(workdir: Path) -> Callable[[], object]:
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    command = [sys.executable, "-c", "import django_env_loader"]
+    baseline = [sys.executable, "-c", "pass"]
+
+    def run() -> object:
+        # Desconta o custo de subir o interpretador
+        started = time.perf_counter()
+        subprocess.run(baseline, check=True, env=env)
+        interpreter = time.perf_counter() - started
+        started = time.perf_counter()
+        subprocess.run(command, check=True, env=env)
+        return max(time.perf_counter() - started - interpreter, 0.0)
+
+    return run
+
+
+# ============================================================================
+# Execução
+# ============================================================================
+
+
+@contextmanager
+def _isolated_environ() -> Iterator[None]:
+    saved = dict(os.environ)
+    try:
+        yield
+    finally:
+        uninstall_environ_observer()
+        os.environ.clear()
+        os.environ.update(saved)
+        EnvLoader.reset_singleton()
+
+
+def _measure(bench: Case, workdir: Path, repeat: int) -> Result:
+    func = bench.setup(workdir)
+
+    if bench.name == "cold_import":
+        # Mede o tempo retornado pela própria função (subprocessos)
+        samples = [float(func()) * 1e9 for _ in range(repeat)]  # type: ignore[arg-type]
+        loops = 1
+    else:
+        func()  # aquece caches
+        loops = 1
+        while True:
+            started = time.perf_counter()
+            for _ in range(loops):
+                func()
+            elapsed = time.perf_counter() - started
+            if elapsed >= bench.min_time / repeat or loops >= 10_000_000:
+                break
+            loops *= 10 if elapsed < bench.min_time / (repeat * 20) else 2
+
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(loops):
+                func()
+            samples.append((time.perf_counter() - started) / loops * 1e9)
+
+    return Result(
+        name=bench.name,
+        loops=loops,
+        repeat=repeat,
+        best_ns=min(samples),
+        median_ns=statistics.median(samples),
+        mean_ns=statistics.fmean(samples),
+    )
+
+
+def run_benchmarks(selected: list[Case], repeat: int) -> list[Result]:
+    """Executa os casos selecionados, cada um em ambiente isolado."""
+    results = []
+    for bench in selected:
+        with _isolated_environ(), tempfile.TemporaryDirectory() as temp_dir:
+            results.append(_measure(bench, Path(temp_dir), repeat))
+    return results
+
+
+def _format_ns(value: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if value >= scale:
+            return f"{value / scale:8.2f} {unit}"
+    return f"{value:8.0f} ns"
+
+
+def compare(results: list[Result], baseline_path: Path, threshold: float) -> list[str]:
+    """Compara com um JSON anterior; retorna os casos que regrediram."""
+    baseline = {item["name"]: item for item in json.loads(baseline_path.read_text())["results"]}
+    regressions = []
+    print(f"\nComparação com {baseline_path} (limite: +{threshold:.0%})")
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            print(f"  {result.name:<28} (novo)")
+            continue
+        ratio = result.median_ns / previous["median_ns"] - 1
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSÃO"
+            regressions.append(result.name)
+        print(
+            f"  {result.name:<28} {_format_ns(previous['median_ns'])} -> "
+            f"{_format_ns(result.median_ns)} ({ratio:+.1%}){flag}"
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Ponto de entrada do runner."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("-k", "--filter", help="Executa apenas casos que contenham o texto")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições por caso")
+    parser.add_argument("--json", type=Path, help="Salva os resultados neste arquivo")
+    parser.add_argument("--compare", type=Path, help="JSON de referência para comparação")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="Regressão tolerada (fração, padrão 0.10)"
+    )
+    parser.add_argument("--list", action="store_true", help="Lista os casos e sai")
+    args = parser.parse_args(argv)
+
+    selected = [c for c in CASES if not args.filter or args.filter in c.name]
+    if args.list:
+        print("\n".join(c.name for c in selected))
+        return 0
+
+    results = run_benchmarks(selected, args.repeat)
+
+    print(f"{'caso':<28} {'mediana':>11} {'melhor':>11} {'loops':>9}")
+    for result in results:
+        print(
+            f"{result.name:<28} {_format_ns(result.median_ns)} "
+            f"{_format_ns(result.best_ns)} {result.loops:>9}"
+        )
+
+    if args.json:
+        payload = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "results": [asdict(result) for result in results],
+        }
+        args.json.write_text(json.dumps(payload, indent=2))
+        print(f"\nResultados salvos em {args.json}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
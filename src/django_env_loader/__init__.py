@@ -1,19 +1,70 @@
 """Django Env Loader - Gerenciamento de variáveis de ambiente."""
 
-from django_env_loader.exceptions import EnvLoaderError, SecretNotFoundError, ValidationError
-from django_env_loader.loader import DjangoEnvLoader, EnvConfig, EnvLoader
+from __future__ import annotations
+
+import importlib
+
+from typing import TYPE_CHECKING, Any
+
+from django_env_loader.lazy import LazyEnvLoader
+
+if TYPE_CHECKING:
+    from django_env_loader.aio import AsyncEnvLoader
+    from django_env_loader.exceptions import (
+        EnvFileSyntaxError,
+        EnvLoaderError,
+        SchemaError,
+        SecretNotFoundError,
+        ValidationError,
+    )
+    from django_env_loader.loader import DjangoEnvLoader, EnvConfig, EnvLoader
+    from django_env_loader.schema import EnvSchema, Field
 
 __version__ = "1.0.5"
 __all__ = [
+    "AsyncEnvLoader",
     "EnvLoader",
     "DjangoEnvLoader",
     "EnvConfig",
+    "EnvSchema",
+    "Field",
+    "EnvFileSyntaxError",
     "EnvLoaderError",
+    "SchemaError",
     "SecretNotFoundError",
     "ValidationError",
     "env_loader",
 ]
 
-# Instância singleton padrão para importação direta
+# Exports resolvidos sob demanda: importar o pacote não carrega loader/dotenv
+_LAZY_EXPORTS = {
+    "AsyncEnvLoader": "django_env_loader.aio",
+    "EnvLoader": "django_env_loader.loader",
+    "DjangoEnvLoader": "django_env_loader.loader",
+    "EnvConfig": "django_env_loader.loader",
+    "EnvSchema": "django_env_loader.schema",
+    "Field": "django_env_loader.schema",
+    "EnvFileSyntaxError": "django_env_loader.exceptions",
+    "EnvLoaderError": "django_env_loader.exceptions",
+    "SchemaError": "django_env_loader.exceptions",
+    "SecretNotFoundError": "django_env_loader.exceptions",
+    "ValidationError": "django_env_loader.exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
+
+
+# Instância singleton padrão para importação direta, construída no primeiro uso
 # Uso: from django_env_loader import env_loader
-env_loader = EnvLoader()
+env_loader = LazyEnvLoader()
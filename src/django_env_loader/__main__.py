@@ -0,0 +1,7 @@
+"""Permite executar a CLI com ``python -m django_env_loader``."""
+
+import sys
+
+from django_env_loader.cli import main
+
+sys.exit(main())
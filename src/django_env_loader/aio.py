@@ -0,0 +1,188 @@
+"""API assíncrona para o EnvLoader.
+
+A leitura de arquivos de secrets roda em um executor limitado, fora do event
+loop. Awaits concorrentes para o mesmo secret ainda não cacheado compartilham
+uma única leitura em andamento. Com ``EnvConfig.backends``, a cadeia de
+backends é consultada no executor, na mesma ordem de ``EnvLoader.get``.
+
+Exemplo:
+    >>> async with AsyncEnvLoader(loader) as aloader:
+    ...     api_key = await aloader.aget("API_KEY", required=True)
+    ...     values = await aloader.aget_many(["DB_PASSWORD", "REDIS_PASSWORD"])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import warnings
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar, overload
+
+from django_env_loader.exceptions import SecretNotFoundError
+from django_env_loader.loader import EnvLoader
+
+__all__ = ["AsyncEnvLoader"]
+
+T = TypeVar("T")
+
+
+class AsyncEnvLoader:
+    """Fachada assíncrona sobre um EnvLoader existente."""
+
+    def __init__(self, loader: EnvLoader | None = None, *, max_workers: int = 4) -> None:
+        """Inicializa a fachada assíncrona.
+
+        Args:
+            loader: Loader encapsulado (None = EnvLoader padrão)
+            max_workers: Máximo de leituras de arquivo simultâneas
+        """
+        self.loader = loader or EnvLoader()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="django-env-loader"
+        )
+        self._inflight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future[Any]] = {}
+
+    def _run_shared(self, inflight_key: str, read: Callable[[], str | None]) -> asyncio.Future[Any]:
+        """Executa a leitura no executor, compartilhando-a entre awaits concorrentes."""
+        loop = asyncio.get_running_loop()
+        shared_key = (loop, inflight_key)
+        future = self._inflight.get(shared_key)
+        if future is None:
+            future = loop.run_in_executor(self._executor, read)
+            self._inflight[shared_key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(shared_key, None))
+        return future
+
+    def _get_from_secret_backends(self, key: str) -> str | None:
+        """Consulta, em ordem, apenas os backends de secrets (is_secret)."""
+        for backend in self.loader.config.backends or ():
+            if backend.is_secret:
+                value = backend.get(key)
+                if value is not None:
+                    return value
+        return None
+
+    async def aget_secret(self, key: str) -> str | None:
+        """Obtém um Docker secret sem bloquear o event loop.
+
+        Com backends configurados, consulta os backends de secrets (is_secret).
+
+        Args:
+            key: Nome do secret
+
+        Returns:
+            Conteúdo do secret ou None se não existir
+        """
+        loader = self.loader
+        if loader.config.backends is not None:
+            future = self._run_shared(
+                f"backend:{key}", functools.partial(self._get_from_secret_backends, key)
+            )
+            backend_value: str | None = await asyncio.shield(future)
+            return backend_value
+
+        path_str = loader._key_info(key)[1]
+
+        # Caminho rápido: cache em memória, sem troca de thread
+        if loader.config.cache_secrets:
+            cached = loader._secrets_cache.get(path_str)
+            if cached is not None:
+                if loader.config.metrics is not None:
+                    loader.config.metrics.record_lookup(key, "secret_cache", "hit")
+                return cached
+
+        future = self._run_shared(path_str, functools.partial(loader._get_from_secret, key))
+
+        # shield: o cancelamento de um awaiter não cancela a leitura compartilhada
+        value: str | None = await asyncio.shield(future)
+        return value
+
+    @overload
+    async def aget(
+        self, key: str, *, default: T, required: bool = False, use_secrets: bool = True
+    ) -> str | T: ...
+
+    @overload
+    async def aget(
+        self, key: str, *, default: None = None, required: bool = True, use_secrets: bool = True
+    ) -> str: ...
+
+    async def aget(
+        self,
+        key: str,
+        *,
+        default: T | None = None,
+        required: bool = False,
+        use_secrets: bool = True,
+    ) -> str | T:
+        """Versão assíncrona de ``EnvLoader.get`` (mesma semântica)."""
+        loader = self.loader
+        if loader.config.backends is not None:
+            # A ordem da cadeia decide entre secrets e ambiente: consulta a cadeia
+            # como get(), com uma única leitura em andamento por chave
+            if loader.config.metrics is not None:
+                loader.config.metrics.record_access(key)
+            read = functools.partial(loader._get_from_backends, key, use_secrets)
+            future = self._run_shared(f"get:{key}:{use_secrets}", read)
+            found: str | None = await asyncio.shield(future)
+            if found is not None and found.strip():
+                return found
+            return self._missing(key, default, required, use_secrets)
+
+        if use_secrets:
+            value = await self.aget_secret(key)
+            if value is not None:
+                if value.strip():
+                    return value
+                # Secret vazio encobre a variável de ambiente, como em get()
+                return self._missing(key, default, required, use_secrets)
+
+        try:
+            return self.loader.get(key, default=default, required=required, use_secrets=False)
+        except SecretNotFoundError:
+            if not use_secrets:
+                raise
+            searched = self.loader._searched_locations(key, use_secrets=True)
+            raise SecretNotFoundError(key, searched) from None
+
+    def _missing(self, key: str, default: T | None, required: bool, use_secrets: bool) -> str | T:
+        """Trata variável ausente ou vazia com a mesma validação de ``EnvLoader.get``."""
+        if required:
+            raise SecretNotFoundError(key, self.loader._searched_locations(key, use_secrets))
+        if self.loader.config.warn_on_missing and default is None:
+            warnings.warn(f"Variável '{key}' não encontrada", UserWarning, stacklevel=3)
+        return default if default is not None else ""
+
+    async def aget_many(
+        self, keys: Iterable[str], *, use_secrets: bool = True
+    ) -> dict[str, str | None]:
+        """Resolve várias chaves concorrentemente.
+
+        Args:
+            keys: Nomes das variáveis
+            use_secrets: Se deve buscar em Docker secrets
+
+        Returns:
+            Dicionário {chave: valor ou None se não encontrada}
+        """
+        keys = list(keys)
+
+        async def resolve(key: str) -> str | None:
+            value = await self.aget(key, default="", use_secrets=use_secrets)
+            return value or None
+
+        values = await asyncio.gather(*(resolve(key) for key in keys))
+        return dict(zip(keys, values, strict=True))
+
+    def close(self) -> None:
+        """Encerra o executor de leitura."""
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> AsyncEnvLoader:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,370 @@
+"""Backends plugáveis de secrets e variáveis.
+
+Um backend responde ``get`` (uma chave), ``get_many`` (várias chaves em uma
+chamada) e ``list_keys``. O EnvLoader consulta os backends configurados em
+``EnvConfig.backends`` em ordem, parando no primeiro que encontrar a chave.
+
+Exemplo:
+    >>> config = EnvConfig(
+    ...     backends=[
+    ...         CachedBackend(FileDirBackend("/run/secrets"), CachePolicy(ttl=300)),
+    ...         FileDirBackend("/etc/app/kv", nested_separator="__"),
+    ...         EnvBackend(prefix="MYAPP_"),
+    ...     ]
+    ... )
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+from dotenv import dotenv_values
+
+from django_env_loader.cache import CacheStats, SecretCache
+
+__all__ = [
+    "CachePolicy",
+    "CachedBackend",
+    "DotenvBackend",
+    "EnvBackend",
+    "FileDirBackend",
+    "SecretBackend",
+]
+
+logger = logging.getLogger(__name__)
+
+# Limite do registro de chaves ausentes quando a política não define max_size
+_MISSING_KEYS_LIMIT = 4096
+
+
+@runtime_checkable
+class SecretBackend(Protocol):
+    """Interface comum dos backends.
+
+    Attributes:
+        name: Identificador usado nas mensagens de erro (ex: "secret", "env")
+        is_secret: Se o backend é ignorado quando ``use_secrets=False``
+    """
+
+    name: str
+    is_secret: bool
+
+    def get(self, key: str) -> str | None:
+        """Retorna o valor da chave ou None se não existir."""
+        ...
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Retorna apenas as chaves encontradas, em uma única operação."""
+        ...
+
+    def list_keys(self) -> set[str]:
+        """Retorna as chaves disponíveis no backend."""
+        ...
+
+
+# ============================================================================
+# Backends
+# ============================================================================
+
+
+class FileDirBackend:
+    """Um arquivo por chave em um diretório (Docker secrets, volumes key/value).
+
+    Com ``nested_separator`` a chave é mapeada para uma árvore de diretórios:
+    ``DB__PASSWORD`` com separador ``"__"`` lê ``<root>/DB/PASSWORD``.
+    """
+
+    def __init__(
+        self,
+        root: Path | str,
+        *,
+        encoding: str = "utf-8",
+        nested_separator: str | None = None,
+        name: str = "secret",
+        is_secret: bool = True,
+    ) -> None:
+        """Inicializa o backend.
+
+        Args:
+            root: Diretório base
+            encoding: Encoding dos arquivos
+            nested_separator: Separador que mapeia a chave para subdiretórios
+            name: Identificador do backend
+            is_secret: Se é ignorado quando use_secrets=False
+        """
+        self.root = Path(root)
+        self.encoding = encoding
+        self.nested_separator = nested_separator
+        self.name = name
+        self.is_secret = is_secret
+
+    def _path_for(self, key: str) -> Path:
+        if self.nested_separator:
+            return self.root.joinpath(*key.split(self.nested_separator))
+        return self.root / key
+
+    def get(self, key: str) -> str | None:
+        """Lê o arquivo correspondente à chave."""
+        try:
+            return self._path_for(key).read_text(encoding=self.encoding).strip()
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            return None
+        except OSError as e:
+            logger.error(f"Erro ao ler {self._path_for(key)}: {e}")
+            return None
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Lê várias chaves, consultando a listagem para pular as ausentes."""
+        available = self.list_keys()
+        result: dict[str, str] = {}
+        for key in keys:
+            if key in available:
+                value = self.get(key)
+                if value is not None:
+                    result[key] = value
+        return result
+
+    def list_keys(self) -> set[str]:
+        """Lista os arquivos do diretório (recursivamente com nested_separator)."""
+        if not self.nested_separator:
+            try:
+                return {entry.name for entry in os.scandir(self.root) if entry.is_file()}
+            except OSError:
+                return set()
+
+        keys: set[str] = set()
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            # Ignora diretórios internos de volumes do Kubernetes (..data, ..2024_...)
+            dirnames[:] = [d for d in dirnames if not d.startswith("..")]
+            relative = Path(dirpath).relative_to(self.root).parts
+            for filename in filenames:
+                keys.add(self.nested_separator.join((*relative, filename)))
+        return keys
+
+    def __repr__(self) -> str:
+        return f"FileDirBackend({str(self.root)!r})"
+
+
+class EnvBackend:
+    """Variáveis de ambiente (``os.environ`` ou um mapeamento fornecido)."""
+
+    def __init__(
+        self,
+        prefix: str = "",
+        *,
+        environ: Mapping[str, str] | None = None,
+        name: str = "env",
+    ) -> None:
+        """Inicializa o backend.
+
+        Args:
+            prefix: Prefixo aplicado às chaves (mesma regra do EnvLoader)
+            environ: Mapeamento consultado (None = os.environ)
+            name: Identificador do backend
+        """
+        self.prefix = prefix
+        self.environ = environ if environ is not None else os.environ
+        self.name = name
+        self.is_secret = False
+
+    def _prefixed(self, key: str) -> str:
+        return f"{self.prefix}{key}" if self.prefix and not key.startswith(self.prefix) else key
+
+    def get(self, key: str) -> str | None:
+        """Obtém a variável (com prefixo)."""
+        return self.environ.get(self._prefixed(key))
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Obtém várias variáveis em uma passada."""
+        environ = self.environ
+        result: dict[str, str] = {}
+        for key in keys:
+            value = environ.get(self._prefixed(key))
+            if value is not None:
+                result[key] = value
+        return result
+
+    def list_keys(self) -> set[str]:
+        """Lista as variáveis com o prefixo (sem o prefixo)."""
+        if not self.prefix:
+            return set(self.environ)
+        size = len(self.prefix)
+        return {key[size:] for key in self.environ if key.startswith(self.prefix)}
+
+    def __repr__(self) -> str:
+        return f"EnvBackend(prefix={self.prefix!r})"
+
+
+class DotenvBackend:
+    """Arquivo .env lido sem alterar ``os.environ`` (relido quando o mtime muda)."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        encoding: str = "utf-8",
+        name: str = "dotenv",
+        is_secret: bool = False,
+    ) -> None:
+        """Inicializa o backend.
+
+        Args:
+            path: Caminho do arquivo .env
+            encoding: Encoding do arquivo
+            name: Identificador do backend
+            is_secret: Se é ignorado quando use_secrets=False
+        """
+        self.path = Path(path)
+        self.encoding = encoding
+        self.name = name
+        self.is_secret = is_secret
+        self._values: dict[str, str] = {}
+        self._mtime_ns: int | None = None
+
+    def _load(self) -> dict[str, str]:
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            self._values, self._mtime_ns = {}, None
+            return self._values
+        if mtime_ns != self._mtime_ns:
+            values = dotenv_values(self.path, encoding=self.encoding)
+            self._values = {k: v for k, v in values.items() if v is not None}
+            self._mtime_ns = mtime_ns
+        return self._values
+
+    def get(self, key: str) -> str | None:
+        """Obtém a chave do arquivo."""
+        return self._load().get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Obtém várias chaves com uma única verificação do arquivo."""
+        values = self._load()
+        return {key: values[key] for key in keys if key in values}
+
+    def list_keys(self) -> set[str]:
+        """Lista as chaves do arquivo."""
+        return set(self._load())
+
+    def __repr__(self) -> str:
+        return f"DotenvBackend({str(self.path)!r})"
+
+
+# ============================================================================
+# Cache por backend
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Política de cache de um backend.
+
+    Attributes:
+        ttl: Validade (segundos) dos valores encontrados (None = sem expiração)
+        max_size: Número máximo de valores em cache (None = ilimitado)
+        negative_ttl: Validade (segundos) do registro de chaves ausentes (0 = desativado);
+            o registro é limitado a max_size chaves (ou 4096), descartando as mais antigas
+    """
+
+    ttl: float | None = None
+    max_size: int | None = None
+    negative_ttl: float = 0.0
+
+
+class CachedBackend:
+    """Envolve um backend aplicando uma CachePolicy própria."""
+
+    def __init__(self, backend: SecretBackend, policy: CachePolicy | None = None) -> None:
+        """Inicializa o wrapper.
+
+        Args:
+            backend: Backend de origem
+            policy: Política de cache (None = cache sem limites)
+        """
+        self.backend = backend
+        self.policy = policy or CachePolicy()
+        self.name = backend.name
+        self.is_secret = backend.is_secret
+        self._cache: SecretCache[str] = SecretCache(
+            ttl=self.policy.ttl, max_entries=self.policy.max_size
+        )
+        # Chave ausente -> instante de expiração, em ordem de inserção (= de expiração)
+        self._missing: dict[str, float] = {}
+
+    def _known_missing(self, key: str) -> bool:
+        expires = self._missing.get(key)
+        if expires is None:
+            return False
+        if time.monotonic() < expires:
+            return True
+        self._missing.pop(key, None)
+        return False
+
+    def _mark_missing(self, key: str) -> None:
+        if self.policy.negative_ttl <= 0:
+            return
+        missing = self._missing
+        now = time.monotonic()
+        missing.pop(key, None)
+        limit = self.policy.max_size or _MISSING_KEYS_LIMIT
+        while missing:
+            # A mais antiga é também a primeira a expirar (TTL único)
+            oldest, expires = next(iter(missing.items()))
+            if expires > now and len(missing) < limit:
+                break
+            missing.pop(oldest, None)
+        missing[key] = now + self.policy.negative_ttl
+
+    def get(self, key: str) -> str | None:
+        """Obtém a chave do cache ou do backend (uma leitura por chave)."""
+        if self._known_missing(key):
+            return None
+        value = self._cache.get_or_load(key, lambda: self.backend.get(key))
+        if value is None:
+            self._mark_missing(key)
+        return value
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Serve do cache e consulta o backend apenas pelas chaves restantes."""
+        result: dict[str, str] = {}
+        pending: list[str] = []
+        for key in keys:
+            value = self._cache.get(key)
+            if value is not None:
+                result[key] = value
+            elif not self._known_missing(key):
+                pending.append(key)
+
+        if pending:
+            found = self.backend.get_many(pending)
+            for key in pending:
+                value = found.get(key)
+                if value is None:
+                    self._mark_missing(key)
+                else:
+                    self._cache.set(key, value)
+                    result[key] = value
+        return result
+
+    def list_keys(self) -> set[str]:
+        """Lista as chaves do backend de origem (sem cache)."""
+        return self.backend.list_keys()
+
+    def stats(self) -> CacheStats:
+        """Retorna as estatísticas do cache do backend."""
+        return self._cache.stats()
+
+    def clear(self) -> None:
+        """Esvazia o cache positivo e negativo."""
+        self._cache.clear()
+        self._missing.clear()
+
+    def __repr__(self) -> str:
+        return f"CachedBackend({self.backend!r}, {self.policy!r})"
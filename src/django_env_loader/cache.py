@@ -0,0 +1,312 @@
+"""Cache de secrets seguro para threads e processos forkados.
+
+Leituras não adquirem lock (um ``dict.get`` sob o GIL é atômico); o
+preenchimento é serializado por chave, de forma que threads concorrentes
+pedindo o mesmo secret disparam uma única leitura de arquivo.
+
+Com ``max_entries`` o cache descarta a entrada usada há mais tempo (LRU, O(1)
+via ``OrderedDict``); com ``ttl`` as entradas expiram após o prazo. Os valores
+costumam ser ``str``, mas o cache também guarda o conteúdo binário dos secrets
+(``bytes`` e ``mmap``) com as mesmas políticas.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import time
+import weakref
+
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+__all__ = ["CacheStats", "SecretCache"]
+
+V = TypeVar("V")
+
+# Caches vivos, reinicializados no processo filho após os.fork()
+_live_caches: weakref.WeakSet[SecretCache[Any]] = weakref.WeakSet()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Estatísticas de um SecretCache (aproximadas sob concorrência).
+
+    Attributes:
+        hits: Consultas atendidas pelo cache
+        misses: Consultas sem valor válido em cache
+        evictions: Entradas descartadas pelo limite de tamanho
+        expirations: Entradas descartadas por TTL
+        size: Número atual de entradas
+        max_entries: Limite configurado (None = ilimitado)
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_entries: int | None
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração das consultas atendidas pelo cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SecretCache(Generic[V]):
+    """Cache de valores de secrets com preenchimento single-flight.
+
+    Exemplo:
+        >>> cache = SecretCache()
+        >>> cache.get_or_load("/run/secrets/API_KEY", lambda: "valor")
+        'valor'
+        >>> cache.get("/run/secrets/API_KEY")
+        'valor'
+    """
+
+    def __init__(
+        self,
+        *,
+        clear_on_fork: bool = False,
+        ttl: float | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        """Inicializa o cache.
+
+        Args:
+            clear_on_fork: Se o processo filho deve começar com o cache vazio
+            ttl: Validade (segundos) de cada entrada (None = sem expiração)
+            max_entries: Número máximo de entradas (None = ilimitado)
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries deve ser maior que zero")
+        self.clear_on_fork = clear_on_fork
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._data: dict[str, V] = self._new_data()
+        # Instante (monotonic) de expiração por chave, usado apenas com ttl. Como o
+        # TTL é o mesmo para todas, a ordem de inserção é também a de expiração
+        self._expires: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._inflight: dict[str, threading.Lock] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        _live_caches.add(self)
+
+    def _new_data(self) -> dict[str, V]:
+        # OrderedDict apenas quando há limite: move_to_end mantém a ordem LRU
+        return OrderedDict() if self.max_entries is not None else {}
+
+    def get(self, key: str) -> V | None:
+        """Retorna o valor em cache (sem lock) ou None."""
+        value = self._lookup(key)
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return value
+
+    def _lookup(self, key: str) -> V | None:
+        """Consulta sem contabilizar estatísticas de acerto/falha."""
+        data = self._data
+        value = data.get(key)
+        if value is None:
+            return None
+        if self.ttl is not None and self._is_expired(key):
+            if self.pop(key) is not None:
+                self._expirations += 1
+            return None
+        if self.max_entries is not None:
+            # KeyError: removida por outra thread entre o get e o move_to_end
+            with contextlib.suppress(KeyError):
+                data.move_to_end(key)  # type: ignore[attr-defined]
+        return value
+
+    def _is_expired(self, key: str) -> bool:
+        expires = self._expires.get(key)
+        return expires is not None and time.monotonic() >= expires
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._lookup(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def snapshot(self) -> dict[str, V]:
+        """Retorna uma cópia consistente do conteúdo do cache (sem expirados)."""
+        data = dict(self._data)
+        if self.ttl is None:
+            return data
+        return {key: value for key, value in data.items() if not self._is_expired(key)}
+
+    def set(self, key: str, value: V) -> None:
+        """Armazena um valor no cache."""
+        with self._lock:
+            self._store(key, value)
+
+    @property
+    def generation(self) -> int:
+        """Contador incrementado a cada ``clear()``."""
+        return self._generation
+
+    def update(self, values: Mapping[str, V], *, generation: int | None = None) -> bool:
+        """Armazena vários valores de uma vez.
+
+        Sem TTL nem limite de tamanho, os leitores (sem lock) passam a ver
+        todos os novos valores ao mesmo tempo: o dicionário é substituído.
+
+        Args:
+            values: Valores por chave
+            generation: Se informado, descarta os valores caso ``clear()`` tenha
+                ocorrido depois da leitura da geração
+
+        Returns:
+            True se os valores foram armazenados
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            if self.ttl is None and self.max_entries is None:
+                data = dict(self._data)
+                data.update(values)
+                self._data = data
+            else:
+                for key, value in values.items():
+                    self._store(key, value)
+        return True
+
+    def _store(self, key: str, value: V) -> None:
+        """Armazena aplicando TTL e limite de tamanho (chamar com o lock)."""
+        data = self._data
+        expires = self._expires
+        if self.ttl is not None:
+            self._purge_expired()
+        if self.max_entries is not None:
+            if key in data:
+                data.move_to_end(key)  # type: ignore[attr-defined]
+            else:
+                while len(data) >= self.max_entries:
+                    # Remove a entrada usada há mais tempo
+                    oldest, _ = data.popitem(last=False)  # type: ignore[call-arg]
+                    expires.pop(oldest, None)
+                    self._evictions += 1
+        data[key] = value
+        if self.ttl is not None:
+            # Reinsere no fim para manter _expires em ordem de expiração
+            expires.pop(key, None)
+            expires[key] = time.monotonic() + self.ttl
+
+    def _purge_expired(self) -> None:
+        """Remove as entradas já expiradas (chamar com o lock)."""
+        expires = self._expires
+        now = time.monotonic()
+        while expires:
+            key, deadline = next(iter(expires.items()))
+            if deadline > now:
+                break
+            del expires[key]
+            if self._data.pop(key, None) is not None:
+                self._expirations += 1
+
+    def stats(self) -> CacheStats:
+        """Retorna as estatísticas acumuladas do cache."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            size=len(self._data),
+            max_entries=self.max_entries,
+        )
+
+    def reset_stats(self) -> None:
+        """Zera os contadores de estatísticas."""
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def pop(self, key: str) -> V | None:
+        """Remove e retorna um valor do cache."""
+        with self._lock:
+            self._expires.pop(key, None)
+            return self._data.pop(key, None)
+
+    def get_or_load(self, key: str, loader: Callable[[], V | None]) -> V | None:
+        """Retorna o valor em cache ou o carrega uma única vez.
+
+        Chamadas concorrentes para a mesma chave aguardam a primeira leitura em
+        vez de repeti-la. Valores None não são armazenados.
+
+        Args:
+            key: Chave do cache
+            loader: Função que lê o valor da origem
+
+        Returns:
+            Valor em cache, valor carregado ou None
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        return self.fill(key, loader)
+
+    def fill(self, key: str, loader: Callable[[], V | None]) -> V | None:
+        """Carrega o valor após uma falha de ``get``, com uma leitura por chave.
+
+        Igual a ``get_or_load`` sem a consulta inicial, para quem já chamou
+        ``get`` (a falha não é contabilizada duas vezes nas estatísticas).
+        """
+        with self._lock:
+            key_lock = self._inflight.get(key)
+            if key_lock is None:
+                key_lock = self._inflight[key] = threading.Lock()
+
+        try:
+            with key_lock:
+                # Outra thread pode ter preenchido enquanto aguardávamos
+                value = self._lookup(key)
+                if value is not None:
+                    return value
+
+                generation = self._generation
+                value = loader()
+                if value is not None:
+                    with self._lock:
+                        # Descarta a leitura se clear() ocorreu durante o carregamento
+                        if generation == self._generation:
+                            self._store(key, value)
+                return value
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is key_lock:
+                    del self._inflight[key]
+
+    def clear(self) -> None:
+        """Esvazia o cache de forma atômica para os leitores."""
+        with self._lock:
+            self._data = self._new_data()
+            self._expires = {}
+            self._generation += 1
+
+    def _after_fork_in_child(self) -> None:
+        """Recria os locks (possivelmente presos no fork) e limpa se configurado."""
+        self._lock = threading.Lock()
+        self._inflight = {}
+        if self.clear_on_fork:
+            self._data = self._new_data()
+            self._expires = {}
+            self._generation += 1
+
+
+def _reinit_caches_after_fork() -> None:
+    for cache in list(_live_caches):
+        cache._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_caches_after_fork)
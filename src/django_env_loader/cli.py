@@ -0,0 +1,353 @@
+"""CLI ``django-env-loader``: resolve, compara, pré-compila e mede a configuração.
+
+Permite tirar a resolução da configuração do boot dos workers e levá-la para o
+build da imagem ou para o entrypoint do container.
+
+Exemplo:
+    $ django-env-loader resolve myproject.env:Settings --env-file .env
+    $ django-env-loader diff .env.staging .env.production
+    $ django-env-loader compile .env --shared /dev/shm/myapp-config
+    $ django-env-loader bench DATABASE_URL SECRET_KEY --secrets-dir /run/secrets
+
+Também disponível como ``python -m django_env_loader``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import statistics
+import sys
+import time
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from django_env_loader.exceptions import EnvFileSyntaxError, EnvLoaderError, SchemaError
+
+if TYPE_CHECKING:
+    from django_env_loader.loader import EnvLoader
+    from django_env_loader.schema import SchemaLike
+
+__all__ = ["main"]
+
+# Valor exibido no lugar de secrets (use --show-secrets para o valor real)
+REDACTED = "***"
+
+
+# ============================================================================
+# Auxiliares
+# ============================================================================
+
+
+def import_object(path: str) -> Any:
+    """Importa um objeto por caminho ``pacote.modulo:Objeto`` ou ``pacote.modulo.Objeto``.
+
+    Raises:
+        ImportError: Se o módulo ou o atributo não existir
+    """
+    module_name, sep, attribute = path.partition(":")
+    if not sep:
+        module_name, _, attribute = path.rpartition(".")
+    if not module_name or not attribute:
+        raise ImportError(f"Caminho inválido (esperado modulo:Objeto): {path!r}")
+    # Permite importar módulos do projeto a partir do diretório atual
+    if "" not in sys.path:
+        sys.path.insert(0, "")
+    module = importlib.import_module(module_name)
+    try:
+        return getattr(module, attribute)
+    except AttributeError as e:
+        raise ImportError(f"{module_name!r} não define {attribute!r}") from e
+
+
+def _make_loader(args: argparse.Namespace, env_file: Path | None = None) -> EnvLoader:
+    from django_env_loader.loader import EnvConfig, EnvLoader
+
+    env_file = env_file or args.env_file
+    if env_file is None and Path(".env").is_file():
+        env_file = Path(".env")
+    return EnvLoader(
+        EnvConfig(
+            env_file=env_file,
+            secrets_dir=args.secrets_dir,
+            prefix=args.prefix,
+            warn_on_missing=False,
+        )
+    )
+
+
+def _secret_names(secrets_dir: Path) -> list[str]:
+    from django_env_loader.shared import _list_secret_names
+
+    return _list_secret_names(secrets_dir)
+
+
+def _read_values(path: Path, encoding: str) -> dict[str, str]:
+    """Lê um conjunto de valores: diretório de secrets ou arquivo .env.
+
+    Secrets binários são decodificados com ``surrogateescape``: bytes inválidos
+    continuam distintos na comparação (use ``_display`` para exibi-los).
+    """
+    if path.is_dir():
+        return {
+            name: (path / name).read_bytes().decode(encoding, "surrogateescape").strip()
+            for name in _secret_names(path)
+        }
+
+    from django_env_loader.envfile import read_env_file
+
+    try:
+        values = read_env_file(path, encoding=encoding)
+    except EnvFileSyntaxError:
+        from dotenv import dotenv_values
+
+        values = dotenv_values(path, encoding=encoding)
+    return {key: value or "" for key, value in values.items()}
+
+
+def _display(value: str, encoding: str, *, quoted: bool = False) -> str:
+    """Formata um valor para exibição; valores binários aparecem escapados (``\\xff``).
+
+    Args:
+        value: Valor lido por ``_read_values``
+        encoding: Encoding usado na leitura
+        quoted: Se deve exibir o repr (``'texto'`` ou ``b'\\xff'`` para binários)
+    """
+    try:
+        value.encode(encoding)
+    except UnicodeEncodeError:
+        raw = value.encode(encoding, "surrogateescape")
+        return repr(raw) if quoted else raw.decode(encoding, "backslashreplace")
+    return repr(value) if quoted else value
+
+
+def _schema_keys(schema: SchemaLike) -> list[str]:
+    from django_env_loader.schema import _collect_fields
+
+    return [field.env or name for name, field in _collect_fields(schema).items()]
+
+
+def _print_json(data: Any, indent: int | None) -> None:
+    json.dump(data, sys.stdout, indent=indent, ensure_ascii=False, sort_keys=True, default=str)
+    sys.stdout.write("\n")
+
+
+# ============================================================================
+# Subcomandos
+# ============================================================================
+
+
+def cmd_resolve(args: argparse.Namespace) -> int:
+    """Resolve o schema (ou todas as variáveis com o prefixo) e imprime JSON.
+
+    Credenciais também chegam pelo ambiente ou pelo .env (ex: ``DATABASE_URL``)
+    e não há como distingui-las: todos os valores são ocultos, exceto os
+    liberados com ``--show`` ou com ``--show-secrets``.
+    """
+    loader = _make_loader(args)
+
+    if args.schema is None:
+        values: dict[str, Any] = loader.get_all()
+        values.update(loader.get_many(_secret_names(loader.config.secrets_dir)))
+    else:
+        from django_env_loader.schema import resolve_schema
+
+        try:
+            values = resolve_schema(loader, import_object(args.schema)).as_dict()
+        except SchemaError as e:
+            for error in e.errors:
+                print(f"erro: {error}", file=sys.stderr)
+            return 1
+
+    if not args.show_secrets:
+        shown = set(args.show or ())
+        values = {key: value if key in shown else REDACTED for key, value in values.items()}
+    _print_json(values, args.indent)
+    return 0
+
+
+def cmd_diff(args: argparse.Namespace) -> int:
+    """Compara dois conjuntos (.env ou diretório de secrets); retorna 1 se diferirem."""
+    values = []
+    for path in (args.old, args.new):
+        try:
+            values.append(_read_values(path, args.encoding))
+        except UnicodeDecodeError as e:
+            print(f"erro: {path} não está em {args.encoding}: {e.reason}", file=sys.stderr)
+            return 2
+    old, new = values
+
+    def show(value: str, quoted: bool = False) -> str:
+        return _display(value, args.encoding, quoted=quoted)
+
+    lines: list[str] = []
+    for key in sorted(old.keys() | new.keys()):
+        if key not in new:
+            lines.append(f"- {key}" + (f"={show(old[key])}" if args.show_values else ""))
+        elif key not in old:
+            lines.append(f"+ {key}" + (f"={show(new[key])}" if args.show_values else ""))
+        elif old[key] != new[key]:
+            detail = (
+                f": {show(old[key], True)} -> {show(new[key], True)}" if args.show_values else ""
+            )
+            lines.append(f"~ {key}{detail}")
+
+    for line in lines:
+        print(line)
+    return 1 if lines else 0
+
+
+def cmd_compile(args: argparse.Namespace) -> int:
+    """Gera os snapshots do .env e, opcionalmente, publica a configuração resolvida."""
+    from django_env_loader.snapshot import compile_snapshot, snapshot_path
+
+    status = 0
+    for env_path in args.env_files:
+        try:
+            values = compile_snapshot(env_path, encoding=args.encoding)
+        except (OSError, UnicodeDecodeError, EnvFileSyntaxError) as e:
+            print(f"{env_path}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        print(f"{snapshot_path(env_path)}: {len(values)} variáveis")
+
+    if args.shared is not None and status == 0:
+        from django_env_loader.shared import publish
+
+        loader = _make_loader(args, args.env_files[0] if args.env_files else None)
+        try:
+            target = publish(loader, args.shared, keys=args.keys)
+        except OSError as e:
+            print(f"Erro ao publicar: {e}", file=sys.stderr)
+            return 1
+        print(target)
+    return status
+
+
+def _time_key(loader: EnvLoader, key: str, repeat: int) -> dict[str, Any]:
+    """Mede a primeira resolução (fria) e as seguintes (quentes) de uma chave."""
+    started = time.perf_counter_ns()
+    found = bool(loader.get(key, default=""))
+    cold = time.perf_counter_ns() - started
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        loader.get(key, default="")
+        samples.append(time.perf_counter_ns() - started)
+    return {
+        "key": key,
+        "found": found,
+        "cold_us": cold / 1000,
+        "warm_us": statistics.median(samples) / 1000 if samples else 0.0,
+    }
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    """Mede o tempo de resolução de cada chave por ``EnvLoader.get``."""
+    loader = _make_loader(args)
+    keys: Iterable[str]
+    if args.keys:
+        keys = args.keys
+    elif args.schema is not None:
+        keys = _schema_keys(import_object(args.schema))
+    else:
+        size = len(loader.config.prefix)
+        keys = sorted(
+            {key[size:] for key in loader.env_view()}
+            | set(_secret_names(loader.config.secrets_dir))
+        )
+
+    results = sorted(
+        (_time_key(loader, key, args.repeat) for key in dict.fromkeys(keys)),
+        key=lambda result: result["cold_us"],
+        reverse=True,
+    )
+
+    if args.json:
+        _print_json(results, 2)
+        return 0
+    print(f"{'chave':<40} {'fria':>12} {'quente':>12}")
+    for result in results:
+        missing = "" if result["found"] else "  (ausente)"
+        print(
+            f"{result['key']:<40} {result['cold_us']:>9.1f} µs {result['warm_us']:>9.2f} µs"
+            f"{missing}"
+        )
+    return 0
+
+
+# ============================================================================
+# Entrada
+# ============================================================================
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Monta o parser da CLI."""
+    parser = argparse.ArgumentParser(
+        prog="django-env-loader", description="Resolução de variáveis de ambiente e secrets"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    loader_options = argparse.ArgumentParser(add_help=False)
+    loader_options.add_argument("--env-file", type=Path, help="Arquivo .env (padrão: ./.env)")
+    loader_options.add_argument("--secrets-dir", type=Path, default=Path("/run/secrets"))
+    loader_options.add_argument("--prefix", default="", help="Prefixo das variáveis")
+
+    resolve = subparsers.add_parser(
+        "resolve", parents=[loader_options], help="Resolve a configuração e imprime JSON"
+    )
+    resolve.add_argument("schema", nargs="?", help="Schema (modulo:Classe); padrão: tudo")
+    resolve.add_argument("--show-secrets", action="store_true", help="Exibe todos os valores")
+    resolve.add_argument(
+        "--show", action="append", metavar="KEY", help="Exibe o valor desta chave (repetível)"
+    )
+    resolve.add_argument("--indent", type=int, default=2, help="Indentação do JSON")
+    resolve.set_defaults(handler=cmd_resolve)
+
+    diff = subparsers.add_parser("diff", help="Compara dois .env ou diretórios de secrets")
+    diff.add_argument("old", type=Path)
+    diff.add_argument("new", type=Path)
+    diff.add_argument("--show-values", action="store_true", help="Exibe os valores")
+    diff.add_argument("--encoding", default="utf-8")
+    diff.set_defaults(handler=cmd_diff)
+
+    compile_ = subparsers.add_parser(
+        "compile", parents=[loader_options], help="Pré-compila o .env (e publica para workers)"
+    )
+    compile_.add_argument("env_files", nargs="*", type=Path, default=[Path(".env")])
+    compile_.add_argument("--encoding", default="utf-8")
+    compile_.add_argument(
+        "--shared", type=Path, help="Publica a configuração resolvida (shared_config)"
+    )
+    compile_.add_argument("--key", action="append", dest="keys", help="Secret publicado")
+    compile_.set_defaults(handler=cmd_compile)
+
+    bench = subparsers.add_parser(
+        "bench", parents=[loader_options], help="Mede a resolução de cada chave"
+    )
+    bench.add_argument("keys", nargs="*", help="Chaves (padrão: prefixo + secrets)")
+    bench.add_argument("--schema", help="Mede as chaves de um schema (modulo:Classe)")
+    bench.add_argument("--repeat", type=int, default=100, help="Leituras quentes por chave")
+    bench.add_argument("--json", action="store_true", help="Saída em JSON")
+    bench.set_defaults(handler=cmd_bench)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Ponto de entrada do script ``django-env-loader``."""
+    args = build_parser().parse_args(argv)
+    try:
+        status: int = args.handler(args)
+    except (ImportError, OSError, EnvLoaderError) as e:
+        print(f"erro: {e}", file=sys.stderr)
+        return 2
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+"""App Django que valida e aquece a configuração no startup.
+
+Uso (settings.py):
+    INSTALLED_APPS = [
+        ...,
+        "django_env_loader.contrib",
+    ]
+
+    ENV_LOADER = {
+        "SCHEMA": "myproject.env.Settings",  # EnvSchema resolvido no startup
+        "LOADER": "myproject.settings.env",  # default: django_env_loader.env_loader
+        "PREFETCH": True,  # lê todos os secrets em paralelo
+        "SLOW_SECONDS": 0.1,  # chaves mais lentas viram aviso no system check
+        "FAIL_FAST": False,  # levanta ImproperlyConfigured em ready()
+    }
+
+No ``AppConfig.ready()`` a configuração declarada é resolvida em uma passada e
+os caches são aquecidos antes da primeira requisição; o tempo de cada chave vai
+para o log. Erros e chaves lentas aparecem em ``manage.py check``.
+
+Importar este pacote não importa o Django: ``warm_up`` pode ser usado fora dele.
+"""
+
+from django_env_loader.contrib.startup import StartupReport, warm_up
+
+__all__ = ["StartupReport", "warm_up"]
@@ -0,0 +1,67 @@
+"""AppConfig do django_env_loader.contrib."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+from django_env_loader.contrib.startup import StartupReport, warm_up
+from django_env_loader.exceptions import SchemaError
+
+# Valores usados quando ENV_LOADER não define a opção
+DEFAULTS: dict[str, Any] = {
+    "SCHEMA": None,
+    "LOADER": "django_env_loader.env_loader",
+    "PREFETCH": True,
+    "MAX_WORKERS": 8,
+    "SLOW_SECONDS": 0.1,
+    "FAIL_FAST": False,
+}
+
+
+def get_options() -> dict[str, Any]:
+    """Retorna as opções de ``settings.ENV_LOADER`` completadas com os defaults."""
+    options = getattr(settings, "ENV_LOADER", None) or {}
+    unknown = set(options) - set(DEFAULTS)
+    if unknown:
+        raise ImproperlyConfigured(f"Opções desconhecidas em ENV_LOADER: {sorted(unknown)}")
+    return {**DEFAULTS, **options}
+
+
+def _resolve(value: Any) -> Any:
+    """Importa caminhos pontilhados; objetos são usados como estão."""
+    if isinstance(value, str):
+        try:
+            return import_string(value)
+        except ImportError as e:
+            raise ImproperlyConfigured(f"ENV_LOADER: não foi possível importar {value!r}") from e
+    return value
+
+
+class EnvLoaderConfig(AppConfig):
+    """Resolve e aquece a configuração no startup da aplicação."""
+
+    name = "django_env_loader.contrib"
+    label = "django_env_loader"
+    verbose_name = "Django Env Loader"
+
+    report: StartupReport | None = None
+
+    def ready(self) -> None:
+        """Resolve o schema, pré-carrega os secrets e registra o system check."""
+        from django_env_loader.contrib import checks  # noqa: F401 (registra os checks)
+
+        options = get_options()
+        self.report = warm_up(
+            _resolve(options["LOADER"]),
+            _resolve(options["SCHEMA"]),
+            prefetch=options["PREFETCH"],
+            max_workers=options["MAX_WORKERS"],
+            slow_seconds=options["SLOW_SECONDS"],
+        )
+        if options["FAIL_FAST"] and self.report.errors:
+            raise ImproperlyConfigured(str(SchemaError(list(self.report.errors))))
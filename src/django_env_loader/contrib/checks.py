@@ -0,0 +1,36 @@
+"""System checks do django_env_loader.contrib (``manage.py check``)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.apps import apps
+from django.core.checks import CheckMessage, Error, Warning, register
+
+from django_env_loader.contrib.apps import get_options
+
+
+@register("django_env_loader")
+def check_env_config(app_configs: Any = None, **kwargs: Any) -> list[CheckMessage]:
+    """Reporta campos ausentes/inválidos e chaves lentas medidos no startup."""
+    report = apps.get_app_config("django_env_loader").report
+    if report is None:
+        return []
+
+    messages: list[CheckMessage] = [
+        Error(
+            str(error),
+            hint="Defina a variável de ambiente ou o Docker secret correspondente.",
+            id="django_env_loader.E001",
+        )
+        for error in report.errors
+    ]
+    for label, seconds in report.slow(get_options()["SLOW_SECONDS"]):
+        messages.append(
+            Warning(
+                f"Resolução de '{label}' levou {seconds * 1000:.1f} ms no startup",
+                hint="Verifique a latência do mount de secrets (ex: NFS).",
+                id="django_env_loader.W001",
+            )
+        )
+    return messages
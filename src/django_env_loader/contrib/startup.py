@@ -0,0 +1,131 @@
+"""Resolução e aquecimento da configuração no startup (sem dependência do Django).
+
+``warm_up`` lê todos os secrets em paralelo, resolve o schema declarado em uma
+única passada e registra no log o tempo de cada chave, de forma que um mount de
+secrets lento apareça no deploy e não na primeira requisição.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from django_env_loader.exceptions import EnvLoaderError, SchemaError
+
+if TYPE_CHECKING:
+    from django_env_loader.loader import EnvLoader
+    from django_env_loader.schema import ResolvedSettings, SchemaLike
+
+__all__ = ["StartupReport", "warm_up"]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StartupReport:
+    """Resultado da resolução da configuração no startup.
+
+    Attributes:
+        seconds: Duração total
+        timings: Tempo de resolução de cada campo do schema
+        secret_timings: Tempo de leitura de cada secret pré-carregado
+        errors: Campos ausentes ou inválidos
+        settings: Valores resolvidos (None se o schema falhou ou não foi informado)
+    """
+
+    seconds: float
+    timings: Mapping[str, float] = field(default_factory=dict)
+    secret_timings: Mapping[str, float] = field(default_factory=dict)
+    errors: tuple[EnvLoaderError, ...] = ()
+    settings: ResolvedSettings | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Se todos os campos foram resolvidos."""
+        return not self.errors
+
+    def breakdown(self) -> list[tuple[str, float]]:
+        """Retorna (rótulo, segundos) de campos e secrets, do mais lento ao mais rápido."""
+        entries = [(name, seconds) for name, seconds in self.timings.items()]
+        entries.extend((f"secret:{name}", seconds) for name, seconds in self.secret_timings.items())
+        return sorted(entries, key=lambda entry: entry[1], reverse=True)
+
+    def slow(self, threshold: float) -> list[tuple[str, float]]:
+        """Retorna as entradas que levaram ``threshold`` segundos ou mais."""
+        return [entry for entry in self.breakdown() if entry[1] >= threshold]
+
+    def format(self, limit: int | None = None) -> str:
+        """Formata o relatório para o log.
+
+        Args:
+            limit: Máximo de entradas listadas (None = todas)
+        """
+        lines = [
+            f"Configuração resolvida em {self.seconds * 1000:.1f} ms "
+            f"({len(self.timings)} campos, {len(self.secret_timings)} secrets, "
+            f"{len(self.errors)} erros)"
+        ]
+        entries = self.breakdown()
+        for label, seconds in entries if limit is None else entries[:limit]:
+            lines.append(f"  {label:<40} {seconds * 1000:>9.3f} ms")
+        return "\n".join(lines)
+
+
+def warm_up(
+    loader: EnvLoader,
+    schema: SchemaLike | None = None,
+    *,
+    prefetch: bool = True,
+    max_workers: int = 8,
+    slow_seconds: float = 0.1,
+) -> StartupReport:
+    """Aquece os caches do loader e resolve o schema, medindo cada chave.
+
+    Args:
+        loader: Loader usado pela aplicação
+        schema: Schema declarado (None = apenas pré-carrega os secrets)
+        prefetch: Se deve ler todos os secrets de secrets_dir em paralelo
+        max_workers: Máximo de leituras simultâneas na pré-carga
+        slow_seconds: Entradas a partir desta duração são registradas como aviso
+
+    Returns:
+        StartupReport com tempos por chave e erros de resolução
+    """
+    started = time.perf_counter()
+
+    secret_timings: dict[str, float] = {}
+    if prefetch:
+        secret_timings.update(loader.prefetch_secrets(max_workers=max_workers).timings)
+
+    # Monta o índice das variáveis com o prefixo (reaproveitado com observe_environ)
+    len(loader.env_view())
+
+    timings: dict[str, float] = {}
+    errors: tuple[EnvLoaderError, ...] = ()
+    settings = None
+    if schema is not None:
+        from django_env_loader.schema import resolve_schema
+
+        try:
+            settings = resolve_schema(loader, schema, timings=timings)
+        except SchemaError as e:
+            errors = tuple(e.errors)
+
+    report = StartupReport(
+        seconds=time.perf_counter() - started,
+        timings=timings,
+        secret_timings=secret_timings,
+        errors=errors,
+        settings=settings,
+    )
+
+    logger.info(report.format())
+    for label, seconds in report.slow(slow_seconds):
+        logger.warning(f"Resolução lenta de '{label}': {seconds * 1000:.1f} ms")
+    for error in errors:
+        logger.error(f"Configuração inválida: {error}")
+    return report
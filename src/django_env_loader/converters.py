@@ -0,0 +1,310 @@
+"""Conversores de tipo para valores de ambiente.
+
+``TypeConverter`` mantém a API de conversão avulsa. ``compile_converter``
+transforma a especificação de um getter (tipo, delimitador, vocabulário de
+booleanos) em uma função especializada, criada uma única vez, que faz uma
+passada sobre a entrada e guarda o resultado por string de entrada.
+
+Exemplo:
+    >>> to_bool = compile_converter(bool, vocabulary=BoolVocabulary.extended(true=["ativo"]))
+    >>> to_bool("Ativo")
+    True
+    >>> compile_converter(list, delimiter=";")("a; b;")
+    ['a', 'b']
+"""
+
+from __future__ import annotations
+
+import functools
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, NoReturn
+
+from django_env_loader.exceptions import ValidationError
+
+__all__ = [
+    "DEFAULT_BOOL_VOCABULARY",
+    "BoolVocabulary",
+    "FrozenDict",
+    "FrozenList",
+    "TypeConverter",
+    "compile_converter",
+]
+
+# Tamanho padrão do cache de resultados de cada conversor compilado
+_RESULT_CACHE_SIZE = 256
+
+
+# ============================================================================
+# Vocabulário de booleanos
+# ============================================================================
+
+
+def _normalize_words(words: Iterable[str]) -> frozenset[str]:
+    return frozenset(word.strip().lower() for word in words)
+
+
+@dataclass(frozen=True)
+class BoolVocabulary:
+    """Palavras aceitas como verdadeiro/falso (comparação sem caixa e espaços).
+
+    Attributes:
+        true: Palavras que representam True
+        false: Palavras que representam False
+    """
+
+    true: frozenset[str]
+    false: frozenset[str]
+
+    def __post_init__(self) -> None:
+        """Normaliza as palavras e rejeita vocabulários ambíguos."""
+        true = _normalize_words(self.true)
+        false = _normalize_words(self.false)
+        overlap = true & false
+        if overlap:
+            raise ValueError(f"Palavras em true e false ao mesmo tempo: {sorted(overlap)}")
+        object.__setattr__(self, "true", true)
+        object.__setattr__(self, "false", false)
+
+    @classmethod
+    def extended(cls, *, true: Iterable[str] = (), false: Iterable[str] = ()) -> BoolVocabulary:
+        """Retorna o vocabulário padrão acrescido das palavras informadas."""
+        return cls(
+            DEFAULT_BOOL_VOCABULARY.true | _normalize_words(true),
+            DEFAULT_BOOL_VOCABULARY.false | _normalize_words(false),
+        )
+
+    def table(self) -> dict[str, bool]:
+        """Tabela de consulta palavra -> valor."""
+        return {**dict.fromkeys(self.false, False), **dict.fromkeys(self.true, True)}
+
+
+DEFAULT_BOOL_VOCABULARY = BoolVocabulary(
+    true=frozenset({"true", "1", "yes", "y", "on", "t", "sim", "s"}),
+    false=frozenset({"false", "0", "no", "n", "off", "f", "não", "nao", ""}),
+)
+
+_DEFAULT_BOOL_TABLE = DEFAULT_BOOL_VOCABULARY.table()
+
+
+# ============================================================================
+# Conversores avulsos
+# ============================================================================
+
+
+def _split_list(value: str, delimiter: str) -> list[str]:
+    """Divide e remove espaços em uma única passada (itens vazios descartados)."""
+    return [stripped for item in value.split(delimiter) if (stripped := item.strip())]
+
+
+def _split_dict(value: str, delimiter: str) -> dict[str, str]:
+    """Converte 'k=v,k2=v2' em uma única passada."""
+    result: dict[str, str] = {}
+    for item in value.split(delimiter):
+        key, sep, item_value = item.partition("=")
+        key = key.strip()
+        if key or sep:
+            result[key] = item_value.strip()
+    return result
+
+
+class TypeConverter:
+    """Conversor type-safe de valores de ambiente."""
+
+    @staticmethod
+    def to_bool(value: str | bool) -> bool:
+        """Converte string para boolean de forma segura."""
+        if isinstance(value, bool):
+            return value
+
+        if not isinstance(value, str):
+            raise ValidationError("boolean", value, "Tipo inválido, esperado str ou bool")
+
+        result = _DEFAULT_BOOL_TABLE.get(value)
+        if result is None:
+            result = _DEFAULT_BOOL_TABLE.get(value.strip().lower())
+            if result is None:
+                raise ValidationError("boolean", value, f"Valor inválido para bool: '{value}'")
+        return result
+
+    @staticmethod
+    def to_int(value: str | int) -> int:
+        """Converte string para inteiro."""
+        if isinstance(value, int):
+            return value
+        try:
+            return int(str(value).strip())
+        except (ValueError, TypeError) as e:
+            raise ValidationError("int", value, str(e)) from e
+
+    @staticmethod
+    def to_float(value: str | float) -> float:
+        """Converte string para float."""
+        if isinstance(value, float):
+            return value
+        try:
+            return float(str(value).strip())
+        except (ValueError, TypeError) as e:
+            raise ValidationError("float", value, str(e)) from e
+
+    @staticmethod
+    def to_list(value: str | list[str], delimiter: str = ",") -> list[str]:
+        """Converte string delimitada em lista."""
+        if isinstance(value, list):
+            return value
+        if not value:
+            return []
+        return _split_list(str(value), delimiter)
+
+    @staticmethod
+    def to_dict(value: str | dict[str, str], delimiter: str = ",") -> dict[str, str]:
+        """Converte string 'key=value,key2=value2' em dicionário."""
+        if isinstance(value, dict):
+            return value
+        if not value:
+            return {}
+        return _split_dict(str(value), delimiter)
+
+
+class FrozenList(list[str]):
+    """Lista imutável devolvida pelos getters memoizados."""
+
+    __slots__ = ()
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("FrozenList é imutável; use list(valor) para obter uma cópia")
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+    # O __reduce_ex__ herdado de list recria o objeto via append (bloqueado)
+    def __reduce__(self) -> tuple[type[FrozenList], tuple[list[str]]]:
+        return type(self), (list(self),)
+
+    def __copy__(self) -> FrozenList:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> FrozenList:
+        return self
+
+
+class FrozenDict(dict[str, str]):
+    """Dicionário imutável devolvido pelos getters memoizados."""
+
+    __slots__ = ()
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("FrozenDict é imutável; use dict(valor) para obter uma cópia")
+
+    pop = popitem = clear = update = setdefault = _immutable
+    __setitem__ = __delitem__ = __ior__ = _immutable
+
+    # O __reduce_ex__ herdado de dict recria o objeto via __setitem__ (bloqueado)
+    def __reduce__(self) -> tuple[type[FrozenDict], tuple[dict[str, str]]]:
+        return type(self), (dict(self),)
+
+    def __copy__(self) -> FrozenDict:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> FrozenDict:
+        return self
+
+
+# ============================================================================
+# Conversores compilados
+# ============================================================================
+
+
+def _with_result_cache(convert: Callable[[str], Any], cache_size: int) -> Callable[[str], Any]:
+    """Envolve o conversor com um cache de resultados por string de entrada.
+
+    Erros de conversão não são armazenados; quando o cache enche, ele é
+    esvaziado (entradas de ambiente são poucas e repetitivas).
+    """
+    cache: dict[str, Any] = {}
+
+    def converter(raw: str) -> Any:
+        try:
+            return cache[raw]
+        except KeyError:
+            pass
+        value = convert(raw)
+        if len(cache) >= cache_size:
+            cache.clear()
+        cache[raw] = value
+        return value
+
+    return converter
+
+
+def _compile_bool(vocabulary: BoolVocabulary, cache_size: int) -> Callable[[str], bool]:
+    # A própria tabela serve de cache: grafias já vistas ("TRUE", " on") são
+    # acrescentadas a ela e resolvidas com uma única consulta
+    table = vocabulary.table()
+    limit = len(table) + cache_size
+
+    def to_bool(raw: str) -> bool:
+        result = table.get(raw)
+        if result is not None:
+            return result
+        result = table.get(raw.strip().lower())
+        if result is None:
+            raise ValidationError("boolean", raw, f"Valor inválido para bool: '{raw}'")
+        if len(table) < limit:
+            table[raw] = result
+        return result
+
+    return to_bool
+
+
+def _compile_number(cast: type[Any], name: str) -> Callable[[str], Any]:
+    def to_number(raw: str) -> Any:
+        try:
+            # int()/float() já ignoram espaços nas pontas
+            return cast(raw)
+        except (ValueError, TypeError) as e:
+            raise ValidationError(name, raw, str(e)) from e
+
+    return to_number
+
+
+@functools.lru_cache(maxsize=128)
+def compile_converter(
+    cast: type,
+    *,
+    delimiter: str = ",",
+    vocabulary: BoolVocabulary | None = None,
+    cache_size: int = _RESULT_CACHE_SIZE,
+) -> Callable[[str], Any]:
+    """Compila a especificação de um getter em um conversor especializado.
+
+    Especificações iguais retornam o mesmo conversor (e o mesmo cache de
+    resultados). Listas e dicionários são devolvidos como FrozenList/FrozenDict,
+    que podem ser compartilhados com segurança entre chamadas.
+
+    Args:
+        cast: Tipo de destino (str, bool, int, float, list ou dict)
+        delimiter: Delimitador para list/dict
+        vocabulary: Palavras aceitas para bool (None = DEFAULT_BOOL_VOCABULARY)
+        cache_size: Máximo de resultados guardados por string de entrada
+
+    Returns:
+        Função ``raw -> valor convertido`` (levanta ValidationError)
+
+    Raises:
+        TypeError: Se o tipo não for suportado
+    """
+    if cast is str:
+        return str
+    if cast is bool:
+        return _compile_bool(vocabulary or DEFAULT_BOOL_VOCABULARY, cache_size)
+    if cast is int:
+        return _with_result_cache(_compile_number(int, "int"), cache_size)
+    if cast is float:
+        return _with_result_cache(_compile_number(float, "float"), cache_size)
+    if cast is list:
+        return _with_result_cache(lambda raw: FrozenList(_split_list(raw, delimiter)), cache_size)
+    if cast is dict:
+        return _with_result_cache(lambda raw: FrozenDict(_split_dict(raw, delimiter)), cache_size)
+    raise TypeError(f"Tipo não suportado: {cast!r}")
@@ -0,0 +1,153 @@
+"""Parser nativo de arquivos .env.
+
+Cobre as formas comuns (``KEY=VALUE``, valores entre aspas simples ou duplas,
+prefixo ``export`` e comentários) com a mesma semântica do python-dotenv, lendo
+o arquivo uma única vez. Interpolação (``${VAR}``, inclusive entre aspas
+simples, que o python-dotenv também interpola), valores multilinha e demais
+sintaxes não suportadas levantam ``EnvFileSyntaxError`` para que o chamador use
+o python-dotenv como fallback.
+"""
+
+from __future__ import annotations
+
+import re
+
+from pathlib import Path
+
+from django_env_loader.exceptions import EnvFileSyntaxError
+
+__all__ = ["parse_env", "read_env_file"]
+
+_INLINE_COMMENT = re.compile(r"\s+#.*")
+_DOUBLE_QUOTE_ESCAPES = {
+    "\\": "\\",
+    "'": "'",
+    '"': '"',
+    "a": "\a",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+}
+_SINGLE_QUOTE_ESCAPES = {"\\": "\\", "'": "'"}
+_HSPACE = " \t\f\v"
+_KEY_TERMINATORS = frozenset("=#") | frozenset(" \t\f\v")
+
+
+def _read_quoted(rest: str, quote: str, escapes: dict[str, str], lineno: int) -> tuple[str, str]:
+    """Lê um valor entre aspas; retorna (valor decodificado, restante da linha)."""
+    chunks: list[str] = []
+    start = 1
+    i = 1
+    size = len(rest)
+    while i < size:
+        char = rest[i]
+        if char == "\\" and i + 1 < size:
+            escaped = rest[i + 1]
+            replacement = escapes.get(escaped)
+            if replacement is not None:
+                chunks.append(rest[start:i])
+                chunks.append(replacement)
+                start = i + 2
+            i += 2
+            continue
+        if char == quote:
+            chunks.append(rest[start:i])
+            return "".join(chunks), rest[i + 1 :]
+        i += 1
+    # Aspas não fechadas na linha: valor multilinha
+    raise EnvFileSyntaxError(lineno, "valor multilinha")
+
+
+def _check_trailing(rest: str, lineno: int) -> None:
+    """Garante que após o valor só há espaços ou comentário."""
+    stripped = rest.lstrip(_HSPACE)
+    if stripped and not stripped.startswith("#"):
+        raise EnvFileSyntaxError(lineno, "conteúdo inesperado após o valor")
+
+
+def parse_env(text: str) -> dict[str, str | None]:
+    """Faz o parse do conteúdo de um .env.
+
+    Args:
+        text: Conteúdo do arquivo
+
+    Returns:
+        Dicionário {chave: valor}; chaves sem ``=`` recebem None
+
+    Raises:
+        EnvFileSyntaxError: Se encontrar sintaxe que exige o python-dotenv
+    """
+    if text.startswith("\ufeff"):
+        text = text[1:]
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    result: dict[str, str | None] = {}
+    for lineno, raw_line in enumerate(text.split("\n"), start=1):
+        line = raw_line.lstrip()
+        if not line or line[0] == "#":
+            continue
+
+        if line.startswith("export") and len(line) > 6 and line[6] in _HSPACE:
+            line = line[7:].lstrip(_HSPACE)
+
+        if line[0] == "'":
+            raise EnvFileSyntaxError(lineno, "chave entre aspas")
+
+        # Chave: até '=', '#' ou espaço
+        end = 0
+        size = len(line)
+        while end < size and line[end] not in _KEY_TERMINATORS:
+            end += 1
+        key = line[:end]
+        if not key:
+            raise EnvFileSyntaxError(lineno, "chave ausente")
+
+        rest = line[end:].lstrip(_HSPACE)
+        if not rest.startswith("="):
+            _check_trailing(rest, lineno)
+            result[key] = None
+            continue
+
+        after_equal = rest[1:]
+        rest = after_equal.lstrip(_HSPACE)
+        if not rest:
+            result[key] = ""
+            continue
+
+        first = rest[0]
+        if first == "#" and len(rest) != len(after_equal):
+            # "KEY= # comentário": valor vazio
+            result[key] = ""
+        elif first == "'":
+            if "${" in rest:
+                raise EnvFileSyntaxError(lineno, "interpolação de variáveis")
+            value, trailing = _read_quoted(rest, "'", _SINGLE_QUOTE_ESCAPES, lineno)
+            _check_trailing(trailing, lineno)
+            result[key] = value
+        elif first == '"':
+            if "${" in rest:
+                raise EnvFileSyntaxError(lineno, "interpolação de variáveis")
+            value, trailing = _read_quoted(rest, '"', _DOUBLE_QUOTE_ESCAPES, lineno)
+            _check_trailing(trailing, lineno)
+            result[key] = value
+        else:
+            if "${" in rest:
+                raise EnvFileSyntaxError(lineno, "interpolação de variáveis")
+            if "#" in rest:
+                rest = _INLINE_COMMENT.sub("", rest)
+            result[key] = rest.rstrip()
+
+    return result
+
+
+def read_env_file(path: Path | str, encoding: str = "utf-8") -> dict[str, str | None]:
+    """Lê e faz o parse de um arquivo .env em uma única leitura.
+
+    Raises:
+        EnvFileSyntaxError: Se encontrar sintaxe que exige o python-dotenv
+    """
+    return parse_env(Path(path).read_text(encoding=encoding))
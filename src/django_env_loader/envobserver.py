@@ -0,0 +1,127 @@
+"""Versionamento de ``os.environ`` para invalidação barata de caches.
+
+``install()`` troca a classe do objeto ``os.environ`` por ``VersionedEnviron``,
+que incrementa um contador monotônico a cada alteração e registra em que versão
+cada variável mudou pela última vez. Como o próprio objeto é alterado (e não
+substituído), referências já existentes (``from os import environ``) também
+passam a ser observadas.
+
+Um cache guarda a versão no momento em que foi preenchido e, para saber se
+continua válido, faz uma única comparação de inteiros:
+
+    >>> environ = install()
+    >>> version = environ_version()
+    >>> os.environ["FEATURE_X"] = "on"
+    >>> environ_version() > version
+    True
+    >>> key_version("FEATURE_X") > version  # alterações por variável
+    True
+
+Alterações feitas por fora de ``os.environ`` (``os.putenv``, extensões em C
+chamando ``setenv``) não são vistas, assim como já não apareceriam em
+``os.environ``.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+
+__all__ = [
+    "VersionedEnviron",
+    "environ_version",
+    "install",
+    "is_installed",
+    "key_version",
+    "uninstall",
+]
+
+_install_lock = threading.Lock()
+
+# Contador do módulo: as versões continuam crescendo após uninstall()/install()
+_versions = itertools.count(1)
+# Serializa obter a versão e publicá-la: sem o lock, escritores concorrentes
+# poderiam gravar as versões fora de ordem e fazer ``version`` diminuir
+_version_lock = threading.Lock()
+
+
+class VersionedEnviron(os._Environ[str]):
+    """``os._Environ`` com contador de versão global e por variável.
+
+    Attributes:
+        version: Incrementada a cada alteração efetiva (atribuição com valor
+            diferente ou remoção)
+    """
+
+    version: int
+    _key_versions: dict[str, int]
+
+    def _init_versions(self) -> None:
+        self._key_versions = {}
+        self.version = next(_versions)
+
+    def _touch(self, key: str) -> None:
+        with _version_lock:
+            version = next(_versions)
+            self._key_versions[key] = version
+            self.version = version
+
+    def __setitem__(self, key: str, value: str) -> None:
+        unchanged = self.get(key) == value
+        super().__setitem__(key, value)
+        if not unchanged:
+            self._touch(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._touch(key)
+
+    def key_version(self, key: str) -> int:
+        """Versão da última alteração da variável (0 = inalterada desde install())."""
+        return self._key_versions.get(key, 0)
+
+    def changed_since(self, version: int) -> set[str]:
+        """Variáveis alteradas depois da versão informada."""
+        return {key for key, changed in self._key_versions.items() if changed > version}
+
+
+def is_installed() -> bool:
+    """Se ``os.environ`` está sendo observado."""
+    return type(os.environ) is VersionedEnviron
+
+
+def install() -> VersionedEnviron:
+    """Passa a observar ``os.environ`` (idempotente).
+
+    Returns:
+        O próprio ``os.environ``, agora versionado
+    """
+    with _install_lock:
+        environ = os.environ
+        if type(environ) is not VersionedEnviron:
+            environ.__class__ = VersionedEnviron
+            environ._init_versions()  # type: ignore[attr-defined]
+    return environ  # type: ignore[return-value]
+
+
+def uninstall() -> None:
+    """Restaura a classe original de ``os.environ`` (útil em testes)."""
+    with _install_lock:
+        environ = os.environ
+        if type(environ) is VersionedEnviron:
+            object.__setattr__(environ, "__class__", os._Environ)
+            for name in ("version", "_key_versions"):
+                environ.__dict__.pop(name, None)
+
+
+def environ_version() -> int | None:
+    """Versão atual de ``os.environ`` (None se o observador não estiver instalado)."""
+    environ = os.environ
+    return environ.version if type(environ) is VersionedEnviron else None
+
+
+def key_version(key: str) -> int | None:
+    """Versão da última alteração da variável (None se o observador não estiver instalado)."""
+    environ = os.environ
+    return environ.key_version(key) if type(environ) is VersionedEnviron else None
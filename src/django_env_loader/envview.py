@@ -0,0 +1,111 @@
+"""Visão somente leitura das variáveis de ambiente com um prefixo.
+
+Os valores são sempre lidos de ``os.environ`` no momento do acesso e apenas as
+variáveis com o prefixo são copiadas, sem copiar o ambiente inteiro.
+
+Sem o observador de ``os.environ``, os nomes são percorridos a cada consulta:
+não há marca barata que detecte a troca de uma variável por outra. Com o
+observador instalado (``envobserver.install()``), o índice com os nomes que
+começam com o prefixo é montado uma vez e validado pela versão do ambiente, e
+``items_snapshot()`` reaproveita a última cópia enquanto a versão não muda.
+"""
+
+from __future__ import annotations
+
+import os
+
+from collections.abc import Iterator, Mapping, MutableMapping
+
+from django_env_loader.envobserver import VersionedEnviron
+
+__all__ = ["PrefixedEnvironView"]
+
+
+class PrefixedEnvironView(Mapping[str, str]):
+    """Mapping somente leitura das variáveis com o prefixo (estilo MappingProxyType).
+
+    Exemplo:
+        >>> view = PrefixedEnvironView("MYAPP_")
+        >>> dict(view)
+        {'MYAPP_DEBUG': 'true', 'MYAPP_PORT': '8000'}
+    """
+
+    __slots__ = ("prefix", "_environ", "_keys", "_stamp", "_snapshot", "_snapshot_stamp")
+
+    def __init__(self, prefix: str = "", environ: MutableMapping[str, str] | None = None) -> None:
+        """Inicializa a visão.
+
+        Args:
+            prefix: Prefixo das variáveis incluídas ("" = todas)
+            environ: Ambiente observado (None = os.environ)
+        """
+        self.prefix = prefix
+        self._environ = environ if environ is not None else os.environ
+        self._keys: tuple[str, ...] | None = None
+        self._stamp: int | None = None
+        self._snapshot: dict[str, str] | None = None
+        self._snapshot_stamp: int | None = None
+
+    def _current_stamp(self) -> int | None:
+        """Versão do ambiente se observado (None = sem marca confiável)."""
+        environ = self._environ
+        if type(environ) is VersionedEnviron:
+            return environ.version
+        return None
+
+    def _index(self) -> tuple[str, ...]:
+        """Retorna os nomes com o prefixo, reconstruindo se o ambiente mudou."""
+        stamp = self._current_stamp()
+        keys = self._keys
+        if keys is None or stamp is None or stamp != self._stamp:
+            prefix = self.prefix
+            keys = tuple(key for key in self._environ if key.startswith(prefix))
+            self._keys = keys
+            self._stamp = stamp
+        return keys
+
+    def invalidate(self) -> None:
+        """Descarta o índice; a próxima consulta o reconstrói."""
+        self._keys = None
+        self._snapshot = None
+
+    def __getitem__(self, key: str) -> str:
+        if not key.startswith(self.prefix):
+            raise KeyError(key)
+        return self._environ[key]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key.startswith(self.prefix) and key in self._environ
+
+    def __iter__(self) -> Iterator[str]:
+        environ = self._environ
+        for key in self._index():
+            # Variável removida após a montagem do índice
+            if key in environ:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def items_snapshot(self) -> dict[str, str]:
+        """Copia apenas as variáveis com o prefixo (O(variáveis com o prefixo))."""
+        environ = self._environ
+        # Ambiente observado e inalterado: copia o último snapshot (sem decodificar
+        # cada valor de os.environ novamente)
+        stamp = self._current_stamp()
+        snapshot = self._snapshot
+        if stamp is not None and snapshot is not None and self._snapshot_stamp == stamp:
+            return dict(snapshot)
+
+        result: dict[str, str] = {}
+        for key in self._index():
+            value = environ.get(key)
+            if value is not None:
+                result[key] = value
+        if stamp is not None:
+            self._snapshot = dict(result)
+            self._snapshot_stamp = stamp
+        return result
+
+    def __repr__(self) -> str:
+        return f"PrefixedEnvironView(prefix={self.prefix!r}, keys={len(self)})"
@@ -27,3 +27,24 @@ class ValidationError(EnvLoaderError):
         self.value = value
         self.reason = reason
         super().__init__(f"Validação falhou para '{key}': {reason} (valor: {value!r})")
+
+
+class SchemaError(EnvLoaderError):
+    """Exceção levantada quando um ou mais campos de um schema falham.
+
+    Agrega todos os erros encontrados na resolução em vez de parar no primeiro.
+    """
+
+    def __init__(self, errors: list[EnvLoaderError]):
+        self.errors = errors
+        details = "\n".join(f"  - {error}" for error in errors)
+        super().__init__(f"{len(errors)} erro(s) ao resolver schema:\n{details}")
+
+
+class EnvFileSyntaxError(EnvLoaderError):
+    """Exceção levantada quando o parser nativo encontra sintaxe não suportada no .env."""
+
+    def __init__(self, line: int, reason: str):
+        self.line = line
+        self.reason = reason
+        super().__init__(f"Sintaxe não suportada pelo parser nativo na linha {line}: {reason}")
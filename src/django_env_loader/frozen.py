@@ -0,0 +1,416 @@
+"""Snapshot imutável da configuração para leituras no caminho das requisições.
+
+``EnvLoader.freeze()`` resolve os valores brutos uma única vez (variáveis com o
+prefixo e Docker secrets) e devolve um ``FrozenEnv``. Depois disso nenhuma
+leitura consulta o disco ou ``os.environ``: ``get_bool("FEATURE_X")`` é uma
+busca em dicionário e a conversão de tipo acontece só no primeiro acesso.
+
+Com um schema, cada campo vira um atributo do snapshot (``frozen.PORT``),
+lido como qualquer atributo de instância.
+
+Exemplo:
+    >>> frozen = env_loader.freeze(Settings)
+    >>> frozen.PORT
+    8000
+    >>> frozen.get_bool("FEATURE_X")
+    True
+
+Com ``debug=True`` cada leitura compara o valor congelado com ``os.environ``
+e emite um ``RuntimeWarning`` (uma vez por chave) se a variável mudou depois
+do freeze. Com o observador de ``os.environ`` instalado, leituras de variáveis
+não alteradas custam uma comparação de versões.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import warnings
+
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from django_env_loader.converters import compile_converter
+from django_env_loader.envobserver import environ_version, key_version
+from django_env_loader.exceptions import SecretNotFoundError, ValidationError
+
+if TYPE_CHECKING:
+    from django_env_loader.loader import EnvLoader
+    from django_env_loader.schema import SchemaLike
+
+__all__ = ["FrozenEnv", "freeze"]
+
+logger = logging.getLogger(__name__)
+
+# Marca, no cache de conversões, uma variável ausente no snapshot
+_MISSING: Any = object()
+
+_SEARCHED = ["snapshot (EnvLoader.freeze)"]
+
+
+class FrozenEnv:
+    """Configuração congelada com a mesma interface de leitura do EnvLoader.
+
+    Os campos do schema (se houver) ficam no ``__dict__`` da instância; o
+    estado interno usa ``__slots__``. Atribuições levantam AttributeError.
+    """
+
+    __slots__ = (
+        "_values",
+        "_env",
+        "_converted",
+        "_prefix",
+        "_strict",
+        "_fields",
+        "_field_keys",
+        "_watched",
+        "_watched_version",
+        "_warned",
+        "_to_bool",
+        "__dict__",
+    )
+
+    def __init__(
+        self,
+        values: dict[str, str],
+        env: dict[str, str],
+        *,
+        prefix: str = "",
+        strict: bool = False,
+        fields: dict[str, Any] | None = None,
+        field_keys: dict[str, str] | None = None,
+        watched: dict[str, str] | None = None,
+        watched_version: int | None = None,
+        to_bool: Callable[[str], bool] | None = None,
+    ) -> None:
+        """Inicializa o snapshot (use ``EnvLoader.freeze()``).
+
+        Args:
+            values: Valores brutos como get() os resolve (secrets primeiro)
+            env: Valores brutos apenas do ambiente (use_secrets=False)
+            prefix: Prefixo do loader de origem
+            strict: Se erros de conversão devem ser propagados
+            fields: Valores já convertidos dos campos do schema
+            field_keys: Variável de origem de cada campo (modo debug)
+            watched: Variáveis com prefixo no momento do freeze (None = sem debug)
+            watched_version: Versão de os.environ ao capturar ``watched`` (None = sem
+                observador instalado)
+            to_bool: Conversor de booleanos do loader (None = vocabulário padrão)
+
+        Raises:
+            ValueError: Se um campo do schema colidir com a interface do snapshot
+        """
+        setattr_ = object.__setattr__
+        setattr_(self, "_values", values)
+        setattr_(self, "_env", env)
+        setattr_(self, "_converted", {})
+        setattr_(self, "_prefix", prefix)
+        setattr_(self, "_strict", strict)
+        setattr_(self, "_field_keys", field_keys or {})
+        setattr_(self, "_watched", watched)
+        setattr_(self, "_watched_version", watched_version)
+        setattr_(self, "_warned", set())
+        setattr_(self, "_to_bool", to_bool or compile_converter(bool))
+
+        fields = fields or {}
+        for name in fields:
+            if name.startswith("_") or hasattr(type(self), name):
+                raise ValueError(f"Campo '{name}' conflita com a interface de FrozenEnv")
+        setattr_(self, "_fields", fields)
+
+        # Sem debug os campos são atributos comuns; com debug passam por __getattr__
+        if watched is None:
+            self.__dict__.update(fields)
+
+    @property
+    def debug(self) -> bool:
+        """Se as leituras verificam alterações no ambiente após o freeze."""
+        return self._watched is not None
+
+    def __getattr__(self, name: str) -> Any:
+        # Chamado apenas quando o atributo não existe (campos no modo debug)
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            value = self._fields[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' não possui o campo '{name}'") from None
+        self._check(self._field_keys.get(name, name))
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def __repr__(self) -> str:
+        return (
+            f"<FrozenEnv ({len(self._values)} valores, {len(self._fields)} campos"
+            f"{', debug' if self.debug else ''})>"
+        )
+
+    # ========================================================================
+    # Modo debug
+    # ========================================================================
+
+    def _check(self, key: str, stacklevel: int = 3) -> None:
+        """Avisa (uma vez por chave) se a variável mudou desde o freeze."""
+        watched = self._watched
+        if watched is None:
+            return
+        # Observador instalado: ambiente inalterado desde o freeze
+        frozen_version = self._watched_version
+        if frozen_version is not None and environ_version() == frozen_version:
+            return
+        prefix = self._prefix
+        prefixed_key = f"{prefix}{key}" if prefix and not key.startswith(prefix) else key
+        if frozen_version is not None:
+            changed = key_version(prefixed_key)
+            if changed is not None and changed <= frozen_version:
+                return
+        if os.environ.get(prefixed_key) != watched.get(prefixed_key):
+            if prefixed_key in self._warned:
+                return
+            self._warned.add(prefixed_key)
+            warnings.warn(
+                f"Variável '{prefixed_key}' alterada após freeze(); "
+                "o snapshot mantém o valor congelado",
+                RuntimeWarning,
+                stacklevel=stacklevel,
+            )
+
+    # ========================================================================
+    # Leitura
+    # ========================================================================
+
+    def _raw(self, key: str, use_secrets: bool) -> str | None:
+        """Valor bruto congelado (None se ausente ou vazio)."""
+        value = (self._values if use_secrets else self._env).get(key)
+        if value is None or not value.strip():
+            return None
+        return value
+
+    def _typed(
+        self,
+        cache_key: tuple[Any, ...],
+        key: str,
+        default: Any,
+        required: bool,
+        use_secrets: bool,
+        converter: Callable[[str], Any],
+    ) -> Any:
+        """Resolve a leitura tipada fora do caminho rápido.
+
+        Executado no primeiro acesso a cada chave (converte e memoriza), para
+        variáveis ausentes e no modo debug.
+        """
+        if self._watched is not None:
+            self._check(key, stacklevel=4)
+        value = self._converted.get(cache_key)
+        if value is not None:
+            if value is not _MISSING:
+                return value
+            if required:
+                raise SecretNotFoundError(key, list(_SEARCHED))
+            return default
+
+        kind = cache_key[0]
+        raw = self._raw(key, use_secrets)
+        if raw is None:
+            self._converted[cache_key] = _MISSING
+            if required:
+                raise SecretNotFoundError(key, list(_SEARCHED))
+            return default
+        try:
+            value = converter(raw)
+        except ValidationError as e:
+            if self._strict:
+                raise
+            logger.warning(f"Erro ao converter '{key}' para {kind}: {e}. Usando default: {default}")
+            return default
+        self._converted[cache_key] = value
+        return value
+
+    def get(
+        self,
+        key: str,
+        *,
+        default: Any = None,
+        required: bool = False,
+        use_secrets: bool = True,
+    ) -> Any:
+        """Obtém o valor bruto congelado (mesma semântica de EnvLoader.get)."""
+        if self._watched is not None:
+            self._check(key)
+        value = self._raw(key, use_secrets)
+        if value is None:
+            if required:
+                raise SecretNotFoundError(key, list(_SEARCHED))
+            return default if default is not None else ""
+        return value
+
+    def get_bool(
+        self, key: str, *, default: bool = False, required: bool = False, use_secrets: bool = True
+    ) -> bool:
+        """Obtém variável como boolean."""
+        cache_key = ("bool", key, use_secrets)
+        value = self._converted.get(cache_key)
+        if value is None or value is _MISSING or self._watched is not None:
+            return self._typed(cache_key, key, default, required, use_secrets, self._to_bool)
+        return value
+
+    def get_int(
+        self, key: str, *, default: int = 0, required: bool = False, use_secrets: bool = True
+    ) -> int:
+        """Obtém variável como inteiro."""
+        cache_key = ("int", key, use_secrets)
+        value = self._converted.get(cache_key)
+        if value is None or value is _MISSING or self._watched is not None:
+            return self._typed(
+                cache_key, key, default, required, use_secrets, compile_converter(int)
+            )
+        return value
+
+    def get_float(
+        self, key: str, *, default: float = 0.0, required: bool = False, use_secrets: bool = True
+    ) -> float:
+        """Obtém variável como float."""
+        cache_key = ("float", key, use_secrets)
+        value = self._converted.get(cache_key)
+        if value is None or value is _MISSING or self._watched is not None:
+            return self._typed(
+                cache_key, key, default, required, use_secrets, compile_converter(float)
+            )
+        return value
+
+    def get_list(
+        self,
+        key: str,
+        *,
+        default: list[str] | None = None,
+        delimiter: str = ",",
+        required: bool = False,
+        use_secrets: bool = True,
+    ) -> list[str]:
+        """Obtém variável como lista (FrozenList compartilhada entre chamadas)."""
+        cache_key = ("list", key, use_secrets, delimiter)
+        value = self._converted.get(cache_key)
+        if value is None or value is _MISSING or self._watched is not None:
+            return self._typed(
+                cache_key,
+                key,
+                [] if default is None else default,
+                required,
+                use_secrets,
+                compile_converter(list, delimiter=delimiter),
+            )
+        return value
+
+    def get_dict(
+        self,
+        key: str,
+        *,
+        default: dict[str, str] | None = None,
+        delimiter: str = ",",
+        required: bool = False,
+        use_secrets: bool = True,
+    ) -> dict[str, str]:
+        """Obtém variável como dicionário (FrozenDict compartilhado entre chamadas)."""
+        cache_key = ("dict", key, use_secrets, delimiter)
+        value = self._converted.get(cache_key)
+        if value is None or value is _MISSING or self._watched is not None:
+            return self._typed(
+                cache_key,
+                key,
+                {} if default is None else default,
+                required,
+                use_secrets,
+                compile_converter(dict, delimiter=delimiter),
+            )
+        return value
+
+    def is_set(self, key: str, *, use_secrets: bool = True) -> bool:
+        """Verifica se variável estava definida e não vazia no freeze."""
+        if self._watched is not None:
+            self._check(key)
+        return self._raw(key, use_secrets) is not None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Retorna os campos do schema já convertidos."""
+        return dict(self._fields)
+
+
+def freeze(
+    loader: EnvLoader,
+    schema: SchemaLike | None = None,
+    *,
+    keys: Iterable[str] | None = None,
+    debug: bool = False,
+) -> FrozenEnv:
+    """Congela a configuração resolvida pelo loader.
+
+    Args:
+        loader: Loader de origem
+        schema: Schema opcional; seus campos viram atributos do snapshot
+        keys: Secrets/backends a resolver (None = todos os arquivos de
+            secrets_dir; com backends, apenas as chaves informadas)
+        debug: Se as leituras devem avisar sobre alterações no ambiente
+
+    Returns:
+        Snapshot imutável
+
+    Raises:
+        SchemaError: Se o schema tiver campos ausentes ou inválidos
+    """
+    prefix = loader.config.prefix
+    # Versão lida antes do snapshot: alterações durante a cópia contam como posteriores
+    watched_version = environ_version()
+    watched = loader._env_view.items_snapshot()
+
+    env: dict[str, str] = {}
+    for name, value in watched.items():
+        env[name] = value
+        # "APP_X" também responde por "X", como em get()
+        short = name[len(prefix) :]
+        if prefix and short and not short.startswith(prefix):
+            env[short] = value
+
+    values = dict(env)
+    if loader.config.backends is None:
+        listing = loader._list_secrets_dir() or frozenset()
+        names = keys if keys is not None else sorted(listing)
+        for name in names:
+            # Ocultos e subdiretórios (ex: árvores do Kubernetes) não são secrets
+            if name.startswith(".") or os.path.isdir(loader._key_info(name)[1]):
+                continue
+            secret = loader._get_from_secret(name)
+            if secret is not None:
+                # Secret vazio também encobre a variável de ambiente, como em get()
+                values[name] = secret
+    elif keys is not None:
+        names = list(keys)
+        values.update(loader.get_many(names))
+        env.update(loader.get_many(names, use_secrets=False))
+
+    fields: dict[str, Any] = {}
+    field_keys: dict[str, str] = {}
+    if schema is not None:
+        from django_env_loader.schema import _collect_fields, resolve_schema
+
+        fields = resolve_schema(loader, schema).as_dict()
+        field_keys = {name: spec.env or name for name, spec in _collect_fields(schema).items()}
+
+    frozen = FrozenEnv(
+        values,
+        env,
+        prefix=prefix,
+        strict=loader.config.strict_mode,
+        fields=fields,
+        field_keys=field_keys,
+        watched=watched if debug else None,
+        watched_version=watched_version,
+        to_bool=loader._to_bool,
+    )
+    logger.debug(f"Configuração congelada: {len(values)} valores, {len(fields)} campos")
+    return frozen
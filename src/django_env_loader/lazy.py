@@ -0,0 +1,79 @@
+"""Proxy preguiçoso para a instância padrão do EnvLoader.
+
+Permite expor ``env_loader`` no pacote sem executar ``load_dotenv`` (e a busca
+do arquivo .env) no momento do import.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from django_env_loader.loader import EnvLoader
+
+__all__ = ["LazyEnvLoader"]
+
+
+def _default_factory() -> EnvLoader:
+    """Cria o EnvLoader padrão (import adiado até o primeiro uso)."""
+    from django_env_loader.loader import EnvLoader
+
+    return EnvLoader()
+
+
+class LazyEnvLoader:
+    """Proxy que constrói o EnvLoader apenas no primeiro acesso a atributo.
+
+    Exemplo:
+        >>> env_loader = LazyEnvLoader()  # nada é carregado aqui
+        >>> debug = env_loader.get_bool("DEBUG")  # EnvLoader criado agora
+    """
+
+    __slots__ = ("_factory", "_lock", "_wrapped")
+
+    def __init__(self, factory: Callable[[], EnvLoader] | None = None) -> None:
+        """Inicializa o proxy.
+
+        Args:
+            factory: Função que cria o loader (None = EnvLoader padrão)
+        """
+        object.__setattr__(self, "_factory", factory or _default_factory)
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(self, "_wrapped", None)
+
+    def _setup(self) -> EnvLoader:
+        """Retorna o loader encapsulado, criando-o se necessário."""
+        wrapped = self._wrapped
+        if wrapped is None:
+            with self._lock:
+                wrapped = self._wrapped
+                if wrapped is None:
+                    wrapped = self._factory()
+                    object.__setattr__(self, "_wrapped", wrapped)
+        return wrapped
+
+    def _reset(self) -> None:
+        """Descarta o loader encapsulado (o próximo acesso cria outro)."""
+        object.__setattr__(self, "_wrapped", None)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Indica se o loader já foi construído."""
+        return self._wrapped is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._setup(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._setup(), name, value)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._setup())
+
+    def __repr__(self) -> str:
+        if self._wrapped is None:
+            return "<LazyEnvLoader (não carregado)>"
+        return f"<LazyEnvLoader {self._wrapped!r}>"
@@ -6,26 +6,77 @@ variáveis de ambiente, com suporte especial para Docker secrets e integração
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import mmap
 import os
+import sys
+import threading
+import time
 import warnings
 
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import TypeVar, overload
-
-from dotenv import load_dotenv
-
-from django_env_loader.exceptions import SecretNotFoundError, ValidationError
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
+
+from dotenv import dotenv_values, find_dotenv, load_dotenv
+
+from django_env_loader.backends import CachedBackend, SecretBackend
+from django_env_loader.cache import CacheStats, SecretCache
+from django_env_loader.converters import (
+    BoolVocabulary,
+    FrozenDict,
+    FrozenList,
+    TypeConverter,
+    compile_converter,
+)
+from django_env_loader.envfile import read_env_file
+from django_env_loader.envobserver import install as install_environ_observer
+from django_env_loader.envurl import parse_cache_url, parse_database_url, parse_email_url
+from django_env_loader.envview import PrefixedEnvironView
+from django_env_loader.exceptions import (
+    EnvFileSyntaxError,
+    SecretNotFoundError,
+    ValidationError,
+)
+from django_env_loader.snapshot import load_or_compile
+
+if TYPE_CHECKING:
+    from django_env_loader.frozen import FrozenEnv
+    from django_env_loader.metrics import MetricsCollector
+    from django_env_loader.schema import ResolvedSettings, SchemaLike
+    from django_env_loader.watcher import ChangeCallback, SecretsWatcher
 
 __version__ = "1.0.5"
-__all__ = ["EnvLoader", "EnvConfig", SecretNotFoundError, ValidationError]
+__all__ = [
+    "EnvLoader",
+    "EnvConfig",
+    "FrozenDict",
+    "FrozenList",
+    "TypeConverter",
+    SecretNotFoundError,
+    ValidationError,
+]
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Máximo de chaves com chave prefixada/caminho pré-calculados (chaves dinâmicas)
+_KEY_INFO_LIMIT = 4096
+
+# Máximo de caminhos no cache negativo de secrets (chaves dinâmicas ou ausentes)
+_MISSING_SECRETS_LIMIT = 4096
+
+# Bancos adicionais: DATABASE_URL_<ALIAS> (ex: DATABASE_URL_REPLICA -> "replica")
+_DATABASE_URL_ALIAS_PREFIX = "DATABASE_URL_"
+
+
+def _is_nested_secret_key(key: str) -> bool:
+    """Chaves com separadores apontam para subdiretórios e não constam da listagem."""
+    return os.sep in key or bool(os.altsep and os.altsep in key)
+
 
 # ============================================================================
 # Configuração
@@ -46,6 +97,26 @@ class EnvConfig:
         cache_secrets: Se deve cachear secrets lidos de arquivos
         strict_mode: Se deve levantar exceções em vez de warnings
         warn_on_missing: Se deve emitir warnings para variáveis não encontradas
+        secrets_negative_ttl: TTL (segundos) do cache de secrets ausentes (0 = desativado);
+            um arquivo de secret criado depois de uma busca sem sucesso pode levar até
+            esse prazo para ser visto
+        secrets_cache_ttl: Validade (segundos) dos secrets em cache (None = sem expiração)
+        secrets_cache_max_entries: Limite de secrets em cache, com descarte LRU (None = ilimitado)
+        memoize_typed: Se deve memoizar valores convertidos pelos getters tipados
+        clear_cache_on_fork: Se processos filhos (os.fork) devem descartar o cache de secrets
+        backends: Cadeia ordenada de backends (None = Docker secrets seguido de os.environ)
+        env_parser: Parser do .env: "auto" (nativo com fallback para o python-dotenv),
+            "native" (apenas o nativo) ou "dotenv" (apenas o python-dotenv)
+        env_snapshot: Se deve usar/gravar o snapshot pré-compilado do .env (``.env.snapshot``)
+        metrics: Coletor de métricas das buscas (None = sem instrumentação)
+        shared_config: Arquivo publicado pelo processo mestre (``shared.publish``); se
+            existir, substitui o parse do .env e as leituras de secrets
+        bool_vocabulary: Palavras aceitas por get_bool (None = vocabulário padrão
+            em português e inglês)
+        large_secret_bytes: Secrets a partir deste tamanho ficam mapeados (mmap) e são
+            decodificados a cada get(), sem cópia str em cache (None = desativado)
+        observe_environ: Se deve versionar ``os.environ`` (``envobserver``) para que os
+            caches derivados do ambiente sejam validados por uma comparação de inteiros
     """
 
     env_file: Path | str | None = None
@@ -57,87 +128,72 @@ class EnvConfig:
     cache_secrets: bool = True
     strict_mode: bool = False
     warn_on_missing: bool = True
+    secrets_negative_ttl: float = 5.0
+    secrets_cache_ttl: float | None = None
+    secrets_cache_max_entries: int | None = None
+    memoize_typed: bool = False
+    clear_cache_on_fork: bool = False
+    backends: list[SecretBackend] | None = None
+    env_parser: Literal["auto", "native", "dotenv"] = "auto"
+    env_snapshot: bool = False
+    metrics: MetricsCollector | None = None
+    shared_config: Path | str | None = None
+    bool_vocabulary: BoolVocabulary | None = None
+    large_secret_bytes: int | None = None
+    observe_environ: bool = False
 
     def __post_init__(self) -> None:
         """Valida e normaliza a configuração."""
+        if self.env_parser not in ("auto", "native", "dotenv"):
+            raise ValueError(f"env_parser inválido: {self.env_parser!r}")
         if self.env_file is not None:
             self.env_file = Path(self.env_file)
+        if self.shared_config is not None:
+            self.shared_config = Path(self.shared_config)
         if isinstance(self.secrets_dir, str):
             self.secrets_dir = Path(self.secrets_dir)
 
 
-# ============================================================================
-# Conversores de tipo
-# ============================================================================
-
+def _freeze_config_value(value: Any) -> Any:
+    """Converte um valor do EnvConfig em algo hashable (identidade como último recurso)."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_config_value(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze_config_value(v)) for k, v in value.items()))
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+    return value
 
-class TypeConverter:
-    """Conversor type-safe de valores de ambiente."""
 
-    @staticmethod
-    def to_bool(value: str | bool) -> bool:
-        """Converte string para boolean de forma segura."""
-        if isinstance(value, bool):
-            return value
+def config_key(config: EnvConfig) -> tuple[Any, ...]:
+    """Chave do registro de loaders: configurações iguais compartilham o loader.
 
-        if not isinstance(value, str):
-            raise ValidationError("boolean", value, "Tipo inválido, esperado str ou bool")
+    Args:
+        config: Configuração do loader
 
-        normalized = value.lower().strip()
+    Returns:
+        Tupla hashable com os valores de todos os campos
+    """
+    return tuple(_freeze_config_value(getattr(config, f.name)) for f in fields(config))
 
-        if normalized in {"true", "1", "yes", "y", "on", "t", "sim", "s"}:
-            return True
-        if normalized in {"false", "0", "no", "n", "off", "f", "não", "nao", ""}:
-            return False
 
-        raise ValidationError("boolean", value, f"Valor inválido para bool: '{value}'")
+@dataclass(frozen=True)
+class PrefetchResult:
+    """Resultado de ``EnvLoader.prefetch_secrets()``.
 
-    @staticmethod
-    def to_int(value: str | int) -> int:
-        """Converte string para inteiro."""
-        if isinstance(value, int):
-            return value
-        try:
-            return int(str(value).strip())
-        except (ValueError, TypeError) as e:
-            raise ValidationError("int", value, str(e)) from e
-
-    @staticmethod
-    def to_float(value: str | float) -> float:
-        """Converte string para float."""
-        if isinstance(value, float):
-            return value
-        try:
-            return float(str(value).strip())
-        except (ValueError, TypeError) as e:
-            raise ValidationError("float", value, str(e)) from e
-
-    @staticmethod
-    def to_list(value: str | list[str], delimiter: str = ",") -> list[str]:
-        """Converte string delimitada em lista."""
-        if isinstance(value, list):
-            return value
-        if not value:
-            return []
-        return [item.strip() for item in str(value).split(delimiter) if item.strip()]
-
-    @staticmethod
-    def to_dict(value: str | dict[str, str], delimiter: str = ",") -> dict[str, str]:
-        """Converte string 'key=value,key2=value2' em dicionário."""
-        if isinstance(value, dict):
-            return value
-        if not value:
-            return {}
+    Attributes:
+        loaded: Secrets lidos e armazenados no cache
+        missing: Secrets ausentes ou ilegíveis
+        seconds: Duração total da pré-carga
+        timings: Duração da leitura de cada secret, por nome
+    """
 
-        result: dict[str, str] = {}
-        for item in str(value).split(delimiter):
-            item = item.strip()
-            if "=" in item:
-                k, v = item.split("=", 1)
-                result[k.strip()] = v.strip()
-            elif item:
-                result[item] = ""
-        return result
+    loaded: tuple[str, ...]
+    missing: tuple[str, ...]
+    seconds: float
+    timings: Mapping[str, float] = field(default_factory=dict)
 
 
 # ============================================================================
@@ -158,48 +214,221 @@ class EnvLoader:
         >>> allowed_hosts = loader.get_list("ALLOWED_HOSTS", default=[])
     """
 
-    _instance: EnvLoader | None = None
+    # Um loader por (classe, configuração): cada um mantém seus próprios caches
+    _registry: dict[tuple[Any, ...], EnvLoader] = {}
+    _registry_lock = threading.RLock()
     _initialized: bool = False
 
     def __new__(cls, config: EnvConfig | None = None) -> EnvLoader:
-        """Implementa padrão Singleton (opcional)."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        """Retorna o loader registrado para a configuração, criando-o se necessário."""
+        key = (cls, config_key(config or cls._default_config()))
+        instance = cls._registry.get(key)
+        if instance is None:
+            with cls._registry_lock:
+                instance = cls._registry.get(key)
+                if instance is None:
+                    instance = cls._registry[key] = super().__new__(cls)
+        return instance
+
+    @classmethod
+    def _default_config(cls) -> EnvConfig:
+        """Configuração usada quando nenhuma é informada."""
+        return EnvConfig()
 
     def __init__(self, config: EnvConfig | None = None) -> None:
         """Inicializa o loader com configuração opcional.
 
+        Loaders são registrados por configuração: instanciar de novo com uma
+        configuração igual retorna o mesmo objeto, já inicializado.
+
         Args:
             config: Configuração customizada (None = configuração padrão)
         """
-        # Evita reinicialização no padrão Singleton
-        if self._initialized:
-            return
-
-        self.config = config or EnvConfig()
-        self._secrets_cache: dict[str, str] = {}
-        self._load_env_file()
+        # Evita reinicializar um loader já registrado
+        if not self._initialized:
+            with self._registry_lock:
+                if not self._initialized:
+                    self._setup(config or self._default_config())
+
+    def _setup(self, config: EnvConfig) -> None:
+        """Inicializa caches e carrega o .env (uma vez por loader registrado)."""
+        self.config = config
+        if config.observe_environ:
+            install_environ_observer()
+        self._secrets_cache: SecretCache[str] = self._new_secret_cache()
+        # Cache negativo: caminho do secret -> instante (monotonic) de expiração
+        self._missing_secrets: dict[str, float] = {}
+        # Snapshot da listagem de secrets_dir, reconstruído quando o mtime muda
+        self._secrets_listing: frozenset[str] | None = None
+        self._secrets_listing_mtime: int | None = None
+        self._secrets_listing_racy = False
+        # Conteúdo binário dos secrets (get_bytes/get_buffer e secrets grandes),
+        # com as mesmas políticas (TTL, LRU, fork) do cache de str:
+        # caminho -> bytes / mmap somente leitura
+        self._secret_bytes: SecretCache[bytes] = self._new_secret_cache()
+        self._secret_maps: SecretCache[mmap.mmap] = self._new_secret_cache()
+        # Chave -> (chave com prefixo, caminho do secret), calculados uma vez
+        self._key_infos: dict[str, tuple[str, str]] = {}
+        # Índice das variáveis com o prefixo (get_all / env_view)
+        self._env_view = PrefixedEnvironView(self.config.prefix)
+        # Memoização dos getters tipados: chave -> (valor bruto, valor convertido)
+        self._typed_cache: dict[tuple[Any, ...], tuple[str, Any]] = {}
+        # Conversores compilados uma vez (tabelas de consulta e cache por entrada)
+        self._to_bool = compile_converter(bool, vocabulary=config.bool_vocabulary)
+        self._to_int = compile_converter(int)
+        self._to_float = compile_converter(float)
+        # Valores do .env aplicados ao ambiente (base para reload_env_file)
+        self._env_file_values: dict[str, str] | None = None
+        if not self._attach_shared_config():
+            self._load_env_file()
         self._initialized = True
 
+    def _new_secret_cache(self) -> SecretCache[Any]:
+        """Cria um cache de secrets com as políticas da configuração."""
+        return SecretCache(
+            clear_on_fork=self.config.clear_cache_on_fork,
+            ttl=self.config.secrets_cache_ttl,
+            max_entries=self.config.secrets_cache_max_entries,
+        )
+
+    def _attach_shared_config(self) -> bool:
+        """Usa a configuração publicada pelo processo mestre, se disponível.
+
+        Returns:
+            True se a configuração compartilhada foi aplicada
+        """
+        if self.config.shared_config is None:
+            return False
+
+        from django_env_loader.shared import attach
+
+        shared = attach(self.config.shared_config)
+        if shared is None:
+            return False
+        if shared.secrets_dir != str(self.config.secrets_dir):
+            logger.warning(
+                f"Configuração compartilhada ignorada: publicada para {shared.secrets_dir}, "
+                f"esperado {self.config.secrets_dir}"
+            )
+            return False
+
+        self._apply_env_values(shared.env)
+        if self.config.cache_secrets:
+            for name, value in shared.secrets.items():
+                self._secrets_cache.set(self._key_info(name)[1], value)
+        logger.debug(
+            f"Configuração compartilhada carregada: {self.config.shared_config} "
+            f"({len(shared.env)} variáveis, {len(shared.secrets)} secrets)"
+        )
+        return True
+
     def _load_env_file(self) -> None:
         """Carrega arquivo .env se especificado."""
         if self.config.env_file:
             env_path = Path(self.config.env_file)
             if env_path.is_file():
-                load_dotenv(
-                    env_path,
-                    override=self.config.override_existing,
-                    encoding=self.config.encoding,
-                )
+                self._apply_env_file(env_path)
                 logger.debug(f"Arquivo .env carregado: {env_path}")
             else:
                 msg = f"Arquivo .env não encontrado: {env_path}"
                 if self.config.strict_mode:
                     raise FileNotFoundError(msg)
                 logger.warning(msg)
-        else:
+        elif self.config.env_parser == "dotenv":
             load_dotenv(override=self.config.override_existing, encoding=self.config.encoding)
+        else:
+            found = find_dotenv()
+            if found:
+                self._apply_env_file(Path(found))
+
+    def _parse_env_file(self, env_path: Path) -> dict[str, str | None] | None:
+        """Lê o .env com o parser nativo; retorna None se for preciso o python-dotenv."""
+        if self.config.env_parser == "dotenv":
+            return None
+        try:
+            if self.config.env_snapshot:
+                return load_or_compile(env_path, encoding=self.config.encoding)
+            return read_env_file(env_path, encoding=self.config.encoding)
+        except EnvFileSyntaxError as e:
+            if self.config.env_parser == "native":
+                raise
+            logger.debug(f"{env_path}: {e}; usando python-dotenv")
+            return None
+
+    def _apply_env_file(self, env_path: Path) -> None:
+        """Aplica o .env ao ambiente com a mesma semântica do load_dotenv."""
+        values = self._parse_env_file(env_path)
+        if values is None:
+            load_dotenv(
+                env_path,
+                override=self.config.override_existing,
+                encoding=self.config.encoding,
+            )
+            self._env_view.invalidate()
+            return
+        self._apply_env_values(values)
+
+    def _apply_env_values(self, values: Mapping[str, str | None]) -> None:
+        """Aplica valores ao ambiente (existentes só são sobrescritos com override)."""
+        override = self.config.override_existing
+        environ = os.environ
+        for name, value in values.items():
+            if value is not None and (override or name not in environ):
+                environ[name] = value
+        self._env_view.invalidate()
+
+    def _env_file_path(self) -> Path | None:
+        """Retorna o caminho do .env configurado ou auto-detectado."""
+        if self.config.env_file:
+            return Path(self.config.env_file)
+        found = find_dotenv()
+        return Path(found) if found else None
+
+    def _read_env_file_values(self) -> dict[str, str]:
+        """Lê o .env sem aplicá-lo ao ambiente (chaves sem valor são ignoradas)."""
+        env_path = self._env_file_path()
+        if env_path is None or not env_path.is_file():
+            return {}
+        values = self._parse_env_file(env_path)
+        if values is None:
+            values = dotenv_values(env_path, encoding=self.config.encoding)
+        return {k: v for k, v in values.items() if v is not None}
+
+    def snapshot_env_file(self) -> None:
+        """Registra os valores atuais do .env como base para reload_env_file()."""
+        self._env_file_values = self._read_env_file_values()
+
+    def reload_env_file(self) -> set[str]:
+        """Reaplica o .env, atualizando apenas as variáveis que vieram dele.
+
+        Variáveis definidas fora do arquivo (ex: pelo orquestrador) são
+        preservadas, exceto com ``override_existing=True``. Chaves removidas do
+        arquivo são removidas do ambiente se ainda tiverem o valor do arquivo.
+
+        Returns:
+            Nomes das variáveis alteradas no ambiente
+        """
+        previous = self._env_file_values or {}
+        current = self._read_env_file_values()
+        changed: set[str] = set()
+
+        for name, value in current.items():
+            existing = os.environ.get(name)
+            owned = existing is None or existing == previous.get(name)
+            if (owned or self.config.override_existing) and existing != value:
+                os.environ[name] = value
+                changed.add(name)
+
+        for name, value in previous.items():
+            if name not in current and os.environ.get(name) == value:
+                del os.environ[name]
+                changed.add(name)
+
+        self._env_file_values = current
+        if changed:
+            self._env_view.invalidate()
+            logger.debug(f"Variáveis recarregadas do .env: {sorted(changed)}")
+        return changed
 
     def _get_prefixed_key(self, key: str) -> str:
         """Retorna a chave com prefixo aplicado."""
@@ -209,18 +438,41 @@ class EnvLoader:
             else key
         )
 
+    def _key_info(self, key: str) -> tuple[str, str]:
+        """Retorna (chave com prefixo, caminho do secret) sem recalcular a cada get."""
+        info = self._key_infos.get(key)
+        if info is None:
+            if len(self._key_infos) >= _KEY_INFO_LIMIT:
+                self._key_infos.clear()
+            info = (
+                sys.intern(self._get_prefixed_key(key)),
+                sys.intern(str(self.config.secrets_dir / key)),
+            )
+            self._key_infos[key] = info
+        return info
+
+    def _searched_locations(self, key: str, use_secrets: bool) -> list[str]:
+        """Monta os locais consultados por get() (apenas no caminho de erro)."""
+        if self.config.backends is not None:
+            return [
+                f"{backend.name}:{key}"
+                for backend in self.config.backends
+                if use_secrets or not backend.is_secret
+            ]
+        prefixed_key, path_str = self._key_info(key)
+        searched = [f"secret:{path_str}"] if use_secrets else []
+        searched.append(f"env:{prefixed_key}")
+        return searched
+
     def _read_secret_file(self, secret_path: Path) -> str | None:
         """Lê conteúdo de arquivo secret com tratamento de erros."""
+        metrics = self.config.metrics
+        started = time.perf_counter() if metrics is not None else 0.0
         try:
             if not secret_path.exists():
                 return None
 
             content = secret_path.read_text(encoding=self.config.encoding).strip()
-            path_str = str(secret_path)
-
-            if self.config.cache_secrets:
-                self._secrets_cache[path_str] = content  # ← Armazena pelo caminho
-
             logger.debug(f"Secret lido: {secret_path}")
             return content
 
@@ -229,29 +481,229 @@ class EnvLoader:
             if self.config.strict_mode:
                 raise
             return None
+        finally:
+            if metrics is not None:
+                metrics.record_read("secret", time.perf_counter() - started)
 
-    def _get_from_secret(self, key: str) -> str | None:
-        """Tenta obter valor de Docker secret."""
-        secret_path = self.config.secrets_dir / key
-        path_str = str(secret_path)
+    def _map_secret_file(self, path_str: str, min_size: int = 1) -> mmap.mmap | None:
+        """Mapeia o arquivo secret na memória (somente leitura), uma vez por caminho.
 
-        # Verifica cache primeiro (pelo caminho do arquivo)
-        if self.config.cache_secrets and path_str in self._secrets_cache:
-            return self._secrets_cache[path_str]
+        As páginas vêm do page cache do kernel e são compartilhadas entre
+        processos. O arquivo deve ser substituído atomicamente (rename), como
+        fazem Docker e Kubernetes: truncá-lo no lugar invalida o mapeamento.
 
-        # Tenta ler do arquivo secret
-        return self._read_secret_file(secret_path)
+        Args:
+            path_str: Caminho do arquivo
+            min_size: Tamanho mínimo (bytes) para mapear
+
+        Returns:
+            mmap ou None se o arquivo não existir ou for menor que min_size
+        """
+
+        def load() -> mmap.mmap | None:
+            try:
+                with open(path_str, "rb") as f:
+                    if os.fstat(f.fileno()).st_size < max(min_size, 1):
+                        return None
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except FileNotFoundError:
+                return None
+            except OSError as e:
+                logger.error(f"Erro ao mapear secret {path_str}: {e}")
+                if self.config.strict_mode:
+                    raise
+                return None
+
+        if self.config.cache_secrets:
+            return self._secret_maps.get_or_load(path_str, load)
+        return load()
+
+    def _read_secret_bytes(self, path_str: str) -> bytes | None:
+        """Lê o arquivo secret como bytes, uma vez por caminho (sem decodificar)."""
+
+        def load() -> bytes | None:
+            try:
+                with open(path_str, "rb") as f:
+                    return f.read() or None
+            except FileNotFoundError:
+                return None
+            except OSError as e:
+                logger.error(f"Erro ao ler secret {path_str}: {e}")
+                if self.config.strict_mode:
+                    raise
+                return None
+
+        if self.config.cache_secrets:
+            return self._secret_bytes.get_or_load(path_str, load)
+        return load()
+
+    def _decode_secret_map(self, buffer: mmap.mmap) -> str:
+        """Decodifica um secret mapeado (a cada leitura, sem cópia str em cache)."""
+        return str(buffer, self.config.encoding).strip()
+
+    def _list_secrets_dir(self) -> frozenset[str] | None:
+        """Retorna a listagem de secrets_dir, relendo apenas se o mtime mudou.
+
+        Returns:
+            Nomes presentes no diretório (vazio se não existir) ou None se a
+            listagem não puder ser obtida.
+        """
+        try:
+            mtime = os.stat(self.config.secrets_dir).st_mtime_ns
+        except OSError:
+            self._secrets_listing = frozenset()
+            self._secrets_listing_mtime = None
+            return self._secrets_listing
+
+        if (
+            self._secrets_listing is None
+            or self._secrets_listing_racy
+            or mtime != self._secrets_listing_mtime
+        ):
+            try:
+                listing = frozenset(os.listdir(self.config.secrets_dir))
+            except OSError as e:
+                logger.debug(f"Não foi possível listar {self.config.secrets_dir}: {e}")
+                return None
+            self._secrets_listing = listing
+            self._secrets_listing_mtime = mtime
+            # Alterações no mesmo "tick" do mtime não seriam detectadas: enquanto
+            # o snapshot for recente demais, força nova listagem na próxima consulta
+            self._secrets_listing_racy = time.time_ns() - mtime < 1_000_000_000
+
+        return self._secrets_listing
+
+    def _is_secret_missing(self, key: str, path_str: str) -> bool:
+        """Verifica, sem ler o arquivo, se o secret certamente não existe."""
+        ttl = self.config.secrets_negative_ttl
+        if ttl <= 0:
+            return False
+
+        expires = self._missing_secrets.get(path_str)
+        if expires is not None:
+            if time.monotonic() < expires:
+                return True
+            self._missing_secrets.pop(path_str, None)
+
+        if _is_nested_secret_key(key):
+            return False
+
+        listing = self._list_secrets_dir()
+        if listing is None or key in listing:
+            return False
+
+        self._mark_secret_missing(path_str, time.monotonic() + ttl)
+        return True
+
+    def _mark_secret_missing(self, path_str: str, expires: float) -> None:
+        """Registra o secret como ausente, mantendo o cache negativo limitado."""
+        missing = self._missing_secrets
+        if len(missing) >= _MISSING_SECRETS_LIMIT and path_str not in missing:
+            now = time.monotonic()
+            for stale, deadline in list(missing.items()):
+                if deadline <= now:
+                    missing.pop(stale, None)
+            if len(missing) >= _MISSING_SECRETS_LIMIT:
+                missing.clear()
+        missing[path_str] = expires
+
+    def _get_from_secret(self, key: str, path_str: str | None = None) -> str | None:
+        """Tenta obter valor de Docker secret."""
+        if path_str is None:
+            path_str = self._key_info(key)[1]
+
+        metrics = self.config.metrics
+        threshold = self.config.large_secret_bytes
+
+        # Secrets grandes já mapeados: antes do cache de str e do cache negativo
+        if threshold is not None and self.config.cache_secrets:
+            buffer = self._secret_maps.get(path_str)
+            if buffer is not None:
+                if metrics is not None:
+                    metrics.record_lookup(key, "secret_cache", "hit")
+                return self._decode_secret_map(buffer)
+
+        # Verifica cache primeiro (pelo caminho do arquivo, sem lock)
+        if self.config.cache_secrets:
+            value = self._secrets_cache.get(path_str)
+            if value is not None:
+                if metrics is not None:
+                    metrics.record_lookup(key, "secret_cache", "hit")
+                return value
+
+        # Secrets sabidamente ausentes custam apenas uma consulta ao dicionário
+        if self._is_secret_missing(key, path_str):
+            if metrics is not None:
+                metrics.record_lookup(key, "secret", "negative")
+            return None
+
+        # Secrets grandes: um único mmap por arquivo, decodificado a cada leitura
+        if threshold is not None:
+            buffer = self._map_secret_file(path_str, threshold)
+            if buffer is not None:
+                if metrics is not None:
+                    metrics.record_lookup(key, "secret", "hit")
+                return self._decode_secret_map(buffer)
+
+        # Tenta ler do arquivo secret (uma única leitura por caminho entre threads)
+        secret_path = Path(path_str)
+        if self.config.cache_secrets:
+            value = self._secrets_cache.fill(path_str, lambda: self._read_secret_file(secret_path))
+        else:
+            value = self._read_secret_file(secret_path)
+        if value is None and self.config.secrets_negative_ttl > 0:
+            self._mark_secret_missing(path_str, time.monotonic() + self.config.secrets_negative_ttl)
+        if metrics is not None:
+            metrics.record_lookup(key, "secret", "miss" if value is None else "hit")
+        return value
 
     def _get_from_env(self, key: str) -> str | None:
         """Obtém valor de variável de ambiente."""
-        prefixed_key = self._get_prefixed_key(key)
-        return os.environ.get(prefixed_key)
+        return os.environ.get(self._key_info(key)[0])
+
+    def _get_from_backends(self, key: str, use_secrets: bool) -> str | None:
+        """Consulta a cadeia de backends configurada, em ordem."""
+        metrics = self.config.metrics
+        for backend in self.config.backends or ():
+            if backend.is_secret and not use_secrets:
+                continue
+            if metrics is None:
+                value = backend.get(key)
+            else:
+                started = time.perf_counter()
+                value = backend.get(key)
+                metrics.record_read(backend.name, time.perf_counter() - started)
+                metrics.record_lookup(key, backend.name, "miss" if value is None else "hit")
+            if value is not None:
+                return value
+        return None
+
+    def _convert(self, cache_key: tuple[Any, ...], raw: str, converter: Callable[[str], T]) -> T:
+        """Converte o valor bruto, reaproveitando o resultado no modo memoizado.
+
+        A entrada é invalidada quando o valor bruto muda (comparação por
+        identidade e, em seguida, por igualdade da string).
+        """
+        if not self.config.memoize_typed:
+            return converter(raw)
+
+        entry = self._typed_cache.get(cache_key)
+        if entry is not None and (entry[0] is raw or entry[0] == raw):
+            return entry[1]
+
+        value = converter(raw)
+        self._typed_cache[cache_key] = (raw, value)
+        return value
 
     @overload
-    def get(self, key: str, *, default: T, required: bool = False) -> str | T: ...
+    def get(
+        self, key: str, *, default: T, required: bool = False, use_secrets: bool = True
+    ) -> str | T: ...
 
     @overload
-    def get(self, key: str, *, default: None = None, required: bool = True) -> str: ...
+    def get(
+        self, key: str, *, default: None = None, required: bool = True, use_secrets: bool = True
+    ) -> str: ...
 
     def get(
         self,
@@ -275,23 +727,33 @@ class EnvLoader:
         Raises:
             SecretNotFoundError: Se required=True e variável não encontrada
         """
-        value: str | None = None
-        searched: list[str] = []
-
-        # Busca em secrets primeiro
-        if use_secrets:
-            value = self._get_from_secret(key)
-            searched.append(f"secret:{self.config.secrets_dir / key}")
+        metrics = self.config.metrics
+        if metrics is not None:
+            metrics.record_access(key)
 
-        # Fallback para variável de ambiente
-        if value is None:
-            value = self._get_from_env(key)
-            searched.append(f"env:{self._get_prefixed_key(key)}")
+        if self.config.backends is not None:
+            value = self._get_from_backends(key, use_secrets)
+        else:
+            # Caminho rápido: chave prefixada e caminho do secret já calculados;
+            # a lista de locais buscados só é montada se a variável faltar
+            prefixed_key, path_str = self._key_info(key)
+
+            # Busca em secrets primeiro
+            value = self._get_from_secret(key, path_str) if use_secrets else None
+
+            # Fallback para variável de ambiente
+            if value is None:
+                value = os.environ.get(prefixed_key)
+                if metrics is not None:
+                    if value is None:
+                        metrics.record_lookup(key, "env", "miss")
+                    else:
+                        metrics.record_lookup(key, "env", "fallback" if use_secrets else "hit")
 
         # Validação
         if value is None or not value.strip():
             if required:
-                raise SecretNotFoundError(key, searched)
+                raise SecretNotFoundError(key, self._searched_locations(key, use_secrets))
 
             if self.config.warn_on_missing and default is None:
                 warnings.warn(f"Variável '{key}' não encontrada", UserWarning, stacklevel=2)
@@ -300,6 +762,55 @@ class EnvLoader:
 
         return value
 
+    def get_many(self, keys: Iterable[str], *, use_secrets: bool = True) -> dict[str, str]:
+        """Obtém várias variáveis de uma vez.
+
+        Com backends configurados, cada backend recebe em uma única chamada
+        todas as chaves ainda não encontradas.
+
+        Args:
+            keys: Nomes das variáveis (sem prefixo)
+            use_secrets: Se deve buscar em Docker secrets / backends de secrets
+
+        Returns:
+            Dicionário apenas com as variáveis encontradas e não vazias
+        """
+        keys = list(keys)
+        result: dict[str, str] = {}
+
+        if self.config.backends is None:
+            for key in keys:
+                value = self.get(key, default="", use_secrets=use_secrets)
+                if value:
+                    result[key] = value
+            return result
+
+        metrics = self.config.metrics
+        if metrics is not None:
+            for key in keys:
+                metrics.record_access(key)
+
+        pending = keys
+        for backend in self.config.backends:
+            if backend.is_secret and not use_secrets:
+                continue
+            if metrics is None:
+                found = backend.get_many(pending)
+            else:
+                started = time.perf_counter()
+                found = backend.get_many(pending)
+                metrics.record_read(backend.name, time.perf_counter() - started)
+                for key in pending:
+                    metrics.record_lookup(key, backend.name, "hit" if key in found else "miss")
+            for key in pending:
+                found_value = found.get(key)
+                if found_value is not None and found_value.strip():
+                    result[key] = found_value
+            pending = [key for key in pending if key not in found]
+            if not pending:
+                break
+        return result
+
     def get_bool(
         self,
         key: str,
@@ -309,9 +820,11 @@ class EnvLoader:
         use_secrets: bool = True,
     ) -> bool:
         """Obtém variável como boolean."""
-        value = self.get(key, default=str(default), required=required, use_secrets=use_secrets)
+        value = self.get(key, default="", required=required, use_secrets=use_secrets)
+        if not value:
+            return default
         try:
-            return TypeConverter.to_bool(value)
+            return self._convert(("bool", key, use_secrets), value, self._to_bool)
         except ValidationError as e:
             if self.config.strict_mode:
                 raise
@@ -327,9 +840,11 @@ class EnvLoader:
         use_secrets: bool = True,
     ) -> int:
         """Obtém variável como inteiro."""
-        value = self.get(key, default=str(default), required=required, use_secrets=use_secrets)
+        value = self.get(key, default="", required=required, use_secrets=use_secrets)
+        if not value:
+            return default
         try:
-            return TypeConverter.to_int(value)
+            return self._convert(("int", key, use_secrets), value, self._to_int)
         except ValidationError as e:
             if self.config.strict_mode:
                 raise
@@ -345,9 +860,11 @@ class EnvLoader:
         use_secrets: bool = True,
     ) -> float:
         """Obtém variável como float."""
-        value = self.get(key, default=str(default), required=required, use_secrets=use_secrets)
+        value = self.get(key, default="", required=required, use_secrets=use_secrets)
+        if not value:
+            return default
         try:
-            return TypeConverter.to_float(value)
+            return self._convert(("float", key, use_secrets), value, self._to_float)
         except ValidationError as e:
             if self.config.strict_mode:
                 raise
@@ -377,6 +894,12 @@ class EnvLoader:
             return default
 
         # Variável existe, converte para lista
+        if self.config.memoize_typed:
+            return self._convert(
+                ("list", key, delimiter, use_secrets),
+                value,
+                lambda raw: compile_converter(list, delimiter=delimiter)(raw),
+            )
         return TypeConverter.to_list(value, delimiter)
 
     def get_dict(
@@ -402,8 +925,94 @@ class EnvLoader:
             return default
 
         # Variável existe, converte para dicionário
+        if self.config.memoize_typed:
+            return self._convert(
+                ("dict", key, delimiter, use_secrets),
+                value,
+                lambda raw: compile_converter(dict, delimiter=delimiter)(raw),
+            )
         return TypeConverter.to_dict(value, delimiter)
 
+    def _get_binary(
+        self, key: str, required: bool, use_secrets: bool, *, mapped: bool
+    ) -> bytes | mmap.mmap | None:
+        """Busca o valor binário: arquivo secret e, em seguida, o ambiente codificado."""
+        if self.config.backends is not None:
+            # Backends armazenam str: o valor é codificado a cada chamada
+            value = self.get(key, default="", required=required, use_secrets=use_secrets)
+            return value.encode(self.config.encoding) if value else None
+
+        prefixed_key, path_str = self._key_info(key)
+        if use_secrets:
+            # Conteúdo já em cache dispensa o cache negativo e a listagem do diretório
+            cache: SecretCache[Any] = self._secret_maps if mapped else self._secret_bytes
+            data = cache.get(path_str) if self.config.cache_secrets else None
+            if data is None and not self._is_secret_missing(key, path_str):
+                data = (
+                    self._map_secret_file(path_str) if mapped else self._read_secret_bytes(path_str)
+                )
+            if data is not None:
+                return data
+
+        env_value = os.environ.get(prefixed_key)
+        if env_value:
+            return env_value.encode(self.config.encoding)
+        if required:
+            raise SecretNotFoundError(key, self._searched_locations(key, use_secrets))
+        return None
+
+    def get_bytes(
+        self,
+        key: str,
+        *,
+        default: bytes | None = None,
+        required: bool = False,
+        use_secrets: bool = True,
+    ) -> bytes | None:
+        """Obtém o conteúdo bruto da variável, sem decodificar nem remover espaços.
+
+        Secrets são lidos uma vez e o mesmo objeto ``bytes`` é devolvido a cada
+        chamada (ex: bundles TLS, chaves JWK, JSON de service accounts).
+
+        Args:
+            key: Nome da variável
+            default: Valor padrão se não encontrada
+            required: Se é obrigatória
+            use_secrets: Se deve buscar em secrets
+
+        Returns:
+            Conteúdo em bytes ou default
+
+        Raises:
+            SecretNotFoundError: Se required=True e variável não encontrada
+        """
+        data = self._get_binary(key, required, use_secrets, mapped=False)
+        return default if data is None else bytes(data)
+
+    def get_buffer(
+        self, key: str, *, required: bool = False, use_secrets: bool = True
+    ) -> memoryview | None:
+        """Obtém uma visão somente leitura do secret, sem copiá-lo (mmap).
+
+        O arquivo é mapeado uma vez por caminho; as páginas são compartilhadas
+        com outros processos pelo page cache. Decodifique sob demanda com
+        ``str(buffer, "utf-8")`` ou passe a visão direto para APIs que aceitam
+        buffers (ex: ``ssl.SSLContext.load_verify_locations(cadata=...)``).
+
+        Args:
+            key: Nome da variável
+            required: Se é obrigatória
+            use_secrets: Se deve buscar em secrets
+
+        Returns:
+            memoryview somente leitura ou None se não encontrada
+
+        Raises:
+            SecretNotFoundError: Se required=True e variável não encontrada
+        """
+        data = self._get_binary(key, required, use_secrets, mapped=True)
+        return None if data is None else memoryview(data).toreadonly()
+
     def get_with_validator(
         self,
         key: str,
@@ -454,27 +1063,219 @@ class EnvLoader:
         Returns:
             Dicionário com todas as variáveis
         """
-        result = dict(os.environ)
+        # Apenas as variáveis com o prefixo são copiadas (índice do env_view)
+        result = self._env_view.items_snapshot()
 
         if include_secrets and self.config.cache_secrets:
-            result.update(self._secrets_cache)
+            secrets = self._secrets_cache.snapshot()
+            threshold = self.config.large_secret_bytes
+            if threshold is not None:
+                # Secrets grandes ficam fora do cache de str: decodifica os mapeados
+                for path_str, buffer in self._secret_maps.snapshot().items():
+                    if len(buffer) >= threshold:
+                        with contextlib.suppress(UnicodeDecodeError):
+                            secrets[path_str] = self._decode_secret_map(buffer)
+            prefix = self.config.prefix
+            result.update(
+                secrets
+                if not prefix
+                else {k: v for k, v in secrets.items() if k.startswith(prefix)}
+            )
+
+        return result
+
+    def env_view(self) -> Mapping[str, str]:
+        """Retorna uma visão somente leitura das variáveis com o prefixo.
 
-        # Filtra por prefixo se configurado
-        if self.config.prefix:
-            result = {k: v for k, v in result.items() if k.startswith(self.config.prefix)}
+        Diferente de ``get_all()``, nada é copiado: os valores são lidos de
+        ``os.environ`` a cada acesso.
 
+        Returns:
+            Mapping somente leitura (PrefixedEnvironView)
+        """
+        return self._env_view
+
+    def prefetch_secrets(
+        self, keys: Iterable[str] | None = None, *, max_workers: int = 8
+    ) -> PrefetchResult:
+        """Lê os secrets em paralelo e preenche o cache de uma só vez.
+
+        Útil no startup quando cada leitura tem latência alta (ex: secrets em
+        NFS): em vez de uma leitura serial por get(), os arquivos são lidos em
+        um pool de threads e publicados juntos no cache.
+
+        Args:
+            keys: Secrets a carregar (None = todos os arquivos de secrets_dir)
+            max_workers: Máximo de leituras simultâneas
+
+        Returns:
+            PrefetchResult com os secrets carregados, os ausentes e a duração
+        """
+        started = time.perf_counter()
+        if not self.config.cache_secrets or self.config.backends is not None:
+            logger.debug("prefetch_secrets ignorado: cache de secrets desativado ou backends")
+            return PrefetchResult((), (), 0.0)
+
+        if keys is None:
+            listing = self._list_secrets_dir() or frozenset()
+            names = sorted(name for name in listing if not name.startswith("."))
+        else:
+            names = list(dict.fromkeys(keys))
+        paths = {name: self._key_info(name)[1] for name in names}
+
+        threshold = self.config.large_secret_bytes
+        mapped: set[str] = set()
+
+        def read(path_str: str) -> tuple[str | None, float]:
+            read_started = time.perf_counter()
+            # Subdiretórios (ex: árvores do Kubernetes) não são secrets
+            if os.path.isdir(path_str):
+                return None, time.perf_counter() - read_started
+            # Secrets grandes ficam apenas mapeados, fora do cache de str
+            if threshold is not None and self._map_secret_file(path_str, threshold) is not None:
+                mapped.add(path_str)
+                return None, time.perf_counter() - read_started
+            value = self._read_secret_file(Path(path_str))
+            return value, time.perf_counter() - read_started
+
+        generation = self._secrets_cache.generation
+        if names:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(names))),
+                thread_name_prefix="django-env-loader-prefetch",
+            ) as executor:
+                reads = dict(zip(names, executor.map(read, paths.values()), strict=True))
+        else:
+            reads = {}
+
+        found = {paths[name]: value for name, (value, _) in reads.items() if value is not None}
+        if not self._secrets_cache.update(found, generation=generation):
+            logger.debug("prefetch_secrets descartado: cache limpo durante a leitura")
+            return PrefetchResult((), (), time.perf_counter() - started)
+
+        found_paths = found.keys() | mapped
+        missing = tuple(name for name in names if paths[name] not in found_paths)
+        ttl = self.config.secrets_negative_ttl
+        if ttl > 0:
+            expires = time.monotonic() + ttl
+            for name in missing:
+                self._mark_secret_missing(paths[name], expires)
+
+        result = PrefetchResult(
+            loaded=tuple(name for name in names if paths[name] in found_paths),
+            missing=missing,
+            seconds=time.perf_counter() - started,
+            timings={name: seconds for name, (_, seconds) in reads.items()},
+        )
+        logger.info(
+            f"Secrets pré-carregados: {len(result.loaded)} em {result.seconds * 1000:.1f} ms "
+            f"({len(missing)} ausentes)"
+        )
         return result
 
+    def invalidate_secret(self, key: str) -> None:
+        """Descarta o cache (positivo e negativo) de um secret específico."""
+        path_str = str(self.config.secrets_dir / key)
+        self._secrets_cache.pop(path_str)
+        self._missing_secrets.pop(path_str, None)
+        self._secret_bytes.pop(path_str)
+        self._secret_maps.pop(path_str)
+        self._secrets_listing = None
+        logger.debug(f"Cache do secret invalidado: {key}")
+
+    def watch(
+        self,
+        *,
+        interval: float = 1.0,
+        use_inotify: bool = True,
+        callbacks: list[ChangeCallback] | None = None,
+    ) -> SecretsWatcher:
+        """Inicia um watcher em background para secrets_dir e o arquivo .env.
+
+        Args:
+            interval: Intervalo (segundos) de polling / timeout de espera
+            use_inotify: Se deve usar inotify (Linux) quando disponível
+            callbacks: Funções chamadas a cada alteração detectada
+
+        Returns:
+            Watcher já iniciado (chame ``stop()`` para encerrar)
+        """
+        from django_env_loader.watcher import SecretsWatcher
+
+        watcher = SecretsWatcher(
+            self, interval=interval, use_inotify=use_inotify, callbacks=callbacks
+        )
+        watcher.start()
+        return watcher
+
+    def load_schema(self, schema: SchemaLike) -> ResolvedSettings:
+        """Resolve um schema declarativo em uma única passada.
+
+        Args:
+            schema: Subclasse de EnvSchema ou dicionário {nome: Field | tipo}
+
+        Returns:
+            Objeto imutável com um atributo por campo
+
+        Raises:
+            SchemaError: Com todos os campos ausentes ou inválidos de uma vez
+        """
+        from django_env_loader.schema import resolve_schema
+
+        return resolve_schema(self, schema)
+
+    def freeze(
+        self,
+        schema: SchemaLike | None = None,
+        *,
+        keys: Iterable[str] | None = None,
+        debug: bool = False,
+    ) -> FrozenEnv:
+        """Congela a configuração atual em um snapshot imutável.
+
+        Depois do freeze as leituras não consultam secrets nem ``os.environ``
+        e cada conversão de tipo é feita uma única vez.
+
+        Args:
+            schema: Schema opcional; seus campos viram atributos do snapshot
+            keys: Secrets/backends a resolver (None = todos os arquivos de secrets_dir)
+            debug: Se as leituras devem avisar quando o ambiente mudar após o freeze
+
+        Returns:
+            FrozenEnv com get/get_bool/get_int/... e os campos do schema
+        """
+        from django_env_loader.frozen import freeze
+
+        return freeze(self, schema, keys=keys, debug=debug)
+
+    def cache_stats(self) -> CacheStats:
+        """Retorna as estatísticas do cache de secrets (acertos, falhas, descartes)."""
+        return self._secrets_cache.stats()
+
     def clear_cache(self) -> None:
-        """Limpa o cache de secrets."""
+        """Limpa o cache de secrets (incluindo o cache negativo)."""
         self._secrets_cache.clear()
+        self._missing_secrets.clear()
+        # Visões (memoryview) já devolvidas mantêm seus mapeamentos vivos
+        self._secret_bytes.clear()
+        self._secret_maps.clear()
+        self._secrets_listing = None
+        self._secrets_listing_mtime = None
+        self._typed_cache.clear()
+        self._key_infos.clear()
+        self._env_view.invalidate()
+        for backend in self.config.backends or ():
+            if isinstance(backend, CachedBackend):
+                backend.clear()
         logger.debug("Cache de secrets limpo")
 
     @classmethod
     def reset_singleton(cls) -> None:
-        """Reset do singleton (útil para testes)."""
-        cls._instance = None
-        cls._initialized = False
+        """Esvazia o registro de loaders (útil para testes)."""
+        with cls._registry_lock:
+            cls._registry.clear()
 
 
 # ============================================================================
@@ -488,11 +1289,10 @@ class DjangoEnvLoader(EnvLoader):
     Fornece helpers específicos para configurações Django comuns.
     """
 
-    def __init__(self, config: EnvConfig | None = None) -> None:
-        """Inicializa com defaults para Django."""
-        if config is None:
-            config = EnvConfig(prefix="DJANGO_", auto_cast=True)
-        super().__init__(config)
+    @classmethod
+    def _default_config(cls) -> EnvConfig:
+        """Defaults para Django (prefixo ``DJANGO_``)."""
+        return EnvConfig(prefix="DJANGO_", auto_cast=True)
 
     def get_database_url(self, default: str | None = None) -> str:
         """Obtém DATABASE_URL com validação básica."""
@@ -504,6 +1304,109 @@ class DjangoEnvLoader(EnvLoader):
             )
         return url
 
+    def get_database_config(
+        self, default: str | None = None, *, key: str = "DATABASE_URL"
+    ) -> dict[str, Any]:
+        """Obtém DATABASE_URL convertida em uma entrada de ``settings.DATABASES``.
+
+        Args:
+            default: URL usada se a variável não existir (None = obrigatória)
+            key: Nome da variável
+
+        Returns:
+            Dicionário com ENGINE, NAME, USER, PASSWORD, HOST, PORT e OPTIONS
+
+        Raises:
+            SecretNotFoundError: Se a variável for obrigatória e não existir
+            ValidationError: Se a URL for inválida
+        """
+        url = self.get(key, required=True) if default is None else self.get(key, default=default)
+        return parse_database_url(url, key=key)
+
+    def _database_url_keys(self) -> list[str]:
+        """Lista as variáveis DATABASE_URL_<ALIAS> disponíveis (ambiente e secrets)."""
+        names: set[str] = set()
+        if self.config.backends is not None:
+            for backend in self.config.backends:
+                names.update(backend.list_keys())
+        else:
+            size = len(self.config.prefix)
+            names.update(key[size:] for key in self._env_view)
+            names.update(self._list_secrets_dir() or ())
+        return sorted(name for name in names if name.startswith(_DATABASE_URL_ALIAS_PREFIX))
+
+    def get_databases(self, default: str | None = None) -> dict[str, dict[str, Any]]:
+        """Monta ``settings.DATABASES`` a partir de DATABASE_URL e DATABASE_URL_<ALIAS>.
+
+        Todas as variáveis são descobertas e lidas de uma vez (uma chamada por
+        backend); o alias é o sufixo em minúsculas.
+
+        Exemplo:
+            DATABASE_URL=postgres://db/app e DATABASE_URL_REPLICA=postgres://replica/app
+            -> {"default": {...}, "replica": {...}}
+
+        Args:
+            default: URL do banco "default" se DATABASE_URL não existir (None = obrigatória)
+
+        Returns:
+            Dicionário alias -> configuração do banco
+
+        Raises:
+            SecretNotFoundError: Se DATABASE_URL for obrigatória e não existir
+            ValidationError: Se alguma URL for inválida
+        """
+        alias_keys = self._database_url_keys()
+        urls = self.get_many(["DATABASE_URL", *alias_keys])
+
+        url = urls.get("DATABASE_URL", default)
+        if url is None:
+            raise SecretNotFoundError(
+                "DATABASE_URL", self._searched_locations("DATABASE_URL", use_secrets=True)
+            )
+
+        databases = {"default": parse_database_url(url)}
+        for key in alias_keys:
+            if key in urls:
+                alias = key[len(_DATABASE_URL_ALIAS_PREFIX) :].lower()
+                databases[alias] = parse_database_url(urls[key], key=key)
+        return databases
+
+    def get_cache_config(
+        self, default: str = "locmem://", *, key: str = "CACHE_URL"
+    ) -> dict[str, Any]:
+        """Obtém CACHE_URL convertida em uma entrada de ``settings.CACHES``.
+
+        Args:
+            default: URL usada se a variável não existir
+            key: Nome da variável
+
+        Returns:
+            Dicionário com BACKEND, LOCATION e opções
+
+        Raises:
+            ValidationError: Se a URL for inválida
+        """
+        return parse_cache_url(self.get(key, default=default), key=key)
+
+    def get_email_config(
+        self, default: str = "smtp://localhost:25", *, key: str = "EMAIL_URL"
+    ) -> dict[str, Any]:
+        """Obtém EMAIL_URL convertida nos settings ``EMAIL_*``.
+
+        Uso: ``globals().update(env.get_email_config())`` no settings.py.
+
+        Args:
+            default: URL usada se a variável não existir
+            key: Nome da variável
+
+        Returns:
+            Dicionário com EMAIL_BACKEND, EMAIL_HOST, EMAIL_PORT, etc.
+
+        Raises:
+            ValidationError: Se a URL for inválida
+        """
+        return parse_email_url(self.get(key, default=default), key=key)
+
     def get_allowed_hosts(self) -> list[str]:
         """Obtém ALLOWED_HOSTS como lista."""
         return self.get_list("ALLOWED_HOSTS", default=["localhost", "127.0.0.1"])
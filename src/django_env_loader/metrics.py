@@ -0,0 +1,185 @@
+"""Instrumentação das buscas do EnvLoader.
+
+Com ``EnvConfig(metrics=...)`` o loader reporta cada consulta a um coletor:
+resultado por origem (cache de secrets, arquivo de secret, cache negativo,
+variável de ambiente, backends), latência das leituras de arquivo e contagem
+de acessos por chave. Sem coletor configurado (padrão) o custo é apenas uma
+verificação de ``None`` por chamada.
+
+Exemplo:
+    >>> metrics = InMemoryMetrics()
+    >>> loader = EnvLoader(EnvConfig(metrics=metrics))
+    >>> api_key = loader.get("API_KEY", default="")
+    >>> metrics.snapshot()["keys"]
+    {'API_KEY': 1}
+
+Para Prometheus ou StatsD basta implementar ``MetricsExporter``
+(``increment`` e ``observe``) e passá-lo para ``InMemoryMetrics(exporter=...)``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any, Protocol, runtime_checkable
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "Histogram",
+    "InMemoryMetrics",
+    "MetricsCollector",
+    "MetricsExporter",
+]
+
+# Limites superiores (segundos) dos buckets de latência
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+
+LOOKUPS_METRIC = "env_loader_lookups_total"
+READ_SECONDS_METRIC = "env_loader_read_seconds"
+KEY_ACCESS_METRIC = "env_loader_key_access_total"
+
+
+@runtime_checkable
+class MetricsCollector(Protocol):
+    """Interface chamada pelo EnvLoader a cada consulta.
+
+    Origens (``source``): ``"secret_cache"``, ``"secret"``, ``"env"`` ou o nome
+    de um backend. Resultados (``outcome``): ``"hit"``, ``"miss"``,
+    ``"negative"`` (secret sabidamente ausente, sem acesso ao disco) e
+    ``"fallback"`` (encontrado no ambiente após falhar em secrets).
+    """
+
+    def record_access(self, key: str) -> None:
+        """Registra uma chamada de ``get`` para a chave."""
+        ...
+
+    def record_lookup(self, key: str, source: str, outcome: str) -> None:
+        """Registra o resultado da consulta a uma origem."""
+        ...
+
+    def record_read(self, source: str, seconds: float) -> None:
+        """Registra a duração de uma leitura (arquivo de secret ou backend)."""
+        ...
+
+
+@runtime_checkable
+class MetricsExporter(Protocol):
+    """Destino externo das métricas (adaptador Prometheus, StatsD, etc.)."""
+
+    def increment(self, name: str, value: int = 1, tags: Mapping[str, str] | None = None) -> None:
+        """Incrementa um contador."""
+        ...
+
+    def observe(self, name: str, value: float, tags: Mapping[str, str] | None = None) -> None:
+        """Registra uma observação em um histograma."""
+        ...
+
+
+class Histogram:
+    """Histograma de buckets fixos (contagens não cumulativas)."""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        # Último bucket recebe os valores acima do maior limite (+Inf)
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Adiciona uma observação."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Retorna contagem, soma e buckets cumulativos (``le`` -> contagem)."""
+        cumulative: dict[str, int] = {}
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts, strict=True):
+            total += count
+            cumulative[f"{bound:g}"] = total
+        return {"count": self.count, "sum": self.sum, "buckets": cumulative}
+
+
+class InMemoryMetrics:
+    """Coletor em memória, seguro para threads, com exportação opcional.
+
+    Cada evento é agregado localmente (``snapshot()``) e, se houver um
+    exporter, repassado a ele imediatamente.
+    """
+
+    def __init__(
+        self,
+        exporter: MetricsExporter | None = None,
+        *,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        export_keys: bool = False,
+    ) -> None:
+        """Inicializa o coletor.
+
+        Args:
+            exporter: Destino externo dos eventos (None = apenas em memória)
+            buckets: Limites dos buckets de latência, em segundos
+            export_keys: Se a contagem por chave também vai para o exporter
+                (desativado por padrão para não criar um label por variável)
+        """
+        self.exporter = exporter
+        self.buckets = buckets
+        self.export_keys = export_keys
+        self._lock = threading.Lock()
+        self._lookups: Counter[tuple[str, str]] = Counter()
+        self._keys: Counter[str] = Counter()
+        self._reads: dict[str, Histogram] = {}
+
+    def record_access(self, key: str) -> None:
+        """Registra uma chamada de ``get`` para a chave."""
+        with self._lock:
+            self._keys[key] += 1
+        if self.exporter is not None and self.export_keys:
+            self.exporter.increment(KEY_ACCESS_METRIC, 1, {"key": key})
+
+    def record_lookup(self, key: str, source: str, outcome: str) -> None:
+        """Registra o resultado da consulta a uma origem."""
+        with self._lock:
+            self._lookups[source, outcome] += 1
+        if self.exporter is not None:
+            self.exporter.increment(LOOKUPS_METRIC, 1, {"source": source, "outcome": outcome})
+
+    def record_read(self, source: str, seconds: float) -> None:
+        """Registra a duração de uma leitura."""
+        with self._lock:
+            histogram = self._reads.get(source)
+            if histogram is None:
+                histogram = self._reads[source] = Histogram(self.buckets)
+            histogram.observe(seconds)
+        if self.exporter is not None:
+            self.exporter.observe(READ_SECONDS_METRIC, seconds, {"source": source})
+
+    def snapshot(self) -> dict[str, Any]:
+        """Retorna uma cópia das métricas agregadas.
+
+        Returns:
+            Dicionário com ``lookups`` ({origem: {resultado: contagem}}),
+            ``reads`` ({origem: histograma}) e ``keys`` ({chave: acessos})
+        """
+        with self._lock:
+            lookups: dict[str, dict[str, int]] = {}
+            for (source, outcome), count in self._lookups.items():
+                lookups.setdefault(source, {})[outcome] = count
+            return {
+                "lookups": lookups,
+                "reads": {source: hist.as_dict() for source, hist in self._reads.items()},
+                "keys": dict(self._keys),
+            }
+
+    def reset(self) -> None:
+        """Zera todas as métricas."""
+        with self._lock:
+            self._lookups.clear()
+            self._keys.clear()
+            self._reads.clear()
@@ -0,0 +1,295 @@
+"""Schemas declarativos de configuração.
+
+Declara todas as variáveis uma única vez e as resolve em uma só passada sobre
+um snapshot de ``os.environ`` e uma listagem do diretório de secrets. Com
+``EnvConfig.backends``, os valores vêm da cadeia de backends (``get_many``),
+como em ``EnvLoader.get``.
+
+Exemplo:
+    >>> class Settings(EnvSchema):
+    ...     DEBUG = Field(bool, default=False)
+    ...     PORT = Field(int, default=8000)
+    ...     SECRET_KEY = Field(str, required=True)
+    ...     ALLOWED_HOSTS = Field(list, default=["localhost"])
+    >>> settings = loader.load_schema(Settings)
+    >>> settings.PORT
+    8000
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, get_origin, get_type_hints
+
+from django_env_loader.converters import (
+    BoolVocabulary,
+    FrozenDict,
+    FrozenList,
+    compile_converter,
+)
+from django_env_loader.exceptions import (
+    EnvLoaderError,
+    SchemaError,
+    SecretNotFoundError,
+    ValidationError,
+)
+
+if TYPE_CHECKING:
+    from django_env_loader.loader import EnvLoader
+
+__all__ = ["EnvSchema", "Field", "ResolvedSettings", "SchemaLike", "resolve_schema"]
+
+_MISSING: Any = object()
+
+# Valor usado quando o campo não é obrigatório e não declara default
+_TYPE_DEFAULTS: dict[type, Callable[[], Any]] = {
+    str: str,
+    bool: bool,
+    int: int,
+    float: float,
+    list: FrozenList,
+    dict: FrozenDict,
+}
+
+
+@dataclass(frozen=True)
+class Field:
+    """Declaração de uma variável do schema.
+
+    Attributes:
+        cast: Tipo de destino (str, bool, int, float, list ou dict)
+        default: Valor padrão se a variável não for encontrada
+        required: Se a ausência da variável é um erro
+        delimiter: Delimitador para list/dict
+        validator: Função aplicada ao valor convertido (pode transformá-lo)
+        use_secrets: Se deve buscar em Docker secrets
+        env: Nome da variável (None = nome do campo)
+    """
+
+    cast: type = str
+    default: Any = _MISSING
+    required: bool = False
+    delimiter: str = ","
+    validator: Callable[[Any], Any] | None = None
+    use_secrets: bool = True
+    env: str | None = None
+
+    def __post_init__(self) -> None:
+        """Valida a declaração do campo."""
+        if self.cast not in _TYPE_DEFAULTS:
+            raise TypeError(f"Tipo não suportado em Field: {self.cast!r}")
+
+    def convert(self, raw: str, vocabulary: BoolVocabulary | None = None) -> Any:
+        """Converte o valor bruto para o tipo declarado.
+
+        Args:
+            raw: Valor bruto
+            vocabulary: Palavras aceitas para bool (None = vocabulário padrão)
+        """
+        return compile_converter(self.cast, delimiter=self.delimiter, vocabulary=vocabulary)(raw)
+
+    def default_value(self) -> Any:
+        """Retorna o default declarado (congelado) ou o default do tipo."""
+        if self.default is _MISSING:
+            return _TYPE_DEFAULTS[self.cast]()
+        if isinstance(self.default, list):
+            return FrozenList(self.default)
+        if isinstance(self.default, dict):
+            return FrozenDict(self.default)
+        return self.default
+
+
+class ResolvedSettings:
+    """Base dos objetos imutáveis (com ``__slots__``) retornados pelos schemas."""
+
+    __slots__ = ()
+    _field_names: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, **values: Any) -> None:
+        for name in self._field_names:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        for name in self._field_names:
+            yield name, getattr(self, name)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return dict(self) == dict(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Retorna os valores resolvidos como dicionário."""
+        return dict(self)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(self._field_names)
+        return f"<{type(self).__name__} ({fields})>"
+
+
+class EnvSchema:
+    """Base para schemas declarados como classe.
+
+    Campos podem ser instâncias de ``Field`` ou anotações simples com default:
+    ``PORT: int = 8000``.
+    """
+
+    _fields: ClassVar[dict[str, Field]] = {}
+    _settings_class: ClassVar[type[ResolvedSettings] | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        fields: dict[str, Field] = {}
+        for base in reversed(cls.__mro__[1:]):
+            fields.update(getattr(base, "_fields", {}))
+
+        hints = get_type_hints(cls)
+        for name, hint in hints.items():
+            if name.startswith("_") or get_origin(hint) is ClassVar or hint is ClassVar:
+                continue
+            value = cls.__dict__.get(name, _MISSING)
+            if isinstance(value, Field):
+                continue
+            cast = get_origin(hint) or hint
+            fields[name] = Field(cast, default=value, required=value is _MISSING)
+
+        for name, value in cls.__dict__.items():
+            if isinstance(value, Field):
+                fields[name] = value
+
+        cls._fields = fields
+        cls._settings_class = None
+
+
+SchemaLike = type[EnvSchema] | Mapping[str, "Field | type"]
+
+
+def _collect_fields(schema: SchemaLike) -> dict[str, Field]:
+    """Normaliza um schema (classe ou dicionário) em {nome: Field}."""
+    if isinstance(schema, type) and issubclass(schema, EnvSchema):
+        return schema._fields
+    return {name: spec if isinstance(spec, Field) else Field(spec) for name, spec in schema.items()}
+
+
+def _settings_class_for(schema: SchemaLike, names: tuple[str, ...]) -> type[ResolvedSettings]:
+    """Cria (e, para schemas-classe, memoriza) a classe de settings com slots."""
+    if isinstance(schema, type) and issubclass(schema, EnvSchema):
+        if schema._settings_class is None:
+            schema._settings_class = _make_settings_class(f"{schema.__name__}Settings", names)
+        return schema._settings_class
+    return _make_settings_class("ResolvedEnvSettings", names)
+
+
+def _make_settings_class(name: str, names: tuple[str, ...]) -> type[ResolvedSettings]:
+    return type(name, (ResolvedSettings,), {"__slots__": names, "_field_names": names})
+
+
+def _direct_lookup(
+    loader: EnvLoader, fields: Mapping[str, Field]
+) -> Callable[[str, bool], str | None]:
+    """Busca em secrets_dir (filtrada pela listagem) e em um snapshot de os.environ."""
+    from django_env_loader.loader import _is_nested_secret_key
+
+    environ = dict(os.environ)
+    listing = loader._list_secrets_dir() if any(f.use_secrets for f in fields.values()) else None
+
+    def lookup(key: str, use_secrets: bool) -> str | None:
+        raw: str | None = None
+        if use_secrets and (listing is None or key in listing or _is_nested_secret_key(key)):
+            raw = loader._get_from_secret(key)
+        if raw is None:
+            raw = environ.get(loader._get_prefixed_key(key))
+        return raw
+
+    return lookup
+
+
+def _backend_lookup(
+    loader: EnvLoader, fields: Mapping[str, Field]
+) -> Callable[[str, bool], str | None]:
+    """Busca na cadeia de backends, com um get_many por modo (com e sem secrets)."""
+    keys: dict[bool, list[str]] = {True: [], False: []}
+    for name, spec in fields.items():
+        keys[spec.use_secrets].append(spec.env or name)
+    found = {
+        use_secrets: loader.get_many(names, use_secrets=use_secrets) if names else {}
+        for use_secrets, names in keys.items()
+    }
+
+    def lookup(key: str, use_secrets: bool) -> str | None:
+        return found[use_secrets].get(key)
+
+    return lookup
+
+
+def resolve_schema(
+    loader: EnvLoader,
+    schema: SchemaLike,
+    *,
+    timings: dict[str, float] | None = None,
+) -> ResolvedSettings:
+    """Resolve todos os campos do schema em uma única passada.
+
+    Args:
+        loader: Loader usado para prefixo e leitura de secrets
+        schema: Subclasse de EnvSchema ou dicionário {nome: Field | tipo}
+        timings: Se fornecido, recebe o tempo (segundos) de resolução de cada campo
+
+    Returns:
+        Objeto imutável com um atributo por campo
+
+    Raises:
+        SchemaError: Com todos os campos ausentes ou inválidos
+    """
+    fields = _collect_fields(schema)
+    lookup = (
+        _direct_lookup(loader, fields)
+        if loader.config.backends is None
+        else _backend_lookup(loader, fields)
+    )
+
+    vocabulary = loader.config.bool_vocabulary
+    values: dict[str, Any] = {}
+    errors: list[EnvLoaderError] = []
+
+    for name, spec in fields.items():
+        started = time.perf_counter()
+        key = spec.env or name
+        raw = lookup(key, spec.use_secrets)
+
+        if raw is None or not raw.strip():
+            if spec.required:
+                errors.append(
+                    SecretNotFoundError(key, loader._searched_locations(key, spec.use_secrets))
+                )
+            else:
+                values[name] = spec.default_value()
+        else:
+            try:
+                value = spec.convert(raw, vocabulary)
+                values[name] = spec.validator(value) if spec.validator else value
+            except ValidationError as e:
+                errors.append(ValidationError(key, raw, e.reason))
+            except Exception as e:
+                errors.append(ValidationError(key, raw, str(e)))
+
+        if timings is not None:
+            timings[name] = time.perf_counter() - started
+
+    if errors:
+        raise SchemaError(errors)
+
+    names = tuple(fields)
+    return _settings_class_for(schema, names)(**values)
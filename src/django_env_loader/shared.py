@@ -0,0 +1,210 @@
+"""Configuração resolvida compartilhada entre processos (servidores prefork).
+
+O processo mestre resolve a configuração uma vez (valores do .env e conteúdo
+dos Docker secrets) e a publica em um arquivo em ``/dev/shm``. Cada worker, ao
+criar o EnvLoader com ``EnvConfig(shared_config=...)``, mapeia o arquivo em
+modo somente leitura (mmap) em vez de reparsear o .env e reler os secrets.
+
+Exemplo (entrypoint do container):
+    $ python -m django_env_loader.shared publish /dev/shm/myapp-config
+    $ exec gunicorn myapp.wsgi
+
+    # settings.py
+    env = EnvLoader(EnvConfig(shared_config="/dev/shm/myapp-config"))
+
+O arquivo contém secrets em texto puro: é criado com permissão 0600 e deve
+ficar em um tmpfs (``/dev/shm``) visível apenas para o container. ``attach``
+recusa links simbólicos e arquivos de outro usuário ou legíveis por grupo/outros,
+já que o caminho padrão é previsível e ``/dev/shm`` é compartilhado.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import marshal
+import mmap
+import os
+import stat
+import sys
+import tempfile
+import time
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from django_env_loader.loader import EnvLoader
+
+__all__ = ["SharedConfig", "attach", "default_shared_path", "publish"]
+
+logger = logging.getLogger(__name__)
+
+_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class SharedConfig:
+    """Configuração publicada pelo processo mestre.
+
+    Attributes:
+        env: Valores do .env
+        secrets: Conteúdo dos secrets, por nome
+        secrets_dir: Diretório de secrets usado na publicação
+        created_at: Instante (epoch) da publicação
+    """
+
+    env: dict[str, str]
+    secrets: dict[str, str]
+    secrets_dir: str
+    created_at: float
+
+
+def default_shared_path(name: str = "django-env-loader") -> Path:
+    """Retorna o caminho padrão do arquivo compartilhado (``/dev/shm`` se existir)."""
+    base = Path("/dev/shm")
+    if not base.is_dir():
+        base = Path(tempfile.gettempdir())
+    return base / f"{name}-{os.getuid() if hasattr(os, 'getuid') else 0}"
+
+
+def _list_secret_names(secrets_dir: Path) -> list[str]:
+    """Lista os arquivos de secrets (ignora ocultos e diretórios internos do Kubernetes)."""
+    try:
+        return sorted(
+            entry.name
+            for entry in os.scandir(secrets_dir)
+            if not entry.name.startswith(".") and entry.is_file()
+        )
+    except OSError:
+        return []
+
+
+def publish(
+    loader: EnvLoader, path: Path | str | None = None, *, keys: list[str] | None = None
+) -> Path:
+    """Resolve a configuração e grava o arquivo compartilhado de forma atômica.
+
+    Args:
+        loader: Loader do processo mestre
+        path: Destino (None = default_shared_path())
+        keys: Secrets publicados (None = todos os arquivos de secrets_dir)
+
+    Returns:
+        Caminho do arquivo publicado
+    """
+    target = Path(path) if path is not None else default_shared_path()
+    secrets_dir = loader.config.secrets_dir
+    names = keys if keys is not None else _list_secret_names(secrets_dir)
+
+    secrets: dict[str, str] = {}
+    for name in names:
+        value = loader._get_from_secret(name)
+        if value is not None:
+            secrets[name] = value
+
+    payload = marshal.dumps(
+        {
+            "format": _FORMAT,
+            "env": loader._read_env_file_values(),
+            "secrets": secrets,
+            "secrets_dir": str(secrets_dir),
+            "created_at": time.time(),
+        }
+    )
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        # mkstemp já cria com 0600
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(temp_name, target)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+    logger.debug(f"Configuração compartilhada publicada: {target} ({len(secrets)} secrets)")
+    return target
+
+
+def _untrusted_reason(info: os.stat_result) -> str | None:
+    """Motivo para recusar o arquivo compartilhado (None = confiável)."""
+    if not stat.S_ISREG(info.st_mode):
+        return "não é um arquivo regular"
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        return f"dono uid={info.st_uid}"
+    if info.st_mode & 0o077:
+        return f"permissões {stat.S_IMODE(info.st_mode):o}"
+    return None
+
+
+def attach(path: Path | str) -> SharedConfig | None:
+    """Mapeia o arquivo compartilhado em modo somente leitura.
+
+    Args:
+        path: Arquivo publicado por ``publish``
+
+    Returns:
+        SharedConfig ou None se o arquivo não existir, for inválido ou não for
+        confiável (link simbólico, outro dono ou permissões abertas)
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError as e:
+        logger.debug(f"Configuração compartilhada indisponível em {path}: {e}")
+        return None
+
+    try:
+        info = os.fstat(fd)
+        problem = _untrusted_reason(info)
+        if problem is not None:
+            logger.warning(f"Configuração compartilhada ignorada ({problem}): {path}")
+            return None
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            data = marshal.loads(mm)
+    except (OSError, ValueError, EOFError, TypeError) as e:
+        logger.debug(f"Configuração compartilhada indisponível em {path}: {e}")
+        return None
+    finally:
+        os.close(fd)
+
+    if not isinstance(data, dict) or data.get("format") != _FORMAT:
+        logger.warning(f"Configuração compartilhada em formato desconhecido: {path}")
+        return None
+    return SharedConfig(
+        env=data["env"],
+        secrets=data["secrets"],
+        secrets_dir=data["secrets_dir"],
+        created_at=data["created_at"],
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI: ``python -m django_env_loader.shared publish [PATH]``."""
+    from django_env_loader.loader import EnvConfig, EnvLoader
+
+    parser = argparse.ArgumentParser(description="Configuração compartilhada entre workers")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    publish_parser = subparsers.add_parser("publish", help="Resolve e publica a configuração")
+    publish_parser.add_argument("path", nargs="?", type=Path, help="Destino do arquivo")
+    publish_parser.add_argument("--env-file", type=Path, help="Arquivo .env")
+    publish_parser.add_argument("--secrets-dir", type=Path, default=Path("/run/secrets"))
+    publish_parser.add_argument("--key", action="append", dest="keys", help="Secret publicado")
+    args = parser.parse_args(argv)
+
+    env_file = args.env_file
+    if env_file is None and Path(".env").is_file():
+        env_file = Path(".env")
+    loader = EnvLoader(
+        EnvConfig(env_file=env_file, secrets_dir=args.secrets_dir, warn_on_missing=False)
+    )
+    try:
+        target = publish(loader, args.path, keys=args.keys)
+    except OSError as e:
+        print(f"Erro ao publicar: {e}", file=sys.stderr)
+        return 1
+    print(target)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""Snapshot pré-compilado do .env.
+
+O snapshot guarda os valores já parseados ao lado do arquivo (``.env`` ->
+``.env.snapshot``), identificado por caminho, tamanho, mtime e hash SHA-256 do
+conteúdo. Com ``EnvConfig(env_snapshot=True)`` cada processo carrega o snapshot
+diretamente, e ele só é reconstruído quando o .env muda.
+
+Para gerar o snapshot no build da imagem:
+    $ python -m django_env_loader.snapshot .env
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import logging
+import marshal
+import os
+import sys
+import tempfile
+
+from pathlib import Path
+
+from django_env_loader.envfile import parse_env
+from django_env_loader.exceptions import EnvFileSyntaxError
+
+__all__ = [
+    "SNAPSHOT_SUFFIX",
+    "compile_snapshot",
+    "load_or_compile",
+    "load_snapshot",
+    "snapshot_path",
+]
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".snapshot"
+# Versão do formato; o cache_tag invalida snapshots de outro interpretador
+_FORMAT = (1, sys.implementation.cache_tag)
+
+EnvValues = dict[str, str | None]
+
+
+def snapshot_path(env_path: Path) -> Path:
+    """Retorna o caminho do snapshot de um .env."""
+    return env_path.with_name(env_path.name + SNAPSHOT_SUFFIX)
+
+
+def _read_header(env_path: Path, encoding: str) -> tuple[int, int, bytes, EnvValues] | None:
+    """Lê o snapshot; retorna (tamanho, mtime_ns, hash, valores) ou None se inválido."""
+    try:
+        data = marshal.loads(snapshot_path(env_path).read_bytes())
+        fmt, source, size, mtime_ns, digest, snapshot_encoding, values = data
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if fmt != _FORMAT or source != str(env_path.resolve()) or snapshot_encoding != encoding:
+        return None
+    return size, mtime_ns, digest, values
+
+
+def _write(
+    env_path: Path, stat: os.stat_result, digest: bytes, encoding: str, values: EnvValues
+) -> None:
+    """Grava o snapshot de forma atômica (falhas de escrita são apenas logadas)."""
+    target = snapshot_path(env_path)
+    payload = marshal.dumps(
+        (_FORMAT, str(env_path.resolve()), stat.st_size, stat.st_mtime_ns, digest, encoding, values)
+    )
+    try:
+        fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(temp_name, target)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+    except OSError as e:
+        # Ex: sistema de arquivos somente leitura no container
+        logger.debug(f"Não foi possível gravar {target}: {e}")
+        return
+    logger.debug(f"Snapshot do .env gravado: {target}")
+
+
+def load_snapshot(env_path: Path | str, *, encoding: str = "utf-8") -> EnvValues | None:
+    """Carrega o snapshot se ainda corresponder ao .env (sem reler o arquivo).
+
+    Args:
+        env_path: Caminho do .env
+        encoding: Encoding usado no parse
+
+    Returns:
+        Valores do snapshot ou None se ausente ou desatualizado
+    """
+    env_path = Path(env_path)
+    header = _read_header(env_path, encoding)
+    if header is None:
+        return None
+    try:
+        stat = os.stat(env_path)
+    except OSError:
+        return None
+    size, mtime_ns, _, values = header
+    if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+        return None
+    return values
+
+
+def compile_snapshot(env_path: Path | str, *, encoding: str = "utf-8") -> EnvValues:
+    """Parseia o .env e grava o snapshot.
+
+    Args:
+        env_path: Caminho do .env
+        encoding: Encoding do arquivo
+
+    Returns:
+        Valores parseados
+
+    Raises:
+        EnvFileSyntaxError: Se o .env exigir o python-dotenv (nada é gravado)
+    """
+    env_path = Path(env_path)
+    stat = os.stat(env_path)
+    content = env_path.read_bytes()
+    values = parse_env(content.decode(encoding))
+    _write(env_path, stat, hashlib.sha256(content).digest(), encoding, values)
+    return values
+
+
+def load_or_compile(env_path: Path | str, *, encoding: str = "utf-8") -> EnvValues:
+    """Usa o snapshot válido ou reconstrói a partir do .env.
+
+    Tamanho e mtime iguais aceitam o snapshot sem ler o .env. Se apenas o mtime
+    mudou (ex: arquivo copiado), o hash do conteúdo decide se o snapshot ainda
+    vale, evitando um novo parse.
+
+    Raises:
+        EnvFileSyntaxError: Se o .env exigir o python-dotenv
+    """
+    env_path = Path(env_path)
+    header = _read_header(env_path, encoding)
+    stat = os.stat(env_path)
+    if header is not None:
+        size, mtime_ns, digest, values = header
+        if (stat.st_size, stat.st_mtime_ns) == (size, mtime_ns):
+            return values
+        if stat.st_size == size:
+            content = env_path.read_bytes()
+            if hashlib.sha256(content).digest() == digest:
+                _write(env_path, stat, digest, encoding, values)
+                return values
+    return compile_snapshot(env_path, encoding=encoding)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Gera snapshots para os arquivos informados."""
+    parser = argparse.ArgumentParser(description="Pré-compila arquivos .env em snapshots")
+    parser.add_argument("env_files", nargs="*", type=Path, default=[Path(".env")])
+    parser.add_argument("--encoding", default="utf-8", help="Encoding dos arquivos")
+    args = parser.parse_args(argv)
+
+    status = 0
+    for env_path in args.env_files:
+        try:
+            values = compile_snapshot(env_path, encoding=args.encoding)
+        except (OSError, UnicodeDecodeError, EnvFileSyntaxError) as e:
+            print(f"{env_path}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        print(f"{snapshot_path(env_path)}: {len(values)} variáveis")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,323 @@
+"""Recarga automática de Docker secrets e do arquivo .env.
+
+Um thread em background observa ``secrets_dir`` e o arquivo .env usando inotify
+(Linux) quando disponível, com fallback para polling de mtime. Apenas as
+entradas alteradas são invalidadas no cache de secrets, mantendo leituras na
+velocidade do cache sem servir valores desatualizados.
+
+Exemplo:
+    >>> watcher = loader.watch(callbacks=[lambda event: print(event)])
+    >>> ...
+    >>> watcher.stop()
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import threading
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from django_env_loader.loader import EnvLoader
+
+__all__ = ["ChangeCallback", "ChangeEvent", "SecretsWatcher"]
+
+logger = logging.getLogger(__name__)
+
+# Constantes de <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Assinatura de arquivo usada no polling: (mtime_ns, tamanho, inode)
+_FileSignature = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """Alteração detectada pelo watcher.
+
+    Attributes:
+        source: Origem da alteração ("secret" ou "env_file")
+        name: Nome do secret ou das variáveis alteradas (separadas por vírgula)
+        path: Caminho observado
+    """
+
+    source: Literal["secret", "env_file"]
+    name: str
+    path: Path
+
+
+ChangeCallback = Callable[[ChangeEvent], None]
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    """Carrega a libc com suporte a inotify, se disponível."""
+    library = ctypes.util.find_library("c")
+    try:
+        libc = ctypes.CDLL(library, use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+class SecretsWatcher:
+    """Observa secrets_dir e o arquivo .env, invalidando o cache do loader."""
+
+    def __init__(
+        self,
+        loader: EnvLoader,
+        *,
+        interval: float = 1.0,
+        use_inotify: bool = True,
+        callbacks: list[ChangeCallback] | None = None,
+    ) -> None:
+        """Inicializa o watcher (sem iniciar o thread).
+
+        Args:
+            loader: Loader cujo cache será invalidado
+            interval: Intervalo (segundos) de polling / timeout de espera
+            use_inotify: Se deve usar inotify quando disponível
+            callbacks: Funções chamadas a cada alteração detectada
+        """
+        self.loader = loader
+        self.interval = interval
+        self.callbacks: list[ChangeCallback] = list(callbacks or [])
+        self.secrets_dir = Path(loader.config.secrets_dir)
+        self.env_file = loader._env_file_path()
+
+        self._libc = _load_libc() if use_inotify else None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._inotify: tuple[int, int | None, int | None] | None = None
+        self._secret_signatures = self._scan_secrets()
+        self._env_signature = self._stat(self.env_file)
+        loader.snapshot_env_file()
+
+    @property
+    def backend(self) -> str:
+        """Mecanismo de observação ("inotify" ou "polling")."""
+        return "inotify" if self._libc is not None else "polling"
+
+    @property
+    def is_running(self) -> bool:
+        """Indica se o thread do watcher está ativo."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def on_change(self, callback: ChangeCallback) -> ChangeCallback:
+        """Registra um callback de alteração (pode ser usado como decorator)."""
+        self.callbacks.append(callback)
+        return callback
+
+    def start(self) -> None:
+        """Inicia o thread de observação em background."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        # Os watches são registrados antes de retornar, sem janela de corrida
+        if self._libc is not None and self._inotify is None and not self._open_inotify():
+            self._libc = None
+        self._thread = threading.Thread(
+            target=self._run, name="django-env-loader-watcher", daemon=True
+        )
+        self._thread.start()
+        logger.debug(f"Watcher iniciado ({self.backend})")
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Encerra o thread de observação."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout if timeout is not None else self.interval * 2)
+            self._thread = None
+
+    def __enter__(self) -> SecretsWatcher:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Processamento de alterações
+    # ------------------------------------------------------------------
+
+    def _emit(self, event: ChangeEvent) -> None:
+        for callback in self.callbacks:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception(f"Erro no callback do watcher para {event}")
+
+    def _secret_changed(self, name: str) -> None:
+        # Volumes do Kubernetes trocam o link "..data" atomicamente: tudo mudou
+        if name.startswith(".."):
+            self.loader.clear_cache()
+        else:
+            self.loader.invalidate_secret(name)
+        self._emit(ChangeEvent("secret", name, self.secrets_dir / name))
+
+    def _env_file_changed(self) -> None:
+        changed = self.loader.reload_env_file()
+        if changed and self.env_file is not None:
+            self._emit(ChangeEvent("env_file", ",".join(sorted(changed)), self.env_file))
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _stat(path: Path | None) -> _FileSignature | None:
+        if path is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _scan_secrets(self) -> dict[str, _FileSignature]:
+        signatures: dict[str, _FileSignature] = {}
+        try:
+            entries = list(os.scandir(self.secrets_dir))
+        except OSError:
+            return signatures
+        for entry in entries:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            signatures[entry.name] = (st.st_mtime_ns, st.st_size, st.st_ino)
+        return signatures
+
+    def poll_once(self) -> None:
+        """Compara as assinaturas dos arquivos e processa o que mudou."""
+        current = self._scan_secrets()
+        previous = self._secret_signatures
+        self._secret_signatures = current
+        for name in current.keys() | previous.keys():
+            if current.get(name) != previous.get(name):
+                self._secret_changed(name)
+
+        env_signature = self._stat(self.env_file)
+        if env_signature != self._env_signature:
+            self._env_signature = env_signature
+            self._env_file_changed()
+
+    def _run_polling(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.poll_once()
+            except Exception:
+                logger.exception("Erro no polling do watcher")
+
+    # ------------------------------------------------------------------
+    # inotify
+    # ------------------------------------------------------------------
+
+    def _add_watch(self, fd: int, path: Path) -> int | None:
+        assert self._libc is not None
+        wd = self._libc.inotify_add_watch(fd, os.fsencode(path), _IN_WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            logger.debug(f"inotify_add_watch falhou para {path}: {os.strerror(errno)}")
+            return None
+        return int(wd)
+
+    def _open_inotify(self) -> bool:
+        """Cria o descritor inotify e registra os watches; False se indisponível."""
+        assert self._libc is not None
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return False
+
+        secrets_wd = self._add_watch(fd, self.secrets_dir)
+        env_wd = None
+        if self.env_file is not None:
+            # Observa o diretório para capturar substituições atômicas (rename)
+            env_wd = self._add_watch(fd, self.env_file.parent)
+        if secrets_wd is None and env_wd is None:
+            os.close(fd)
+            return False
+
+        self._inotify = (fd, secrets_wd, env_wd)
+        return True
+
+    def _run_inotify(self) -> None:
+        assert self._inotify is not None
+        fd, secrets_wd, env_wd = self._inotify
+        try:
+            while not self._stop_event.is_set():
+                readable, _, _ = select.select([fd], [], [], self.interval)
+                if not readable:
+                    continue
+                try:
+                    data = os.read(fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                self._dispatch_inotify(data, secrets_wd, env_wd)
+        finally:
+            os.close(fd)
+            self._inotify = None
+
+    def _dispatch_inotify(self, data: bytes, secrets_wd: int | None, env_wd: int | None) -> None:
+        secret_names: set[str] = set()
+        env_changed = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if wd == env_wd and self.env_file is not None and name == self.env_file.name:
+                env_changed = True
+            if wd == secrets_wd and name:
+                secret_names.add(name)
+
+        # Coalesce eventos repetidos (ex: CREATE + MODIFY + CLOSE_WRITE)
+        for name in sorted(secret_names):
+            self._secret_changed(name)
+        if env_changed:
+            self._env_file_changed()
+
+    def _run(self) -> None:
+        if self._inotify is not None:
+            try:
+                self._run_inotify()
+                return
+            except Exception:
+                logger.exception("Erro no watcher inotify; usando polling")
+                self._libc = None
+                # Reinicia as assinaturas para não acusar alterações antigas
+                self._secret_signatures = self._scan_secrets()
+                self._env_signature = self._stat(self.env_file)
+        self._run_polling()
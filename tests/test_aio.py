@@ -0,0 +1,174 @@
+"""Testes para a API assíncrona."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from django_env_loader import EnvConfig, EnvLoader, SecretNotFoundError
+from django_env_loader.aio import AsyncEnvLoader
+from django_env_loader.backends import EnvBackend, FileDirBackend
+
+
+class MemoryBackend:
+    """Backend de secrets em memória."""
+
+    name = "memory"
+    is_secret = True
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def get_many(self, keys):
+        return {key: self.values[key] for key in keys if key in self.values}
+
+    def list_keys(self):
+        return set(self.values)
+
+
+class TestAsyncEnvLoader:
+    """Testes para AsyncEnvLoader."""
+
+    def test_aget_secret_and_env(self, temp_secrets_dir, monkeypatch):
+        """Testa aget com secret e fallback para env."""
+        monkeypatch.setenv("PLAIN", "from_env")
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+
+        async def main():
+            async with AsyncEnvLoader(loader) as aloader:
+                return await aloader.aget("API_KEY"), await aloader.aget("PLAIN")
+
+        assert asyncio.run(main()) == ("api_key_value", "from_env")
+
+    def test_aget_required_missing(self, temp_secrets_dir):
+        """Testa que aget required levanta erro com os locais buscados."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+
+        async def main():
+            async with AsyncEnvLoader(loader) as aloader:
+                await aloader.aget("MISSING_KEY", required=True)
+
+        with pytest.raises(SecretNotFoundError) as exc_info:
+            asyncio.run(main())
+        assert len(exc_info.value.searched_locations) == 2
+
+    def test_empty_secret_hides_env(self, tmp_path, monkeypatch):
+        """Testa que secret vazio retorna o default sem cair no env, como get()."""
+        (tmp_path / "EMPTY").write_text("")
+        monkeypatch.setenv("EMPTY", "from_env")
+        loader = EnvLoader(EnvConfig(secrets_dir=tmp_path))
+
+        async def main():
+            async with AsyncEnvLoader(loader) as aloader:
+                return await aloader.aget("EMPTY", default="dflt")
+
+        assert asyncio.run(main()) == loader.get("EMPTY", default="dflt") == "dflt"
+
+    def test_aget_many(self, temp_secrets_dir):
+        """Testa resolução concorrente de várias chaves."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+
+        async def main():
+            async with AsyncEnvLoader(loader) as aloader:
+                return await aloader.aget_many(["API_KEY", "DB_PASSWORD", "MISSING_KEY"])
+
+        assert asyncio.run(main()) == {
+            "API_KEY": "api_key_value",
+            "DB_PASSWORD": "secret123",
+            "MISSING_KEY": None,
+        }
+
+    def test_concurrent_awaits_share_read(self, temp_secrets_dir, mocker):
+        """Testa que awaits concorrentes compartilham uma única leitura."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, cache_secrets=False))
+        calls = []
+        original = loader._get_from_secret
+
+        def slow_read(key):
+            calls.append(threading.get_ident())
+            time.sleep(0.05)
+            return original(key)
+
+        mocker.patch.object(loader, "_get_from_secret", side_effect=slow_read)
+
+        async def main():
+            async with AsyncEnvLoader(loader) as aloader:
+                return await asyncio.gather(*(aloader.aget_secret("API_KEY") for _ in range(10)))
+
+        assert asyncio.run(main()) == ["api_key_value"] * 10
+        assert len(calls) == 1
+        assert threading.get_ident() not in calls
+
+
+class TestAsyncEnvLoaderBackends:
+    """Testes de AsyncEnvLoader com EnvConfig.backends."""
+
+    def test_chain_order_matches_get(self, tmp_path, monkeypatch):
+        """Testa que aget respeita a ordem da cadeia, como get()."""
+        (tmp_path / "TOKEN").write_text("from_dir")
+        monkeypatch.setenv("TOKEN", "from_env")
+        loader = EnvLoader(EnvConfig(backends=[EnvBackend(), FileDirBackend(tmp_path)]))
+
+        async def main():
+            async with AsyncEnvLoader(loader) as aloader:
+                return await aloader.aget("TOKEN")
+
+        assert asyncio.run(main()) == loader.get("TOKEN") == "from_env"
+
+    def test_custom_backend(self, monkeypatch):
+        """Testa chave servida apenas por um backend customizado."""
+        monkeypatch.delenv("ONLY_MEMORY", raising=False)
+        loader = EnvLoader(
+            EnvConfig(backends=[MemoryBackend({"ONLY_MEMORY": "value"}), EnvBackend()])
+        )
+
+        async def main():
+            async with AsyncEnvLoader(loader) as aloader:
+                return (
+                    await aloader.aget("ONLY_MEMORY", required=True),
+                    await aloader.aget_secret("ONLY_MEMORY"),
+                    await aloader.aget("ONLY_MEMORY", default="dflt", use_secrets=False),
+                )
+
+        assert asyncio.run(main()) == ("value", "value", "dflt")
+        assert loader.get("ONLY_MEMORY") == "value"
+
+    def test_concurrent_awaits_share_backend_read(self):
+        """Testa que awaits concorrentes compartilham uma única consulta à cadeia."""
+        calls = []
+
+        class SlowBackend(MemoryBackend):
+            def get(self, key):
+                calls.append(threading.get_ident())
+                time.sleep(0.05)
+                return super().get(key)
+
+        loader = EnvLoader(EnvConfig(backends=[SlowBackend({"SLOW": "value"})]))
+
+        async def main():
+            async with AsyncEnvLoader(loader) as aloader:
+                return await asyncio.gather(
+                    *(aloader.aget("SLOW") for _ in range(5)),
+                    *(aloader.aget("SLOW", required=True) for _ in range(5)),
+                )
+
+        assert asyncio.run(main()) == ["value"] * 10
+        assert len(calls) == 1
+        assert threading.get_ident() not in calls
+
+    def test_missing_with_backends(self):
+        """Testa default e required com a cadeia de backends."""
+        loader = EnvLoader(EnvConfig(backends=[MemoryBackend({})]))
+
+        async def main():
+            async with AsyncEnvLoader(loader) as aloader:
+                assert await aloader.aget("ABSENT", default="dflt") == "dflt"
+                await aloader.aget("ABSENT", required=True)
+
+        with pytest.raises(SecretNotFoundError) as exc_info:
+            asyncio.run(main())
+        assert exc_info.value.searched_locations == ["memory:ABSENT"]
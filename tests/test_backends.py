@@ -0,0 +1,209 @@
+"""Testes para os backends plugáveis."""
+
+import os
+
+import pytest
+
+import django_env_loader.backends as backends_module
+
+from django_env_loader import EnvConfig, EnvLoader, SecretNotFoundError
+from django_env_loader.backends import (
+    CachedBackend,
+    CachePolicy,
+    DotenvBackend,
+    EnvBackend,
+    FileDirBackend,
+    SecretBackend,
+)
+
+
+class CountingBackend:
+    """Backend em memória que conta as chamadas recebidas."""
+
+    name = "memory"
+    is_secret = True
+
+    def __init__(self, values):
+        self.values = values
+        self.get_calls = 0
+        self.get_many_calls = 0
+
+    def get(self, key):
+        self.get_calls += 1
+        return self.values.get(key)
+
+    def get_many(self, keys):
+        self.get_many_calls += 1
+        return {key: self.values[key] for key in keys if key in self.values}
+
+    def list_keys(self):
+        return set(self.values)
+
+
+class TestBuiltinBackends:
+    """Testes dos backends fornecidos."""
+
+    def test_protocol(self, temp_secrets_dir, temp_env_file):
+        """Testa que os backends implementam o protocolo."""
+        for backend in (
+            FileDirBackend(temp_secrets_dir),
+            EnvBackend(),
+            DotenvBackend(temp_env_file),
+        ):
+            assert isinstance(backend, SecretBackend)
+
+    def test_file_dir_backend(self, temp_secrets_dir):
+        """Testa leitura e listagem de diretório de secrets."""
+        backend = FileDirBackend(temp_secrets_dir)
+        assert backend.get("API_KEY") == "api_key_value"
+        assert backend.get("MISSING") is None
+        assert backend.list_keys() == {"API_KEY", "DB_PASSWORD"}
+        assert backend.get_many(["API_KEY", "MISSING"]) == {"API_KEY": "api_key_value"}
+
+    def test_file_dir_backend_nested(self, tmp_path):
+        """Testa árvore de diretórios key/value."""
+        (tmp_path / "db").mkdir()
+        (tmp_path / "db" / "password").write_text("nested\n")
+        backend = FileDirBackend(tmp_path, nested_separator="__")
+
+        assert backend.get("db__password") == "nested"
+        assert backend.list_keys() == {"db__password"}
+
+    def test_env_backend_prefix(self, monkeypatch):
+        """Testa o backend de ambiente com prefixo."""
+        monkeypatch.setenv("APP_PORT", "80")
+        backend = EnvBackend(prefix="APP_")
+        assert backend.get("PORT") == "80"
+        assert backend.get_many(["PORT", "NOPE"]) == {"PORT": "80"}
+        assert "PORT" in backend.list_keys()
+
+    def test_dotenv_backend_does_not_touch_environ(self, temp_env_file, monkeypatch):
+        """Testa que o backend .env não altera os.environ."""
+        monkeypatch.delenv("PORT", raising=False)
+        backend = DotenvBackend(temp_env_file)
+        assert backend.get("PORT") == "8080"
+        assert backend.get_many(["PORT", "DEBUG"]) == {"PORT": "8080", "DEBUG": "true"}
+        assert "PORT" not in os.environ
+
+
+class TestCachedBackend:
+    """Testes das políticas de cache por backend."""
+
+    def test_positive_and_negative_cache(self):
+        """Testa cache de valores encontrados e de chaves ausentes."""
+        inner = CountingBackend({"A": "1"})
+        backend = CachedBackend(inner, CachePolicy(negative_ttl=60))
+
+        for _ in range(3):
+            assert backend.get("A") == "1"
+            assert backend.get("B") is None
+
+        assert inner.get_calls == 2
+
+    def test_ttl_expiration(self, mocker):
+        """Testa expiração dos valores pelo TTL."""
+        monotonic = mocker.patch("django_env_loader.cache.time.monotonic", return_value=0.0)
+        inner = CountingBackend({"A": "1"})
+        backend = CachedBackend(inner, CachePolicy(ttl=10))
+
+        backend.get("A")
+        inner.values["A"] = "2"
+        assert backend.get("A") == "1"
+
+        monotonic.return_value = 11.0
+        assert backend.get("A") == "2"
+
+    def test_max_size(self):
+        """Testa limite de tamanho do cache."""
+        inner = CountingBackend({"A": "1", "B": "2", "C": "3"})
+        backend = CachedBackend(inner, CachePolicy(max_size=2))
+
+        for key in ("A", "B", "C"):
+            backend.get(key)
+
+        assert len(backend._cache) == 2
+        assert "A" not in backend._cache
+
+    def test_negative_cache_bounded(self, mocker):
+        """Testa que o registro de ausentes respeita max_size, descartando os mais antigos."""
+        inner = CountingBackend({})
+        backend = CachedBackend(inner, CachePolicy(max_size=2, negative_ttl=60))
+
+        for key in ("A", "B", "C"):
+            backend.get(key)
+        assert list(backend._missing) == ["B", "C"]
+
+        backend.get_many([f"K{i}" for i in range(10)])
+        assert list(backend._missing) == ["K8", "K9"]
+
+        mocker.patch.object(backends_module, "_MISSING_KEYS_LIMIT", 3)
+        unbounded = CachedBackend(inner, CachePolicy(negative_ttl=60))
+        for i in range(10):
+            unbounded.get(f"X{i}")
+        assert len(unbounded._missing) == 3
+
+    def test_negative_cache_purges_expired(self, mocker):
+        """Testa que entradas expiradas são removidas ao registrar novas ausências."""
+        monotonic = mocker.patch("django_env_loader.backends.time.monotonic", return_value=0.0)
+        backend = CachedBackend(CountingBackend({}), CachePolicy(negative_ttl=10))
+        backend.get("A")
+        backend.get("B")
+
+        monotonic.return_value = 11.0
+        backend.get("C")
+
+        assert list(backend._missing) == ["C"]
+
+    def test_get_many_only_fetches_pending(self):
+        """Testa que get_many consulta a origem só pelas chaves não cacheadas."""
+        inner = CountingBackend({"A": "1", "B": "2"})
+        backend = CachedBackend(inner, CachePolicy(negative_ttl=60))
+
+        assert backend.get_many(["A", "B", "C"]) == {"A": "1", "B": "2"}
+        assert backend.get_many(["A", "B", "C"]) == {"A": "1", "B": "2"}
+        assert inner.get_many_calls == 1
+
+
+class TestLoaderWithBackends:
+    """Testes do EnvLoader com cadeia de backends."""
+
+    def test_chain_order(self, temp_secrets_dir, monkeypatch):
+        """Testa que o primeiro backend com a chave vence."""
+        monkeypatch.setenv("API_KEY", "from_env")
+        monkeypatch.setenv("ONLY_ENV", "env_value")
+        loader = EnvLoader(EnvConfig(backends=[FileDirBackend(temp_secrets_dir), EnvBackend()]))
+
+        assert loader.get("API_KEY") == "api_key_value"
+        assert loader.get("ONLY_ENV") == "env_value"
+        assert loader.get("API_KEY", use_secrets=False) == "from_env"
+
+    def test_searched_locations(self, temp_secrets_dir):
+        """Testa os locais buscados reportados pelos backends."""
+        loader = EnvLoader(EnvConfig(backends=[FileDirBackend(temp_secrets_dir), EnvBackend()]))
+
+        with pytest.raises(SecretNotFoundError) as exc_info:
+            loader.get("NOPE_KEY", required=True)
+
+        assert exc_info.value.searched_locations == ["secret:NOPE_KEY", "env:NOPE_KEY"]
+
+    def test_get_many_batches_per_backend(self, monkeypatch):
+        """Testa que get_many faz uma chamada por backend."""
+        monkeypatch.setenv("FROM_ENV", "e")
+        memory = CountingBackend({"A": "1", "B": "2"})
+        loader = EnvLoader(EnvConfig(backends=[memory, EnvBackend()]))
+
+        assert loader.get_many(["A", "B", "FROM_ENV", "MISSING"]) == {
+            "A": "1",
+            "B": "2",
+            "FROM_ENV": "e",
+        }
+        assert memory.get_many_calls == 1
+        assert memory.get_calls == 0
+
+    def test_clear_cache_clears_backend_caches(self):
+        """Testa que clear_cache limpa os caches dos backends."""
+        memory = CachedBackend(CountingBackend({"A": "1"}))
+        loader = EnvLoader(EnvConfig(backends=[memory]))
+        loader.get("A")
+        loader.clear_cache()
+        assert len(memory._cache) == 0
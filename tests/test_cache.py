@@ -0,0 +1,246 @@
+"""Testes para o cache de secrets."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from django_env_loader import EnvConfig, EnvLoader
+from django_env_loader.cache import SecretCache
+
+
+class TestSecretCache:
+    """Testes para SecretCache."""
+
+    def test_get_or_load_stores_value(self):
+        """Testa que o valor carregado fica em cache."""
+        cache = SecretCache()
+        assert cache.get_or_load("k", lambda: "v") == "v"
+        assert cache.get("k") == "v"
+        assert "k" in cache
+
+    def test_none_is_not_cached(self):
+        """Testa que resultados None não são armazenados."""
+        cache = SecretCache()
+        assert cache.get_or_load("k", lambda: None) is None
+        assert "k" not in cache
+
+    def test_single_flight(self):
+        """Testa que threads concorrentes disparam uma única leitura."""
+        cache = SecretCache()
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def slow_loader() -> str:
+            calls.append(1)
+            time.sleep(0.05)
+            return "v"
+
+        def worker() -> None:
+            barrier.wait()
+            assert cache.get_or_load("k", slow_loader) == "v"
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+
+    def test_clear_during_load_discards_value(self):
+        """Testa que clear() durante a leitura descarta o valor antigo."""
+        cache = SecretCache()
+
+        def loader() -> str:
+            cache.clear()
+            return "stale"
+
+        assert cache.get_or_load("k", loader) == "stale"
+        assert "k" not in cache
+
+    def test_update_many(self):
+        """Testa o armazenamento em lote e o descarte após clear()."""
+        cache = SecretCache()
+        generation = cache.generation
+
+        assert cache.update({"a": "1", "b": "2"}, generation=generation)
+        assert cache.snapshot() == {"a": "1", "b": "2"}
+
+        cache.clear()
+        assert not cache.update({"c": "3"}, generation=generation)
+        assert "c" not in cache
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requer os.fork")
+    @pytest.mark.parametrize("clear_on_fork,expected", [(True, b"0"), (False, b"1")])
+    def test_fork_hook(self, clear_on_fork, expected):
+        """Testa o comportamento do cache no processo filho."""
+        cache = SecretCache(clear_on_fork=clear_on_fork)
+        cache.set("k", "v")
+        read_fd, write_fd = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - executado no filho
+            os.close(read_fd)
+            os.write(write_fd, str(len(cache)).encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd, "rb") as pipe:
+            assert pipe.read() == expected
+
+
+class TestCachePolicy:
+    """Testes de LRU, TTL e estatísticas."""
+
+    def test_lru_eviction(self):
+        """Testa que a entrada usada há mais tempo é descartada."""
+        cache = SecretCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        assert cache.get("a") == "1"  # "b" passa a ser a menos recente
+
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.stats().evictions == 1
+        assert len(cache) == 2
+
+    def test_update_does_not_evict(self):
+        """Testa que regravar uma chave existente não descarta outra."""
+        cache = SecretCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.set("a", "1b")
+
+        assert cache.snapshot() == {"a": "1b", "b": "2"}
+        assert cache.stats().evictions == 0
+
+    def test_ttl_expiration(self, mocker):
+        """Testa a expiração por TTL e a limpeza na próxima gravação."""
+        now = [100.0]
+        mocker.patch("django_env_loader.cache.time.monotonic", side_effect=lambda: now[0])
+        cache = SecretCache(ttl=10)
+        cache.set("a", "1")
+        cache.set("b", "2")
+
+        now[0] = 105.0
+        assert cache.get("a") == "1"
+
+        now[0] = 111.0
+        assert cache.get("a") is None
+        cache.set("c", "3")
+
+        # "b" nunca foi consultada, mas foi removida ao gravar "c"
+        assert cache.snapshot() == {"c": "3"}
+        assert cache.stats().expirations == 2
+
+    def test_stats(self):
+        """Testa a contagem de acertos e falhas."""
+        cache = SecretCache()
+        cache.get_or_load("a", lambda: "1")
+        cache.get_or_load("a", lambda: "1")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 1)
+        assert stats.hit_rate == pytest.approx(1 / 3)
+
+        cache.reset_stats()
+        assert cache.stats().hits == 0
+
+    def test_invalid_max_entries(self):
+        """Testa que max_entries precisa ser positivo."""
+        with pytest.raises(ValueError, match="max_entries"):
+            SecretCache(max_entries=0)
+
+
+class TestLoaderSecretCache:
+    """Testes do cache de secrets integrado ao EnvLoader."""
+
+    def test_concurrent_reads_single_file_read(self, temp_secrets_dir, mocker):
+        """Testa que leituras concorrentes do mesmo secret leem o arquivo uma vez."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+        read = mocker.spy(loader, "_read_secret_file")
+        barrier = threading.Barrier(8)
+
+        def worker() -> None:
+            barrier.wait()
+            assert loader.get("API_KEY") == "api_key_value"
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert read.call_count == 1
+
+    def test_get_all_includes_cached_secrets(self, temp_secrets_dir):
+        """Testa que get_all inclui secrets em cache."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+        loader.get("API_KEY")
+        all_vars = loader.get_all(include_secrets=True)
+        assert all_vars[str(temp_secrets_dir / "API_KEY")] == "api_key_value"
+
+    def test_bounded_cache_from_config(self, temp_secrets_dir):
+        """Testa o limite do cache de secrets configurado no EnvConfig."""
+        (temp_secrets_dir / "TENANT_A").write_text("a")
+        (temp_secrets_dir / "TENANT_B").write_text("b")
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, secrets_cache_max_entries=1))
+
+        assert loader.get("TENANT_A") == "a"
+        assert loader.get("TENANT_B") == "b"
+        assert loader.get("TENANT_B") == "b"
+
+        stats = loader.cache_stats()
+        assert stats.size == 1
+        assert stats.evictions == 1
+        assert (stats.hits, stats.misses) == (1, 2)
+
+    def test_prefetch_secrets(self, temp_secrets_dir, mocker):
+        """Testa a pré-carga paralela de todos os secrets do diretório."""
+        (temp_secrets_dir / ".hidden").write_text("x")
+        (temp_secrets_dir / "nested").mkdir()
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+
+        result = loader.prefetch_secrets(max_workers=4)
+
+        assert result.loaded == ("API_KEY", "DB_PASSWORD")
+        assert result.missing == ("nested",)
+        assert result.seconds >= 0
+        assert set(result.timings) == {"API_KEY", "DB_PASSWORD", "nested"}
+        read = mocker.spy(loader, "_read_secret_file")
+        assert loader.get("DB_PASSWORD") == "secret123"
+        assert read.call_count == 0
+
+    def test_prefetch_given_keys(self, temp_secrets_dir):
+        """Testa a pré-carga de chaves informadas, com cache negativo das ausentes."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, secrets_negative_ttl=60))
+
+        result = loader.prefetch_secrets(["API_KEY", "MISSING", "API_KEY"])
+
+        assert result.loaded == ("API_KEY",)
+        assert result.missing == ("MISSING",)
+        assert str(temp_secrets_dir / "DB_PASSWORD") not in loader.get_all(include_secrets=True)
+        assert str(temp_secrets_dir / "MISSING") in loader._missing_secrets
+
+    def test_prefetch_large_secrets_mapped(self, temp_secrets_dir):
+        """Testa que a pré-carga mapeia secrets grandes em vez de guardá-los como str."""
+        (temp_secrets_dir / "BIG").write_text("x" * 4096)
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, large_secret_bytes=1024))
+
+        result = loader.prefetch_secrets(["BIG", "API_KEY"])
+
+        assert result.loaded == ("BIG", "API_KEY")
+        assert str(temp_secrets_dir / "BIG") in loader._secret_maps
+        assert str(temp_secrets_dir / "BIG") not in loader._secrets_cache
+
+    def test_prefetch_without_cache(self, temp_secrets_dir):
+        """Testa que a pré-carga não faz nada com o cache desativado."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, cache_secrets=False))
+        assert loader.prefetch_secrets().loaded == ()
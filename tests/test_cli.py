@@ -0,0 +1,211 @@
+"""Testes para a CLI django-env-loader."""
+
+import json
+import os
+
+import pytest
+
+from django_env_loader.cli import main
+from django_env_loader.shared import attach
+from django_env_loader.snapshot import load_snapshot
+
+SCHEMA_MODULE = """
+from django_env_loader import EnvSchema, Field
+
+
+class Settings(EnvSchema):
+    DEBUG = Field(bool, default=False)
+    PORT = Field(int, default=8000)
+    API_KEY = Field(str, required=True)
+    DATABASE_URL = Field(str, default="sqlite://")
+"""
+
+
+@pytest.fixture
+def schema_module(tmp_path, monkeypatch):
+    """Cria o módulo cli_schema_mod importável com um EnvSchema."""
+    (tmp_path / "cli_schema_mod.py").write_text(SCHEMA_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return "cli_schema_mod:Settings"
+
+
+@pytest.fixture
+def loader_args(tmp_path, temp_secrets_dir, monkeypatch):
+    """Opções comuns: .env vazio e o diretório de secrets de teste."""
+    monkeypatch.chdir(tmp_path)
+    env_file = tmp_path / "empty.env"
+    env_file.write_text("")
+    return ["--env-file", str(env_file), "--secrets-dir", str(temp_secrets_dir)]
+
+
+class TestResolve:
+    """Testes do subcomando resolve."""
+
+    def test_schema_json(self, schema_module, loader_args, monkeypatch, capsys):
+        """Testa a saída JSON do schema, com todos os valores ocultos por padrão."""
+        monkeypatch.setenv("PORT", "9000")
+        monkeypatch.setenv("DATABASE_URL", "postgres://u:hunter2@db/app")
+
+        assert main(["resolve", schema_module, *loader_args]) == 0
+
+        output = capsys.readouterr().out
+        assert "hunter2" not in output
+        assert json.loads(output) == {
+            "API_KEY": "***",
+            "DATABASE_URL": "***",
+            "DEBUG": "***",
+            "PORT": "***",
+        }
+
+        shown = ["--show", "PORT", "--show", "DEBUG"]
+        assert main(["resolve", schema_module, *shown, *loader_args]) == 0
+        assert json.loads(capsys.readouterr().out) == {
+            "API_KEY": "***",
+            "DATABASE_URL": "***",
+            "DEBUG": False,
+            "PORT": 9000,
+        }
+
+    def test_show_secrets(self, schema_module, loader_args, capsys):
+        """Testa --show-secrets."""
+        assert main(["resolve", schema_module, "--show-secrets", *loader_args]) == 0
+        assert json.loads(capsys.readouterr().out)["API_KEY"] == "api_key_value"
+
+    def test_without_schema_redacts_everything(self, loader_args, monkeypatch, capsys):
+        """Testa que, sem schema, credenciais do ambiente também ficam ocultas."""
+        monkeypatch.setenv("CLIAPP_DATABASE_URL", "postgres://user:pw@db/app")
+        monkeypatch.setenv("CLIAPP_PORT", "9000")
+        args = [*loader_args, "--prefix", "CLIAPP_"]
+
+        assert main(["resolve", *args]) == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["CLIAPP_DATABASE_URL"] == output["CLIAPP_PORT"] == "***"
+        assert output["API_KEY"] == "***"
+
+        assert main(["resolve", *args, "--show", "CLIAPP_PORT"]) == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["CLIAPP_PORT"] == "9000"
+        assert output["CLIAPP_DATABASE_URL"] == "***"
+
+        assert main(["resolve", *args, "--show-secrets"]) == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["CLIAPP_DATABASE_URL"] == "postgres://user:pw@db/app"
+        assert output["API_KEY"] == "api_key_value"
+
+    def test_schema_errors(self, schema_module, tmp_path, monkeypatch, capsys):
+        """Testa código de saída e mensagens quando o schema falha."""
+        monkeypatch.chdir(tmp_path)
+        status = main(["resolve", schema_module, "--secrets-dir", str(tmp_path / "none")])
+
+        assert status == 1
+        assert "API_KEY" in capsys.readouterr().err
+
+    def test_invalid_import(self, loader_args, capsys):
+        """Testa erro de importação do schema."""
+        assert main(["resolve", "missing_module_xyz:Settings", *loader_args]) == 2
+        assert "erro:" in capsys.readouterr().err
+
+
+class TestDiff:
+    """Testes do subcomando diff."""
+
+    def test_env_files(self, tmp_path, capsys):
+        """Testa chaves adicionadas, removidas e alteradas, sem expor valores."""
+        old = tmp_path / "old.env"
+        new = tmp_path / "new.env"
+        old.write_text("A=1\nB=2\nC=3\n")
+        new.write_text("A=1\nB=20\nD=4\n")
+
+        assert main(["diff", str(old), str(new)]) == 1
+        assert capsys.readouterr().out.splitlines() == ["~ B", "- C", "+ D"]
+
+        assert main(["diff", str(old), str(new), "--show-values"]) == 1
+        assert "~ B: '2' -> '20'" in capsys.readouterr().out
+
+    def test_secrets_dir_against_env(self, tmp_path, temp_secrets_dir, capsys):
+        """Testa a comparação de um diretório de secrets com um .env."""
+        env_file = tmp_path / "same.env"
+        env_file.write_text("DB_PASSWORD=secret123\nAPI_KEY=api_key_value\n")
+
+        assert main(["diff", str(temp_secrets_dir), str(env_file)]) == 0
+        assert capsys.readouterr().out == ""
+
+    def test_binary_secrets(self, tmp_path, capsys):
+        """Testa secrets binários: comparados byte a byte e exibidos escapados."""
+        old = tmp_path / "old"
+        new = tmp_path / "new"
+        old.mkdir()
+        new.mkdir()
+        (old / "KEY").write_bytes(b"\xff\xfe")
+        (new / "KEY").write_bytes(b"\xff\xfd")
+        (new / "CERT").write_bytes(b"\x00\xff")
+
+        assert main(["diff", str(old), str(old)]) == 0
+        assert main(["diff", str(old), str(new), "--show-values"]) == 1
+        output = capsys.readouterr().out.splitlines()
+        assert output == ["+ CERT=\x00\\xff", "~ KEY: b'\\xff\\xfe' -> b'\\xff\\xfd'"]
+
+    def test_undecodable_env_file(self, tmp_path, capsys):
+        """Testa que .env com encoding inválido é reportado sem traceback."""
+        bad = tmp_path / "bad.env"
+        bad.write_bytes(b"A=\xff\n")
+        good = tmp_path / "good.env"
+        good.write_text("A=1\n")
+
+        assert main(["diff", str(good), str(bad)]) == 2
+        assert str(bad) in capsys.readouterr().err
+
+
+class TestCompile:
+    """Testes do subcomando compile."""
+
+    def test_snapshot_and_shared(self, tmp_path, temp_secrets_dir, monkeypatch, capsys):
+        """Testa o snapshot do .env e a publicação da configuração resolvida."""
+        monkeypatch.delenv("CLI_COMPILED", raising=False)
+        env_file = tmp_path / ".env"
+        env_file.write_text("CLI_COMPILED=yes\n")
+        target = tmp_path / "shared"
+
+        status = main(
+            [
+                "compile",
+                str(env_file),
+                "--shared",
+                str(target),
+                "--secrets-dir",
+                str(temp_secrets_dir),
+            ]
+        )
+        os.environ.pop("CLI_COMPILED", None)
+
+        assert status == 0
+        assert load_snapshot(env_file) == {"CLI_COMPILED": "yes"}
+        shared = attach(target)
+        assert shared.env == {"CLI_COMPILED": "yes"}
+        assert shared.secrets["API_KEY"] == "api_key_value"
+        assert str(target) in capsys.readouterr().out
+
+
+class TestBench:
+    """Testes do subcomando bench."""
+
+    def test_json(self, loader_args, monkeypatch, capsys):
+        """Testa a medição por chave em JSON."""
+        monkeypatch.setenv("BENCH_HOST", "localhost")
+
+        status = main(["bench", "BENCH_HOST", "API_KEY", "NOPE", "--json", *loader_args])
+
+        assert status == 0
+        results = {result["key"]: result for result in json.loads(capsys.readouterr().out)}
+        assert set(results) == {"BENCH_HOST", "API_KEY", "NOPE"}
+        assert results["API_KEY"]["found"] is True
+        assert results["NOPE"]["found"] is False
+        assert results["BENCH_HOST"]["cold_us"] >= 0
+
+    def test_table_for_schema(self, schema_module, loader_args, capsys):
+        """Testa a tabela com as chaves de um schema."""
+        assert main(["bench", "--schema", schema_module, "--repeat", "3", *loader_args]) == 0
+
+        out = capsys.readouterr().out
+        assert "API_KEY" in out
+        assert "(ausente)" in out
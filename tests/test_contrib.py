@@ -0,0 +1,115 @@
+"""Testes para o app django_env_loader.contrib."""
+
+import logging
+
+import pytest
+
+from django_env_loader import EnvConfig, EnvLoader, Field
+from django_env_loader.contrib import StartupReport, warm_up
+from django_env_loader.exceptions import SecretNotFoundError
+
+SCHEMA = {
+    "DB_PASSWORD": Field(str, required=True),
+    "PORT": Field(int, default=8000),
+}
+
+
+class TestWarmUp:
+    """Testes de warm_up (sem Django)."""
+
+    def test_report(self, temp_secrets_dir, monkeypatch):
+        """Testa tempos por campo e por secret pré-carregado."""
+        monkeypatch.setenv("PORT", "9000")
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+
+        report = warm_up(loader, SCHEMA)
+
+        assert report.ok
+        assert report.settings.PORT == 9000
+        assert set(report.timings) == {"DB_PASSWORD", "PORT"}
+        assert {"DB_PASSWORD", "API_KEY"} <= set(report.secret_timings)
+        assert "secret:API_KEY" in dict(report.breakdown())
+
+    def test_errors_are_collected(self, temp_secrets_dir, monkeypatch):
+        """Testa que campos ausentes viram erros do relatório, sem exceção."""
+        monkeypatch.delenv("REQUIRED_TOKEN", raising=False)
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+
+        report = warm_up(loader, {"REQUIRED_TOKEN": Field(str, required=True)}, prefetch=False)
+
+        assert not report.ok
+        assert report.settings is None
+        assert isinstance(report.errors[0], SecretNotFoundError)
+        assert report.secret_timings == {}
+
+    def test_logging(self, temp_secrets_dir, caplog):
+        """Testa o log do relatório e dos campos lentos."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+
+        with caplog.at_level(logging.INFO, logger="django_env_loader.contrib.startup"):
+            warm_up(loader, SCHEMA, slow_seconds=0.0)
+
+        assert "Configuração resolvida" in caplog.text
+        assert "Resolução lenta de 'DB_PASSWORD'" in caplog.text
+
+    def test_format_and_slow(self):
+        """Testa a ordenação e o limite do relatório formatado."""
+        report = StartupReport(
+            seconds=0.5, timings={"A": 0.01, "B": 0.3}, secret_timings={"S": 0.2}
+        )
+
+        assert report.slow(0.1) == [("B", 0.3), ("secret:S", 0.2)]
+        lines = report.format(limit=1).splitlines()
+        assert len(lines) == 2
+        assert lines[1].split()[0] == "B"
+
+
+@pytest.fixture
+def django_settings(temp_secrets_dir):
+    """Configura um projeto Django mínimo com o app instalado."""
+    django = pytest.importorskip("django")
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure(INSTALLED_APPS=["django_env_loader.contrib"])
+        django.setup()
+    return settings
+
+
+class TestDjangoIntegration:
+    """Testes do AppConfig e do system check (requerem Django)."""
+
+    def test_ready_and_check(self, django_settings, temp_secrets_dir, monkeypatch):
+        """Testa que ready() gera o relatório e o check reporta os erros."""
+        from django.apps import apps
+        from django.test import override_settings
+
+        from django_env_loader.contrib.checks import check_env_config
+
+        monkeypatch.delenv("REQUIRED_TOKEN", raising=False)
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+        options = {"LOADER": loader, "SCHEMA": {"REQUIRED_TOKEN": Field(str, required=True)}}
+
+        with override_settings(ENV_LOADER=options):
+            app = apps.get_app_config("django_env_loader")
+            app.ready()
+            messages = check_env_config()
+
+        assert app.report is not None
+        assert [message.id for message in messages] == ["django_env_loader.E001"]
+
+    def test_fail_fast(self, django_settings, temp_secrets_dir, monkeypatch):
+        """Testa ImproperlyConfigured em ready() com FAIL_FAST."""
+        from django.apps import apps
+        from django.core.exceptions import ImproperlyConfigured
+        from django.test import override_settings
+
+        monkeypatch.delenv("REQUIRED_TOKEN", raising=False)
+        options = {
+            "LOADER": EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir)),
+            "SCHEMA": {"REQUIRED_TOKEN": Field(str, required=True)},
+            "FAIL_FAST": True,
+        }
+
+        with override_settings(ENV_LOADER=options), pytest.raises(ImproperlyConfigured):
+            apps.get_app_config("django_env_loader").ready()
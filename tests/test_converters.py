@@ -1,7 +1,12 @@
 """Testes para conversores de tipo."""
 
+import copy
+import pickle
+
 import pytest
 
+from django_env_loader import EnvConfig, EnvLoader
+from django_env_loader.converters import BoolVocabulary, FrozenDict, FrozenList, compile_converter
 from django_env_loader.exceptions import ValidationError
 from django_env_loader.loader import TypeConverter
 
@@ -166,3 +171,119 @@ class TestDictConverter:
         """Testa valores com múltiplos sinais de igual."""
         result = TypeConverter.to_dict("url=http://example.com?q=test", ",")
         assert result == {"url": "http://example.com?q=test"}
+
+
+class TestCompiledConverters:
+    """Testes para os conversores compilados."""
+
+    @pytest.mark.parametrize(
+        "cast,delimiter,raw",
+        [
+            (bool, ",", " Yes "),
+            (bool, ",", "NÃO"),
+            (int, ",", "  123  "),
+            (float, ",", "3.5"),
+            (list, ",", " a, ,b ,c,"),
+            (list, ";", "a;b"),
+            (dict, ",", "a=1, b , =x,=,c=d=e"),
+        ],
+    )
+    def test_matches_type_converter(self, cast, delimiter, raw):
+        """Testa que o conversor compilado equivale ao TypeConverter."""
+        reference = {
+            bool: TypeConverter.to_bool,
+            int: TypeConverter.to_int,
+            float: TypeConverter.to_float,
+            list: lambda value: TypeConverter.to_list(value, delimiter),
+            dict: lambda value: TypeConverter.to_dict(value, delimiter),
+        }[cast]
+        assert compile_converter(cast, delimiter=delimiter)(raw) == reference(raw)
+
+    def test_same_spec_same_converter(self):
+        """Testa que especificações iguais são compiladas uma única vez."""
+        assert compile_converter(list, delimiter=";") is compile_converter(list, delimiter=";")
+        assert compile_converter(list, delimiter=";") is not compile_converter(list)
+
+    def test_results_cached_and_frozen(self):
+        """Testa o cache por entrada e o retorno imutável de listas e dicionários."""
+        to_list = compile_converter(list)
+        first = to_list("a,b")
+
+        assert isinstance(first, FrozenList)
+        assert to_list("a,b") is first
+        assert isinstance(compile_converter(dict)("a=1"), FrozenDict)
+
+    @pytest.mark.parametrize("cast", [bool, int, float])
+    def test_invalid_values(self, cast):
+        """Testa que valores inválidos levantam ValidationError."""
+        with pytest.raises(ValidationError):
+            compile_converter(cast)("invalid")
+
+    def test_unsupported_type(self):
+        """Testa a rejeição de tipos sem conversor."""
+        with pytest.raises(TypeError):
+            compile_converter(bytes)
+
+
+class TestFrozenContainers:
+    """Testes de cópia e serialização de FrozenList/FrozenDict."""
+
+    @pytest.mark.parametrize(
+        "value", [FrozenList(["a", "b"]), FrozenDict({"a": "1", "b": "2"})], ids=["list", "dict"]
+    )
+    def test_copy_and_deepcopy(self, value):
+        """Testa que copy/deepcopy devolvem o próprio objeto imutável."""
+        assert copy.copy(value) is value
+        assert copy.deepcopy(value) is value
+        assert copy.deepcopy({"settings": value})["settings"] is value
+
+    @pytest.mark.parametrize(
+        "value", [FrozenList(["a", "b"]), FrozenDict({"a": "1", "b": "2"})], ids=["list", "dict"]
+    )
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, value, protocol):
+        """Testa que o pickle preserva tipo, conteúdo e imutabilidade."""
+        restored = pickle.loads(pickle.dumps(value, protocol=protocol))
+
+        assert type(restored) is type(value)
+        assert restored == value
+        with pytest.raises(TypeError):
+            restored.clear()
+
+
+class TestBoolVocabulary:
+    """Testes para vocabulários de booleanos customizados."""
+
+    def test_custom_vocabulary(self):
+        """Testa um vocabulário próprio (sem as palavras padrão)."""
+        to_bool = compile_converter(
+            bool, vocabulary=BoolVocabulary(true=frozenset({"Ativo"}), false=frozenset({"inativo"}))
+        )
+
+        assert to_bool(" ATIVO ") is True
+        assert to_bool("inativo") is False
+        with pytest.raises(ValidationError):
+            to_bool("true")
+
+    def test_extended_vocabulary(self):
+        """Testa o vocabulário padrão acrescido de novas palavras."""
+        to_bool = compile_converter(bool, vocabulary=BoolVocabulary.extended(true=["enabled"]))
+
+        assert to_bool("Enabled") is True
+        assert to_bool("yes") is True
+
+    def test_overlap_rejected(self):
+        """Testa a rejeição de palavras em true e false ao mesmo tempo."""
+        with pytest.raises(ValueError, match="ligado"):
+            BoolVocabulary(true=frozenset({"ligado"}), false=frozenset({"Ligado"}))
+
+    def test_loader_vocabulary(self, monkeypatch):
+        """Testa o vocabulário configurado no EnvConfig."""
+        monkeypatch.setenv("FEATURE_X", "ativo")
+        vocabulary = BoolVocabulary.extended(true=["ativo"], false=["inativo"])
+        loader = EnvLoader(EnvConfig(bool_vocabulary=vocabulary))
+
+        assert loader.get_bool("FEATURE_X") is True
+        assert loader.get_bool("FEATURE_MISSING", default=True) is True
+        assert loader.freeze().get_bool("FEATURE_X") is True
+        assert loader.load_schema({"FEATURE_X": bool}).FEATURE_X is True
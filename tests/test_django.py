@@ -94,6 +94,59 @@ class TestDjangoEnvLoader:
             loader.get_database_url()
 
 
+class TestDjangoUrlConfigs:
+    """Testes dos helpers que convertem URLs em settings do Django."""
+
+    def test_get_database_config(self, monkeypatch):
+        """Testa DATABASE_URL convertida em entrada de DATABASES."""
+        loader = DjangoEnvLoader()
+        monkeypatch.setenv("DJANGO_DATABASE_URL", "postgres://user:pass@db:5432/mydb")
+
+        config = loader.get_database_config()
+        assert config["ENGINE"] == "django.db.backends.postgresql"
+        assert config["HOST"] == "db"
+        assert loader.get_database_config(key="MISSING_URL", default="sqlite://")["NAME"] == (
+            ":memory:"
+        )
+        with pytest.raises(SecretNotFoundError):
+            loader.get_database_config(key="MISSING_URL")
+
+    def test_get_databases(self, monkeypatch, temp_secrets_dir):
+        """Testa múltiplos bancos vindos do ambiente e de secrets."""
+        (temp_secrets_dir / "DATABASE_URL_ANALYTICS").write_text("mysql://a@warehouse/stats")
+        monkeypatch.setenv("DJANGO_DATABASE_URL", "postgres://db/app")
+        monkeypatch.setenv("DJANGO_DATABASE_URL_REPLICA", "postgres://replica/app")
+        loader = DjangoEnvLoader(EnvConfig(prefix="DJANGO_", secrets_dir=temp_secrets_dir))
+
+        databases = loader.get_databases()
+
+        assert list(databases) == ["default", "analytics", "replica"]
+        assert databases["replica"]["HOST"] == "replica"
+        assert databases["analytics"]["ENGINE"] == "django.db.backends.mysql"
+
+    def test_get_databases_required(self):
+        """Testa que DATABASE_URL é obrigatória sem default."""
+        loader = DjangoEnvLoader()
+
+        with pytest.raises(SecretNotFoundError):
+            loader.get_databases()
+        assert loader.get_databases(default="sqlite:///db.sqlite3")["default"]["NAME"] == (
+            "db.sqlite3"
+        )
+
+    def test_get_cache_and_email_config(self, monkeypatch):
+        """Testa CACHE_URL e EMAIL_URL com e sem variável definida."""
+        loader = DjangoEnvLoader()
+        monkeypatch.setenv("DJANGO_CACHE_URL", "redis://cache:6379/0")
+        monkeypatch.setenv("DJANGO_EMAIL_URL", "smtp+tls://u:p@smtp.example.com:587")
+
+        assert loader.get_cache_config()["LOCATION"] == "redis://cache:6379/0"
+        assert loader.get_email_config()["EMAIL_USE_TLS"] is True
+
+        monkeypatch.delenv("DJANGO_CACHE_URL")
+        assert loader.get_cache_config()["BACKEND"].endswith("LocMemCache")
+
+
 class TestDjangoIntegration:
     """Testes de integração com Django."""
 
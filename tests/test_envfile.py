@@ -0,0 +1,153 @@
+"""Testes para o parser nativo de .env."""
+
+import io
+import os
+
+import pytest
+
+from dotenv import dotenv_values
+
+import django_env_loader.loader as loader_module
+
+from django_env_loader import EnvConfig, EnvFileSyntaxError, EnvLoader
+from django_env_loader.envfile import parse_env
+
+COMPATIBLE_SAMPLES = [
+    "KEY=value",
+    "KEY=value\nOTHER=2\n",
+    "KEY=",
+    "KEY",
+    "KEY # comentário",
+    "  KEY  =  value with spaces  ",
+    "KEY=value # comentário",
+    "KEY=value#not-comment",
+    "KEY=#not-comment",
+    "KEY= # comentário",
+    "KEY=a=b=c",
+    "export KEY=value",
+    "export\tKEY=value",
+    "export=value",
+    "KEY='single quoted'",
+    "KEY='it\\'s \\\\ \\n raw'",
+    'KEY="double quoted"',
+    'KEY="escapes \\n \\t \\" \\\\ \\x"',
+    'KEY="with # hash" # comentário',
+    "KEY='' ",
+    'KEY=""',
+    "KEY=$NOT_INTERPOLATED",
+    "# comentário\n\n\nKEY=value\n   # outro\n",
+    "KEY=first\nKEY=second",
+    "\ufeffKEY=bom",
+    "A=1\r\nB=2\rC=3",
+    "KEY=unicode ção 🚀",
+]
+
+
+class TestNativeParser:
+    """Testes de compatibilidade do parser nativo com o python-dotenv."""
+
+    @pytest.mark.parametrize("content", COMPATIBLE_SAMPLES)
+    def test_matches_python_dotenv(self, content):
+        """Testa que o parser nativo produz o mesmo resultado do python-dotenv."""
+        expected = dotenv_values(stream=io.StringIO(content), interpolate=False)
+        assert parse_env(content) == dict(expected)
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "KEY=${OTHER}",
+            'KEY="prefix-${OTHER}"',
+            "KEY='${OTHER}'",
+            'KEY="line one\nline two"',
+            "KEY='unterminated",
+            "'QUOTED'=value",
+            "=value",
+            'KEY="value" trailing',
+        ],
+    )
+    def test_unsupported_syntax(self, content):
+        """Testa que sintaxes não suportadas levantam EnvFileSyntaxError."""
+        with pytest.raises(EnvFileSyntaxError):
+            parse_env(content)
+
+    def test_error_reports_line(self):
+        """Testa que o erro informa a linha."""
+        with pytest.raises(EnvFileSyntaxError) as exc_info:
+            parse_env("A=1\nB=${A}\n")
+        assert exc_info.value.line == 2
+
+
+class TestLoaderEnvParser:
+    """Testes da seleção de parser no EnvLoader."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_env(self, monkeypatch):
+        for key in ("NATIVE_A", "NATIVE_B", "NATIVE_C"):
+            monkeypatch.delenv(key, raising=False)
+
+    def test_native_parser_applies_values(self, tmp_path):
+        """Testa que o parser nativo aplica o .env ao ambiente."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("NATIVE_A=1\nexport NATIVE_B='two'\nNATIVE_C\n")
+
+        EnvLoader(EnvConfig(env_file=env_file, env_parser="native"))
+
+        assert os.environ["NATIVE_A"] == "1"
+        assert os.environ["NATIVE_B"] == "two"
+        assert "NATIVE_C" not in os.environ
+
+    def test_native_parser_respects_existing(self, tmp_path, monkeypatch):
+        """Testa que variáveis existentes são preservadas sem override_existing."""
+        monkeypatch.setenv("NATIVE_A", "from-env")
+        env_file = tmp_path / ".env"
+        env_file.write_text("NATIVE_A=from-file\n")
+
+        EnvLoader(EnvConfig(env_file=env_file))
+        assert os.environ["NATIVE_A"] == "from-env"
+
+        EnvLoader.reset_singleton()
+        EnvLoader(EnvConfig(env_file=env_file, override_existing=True))
+        assert os.environ["NATIVE_A"] == "from-file"
+
+    def test_auto_falls_back_to_dotenv(self, tmp_path, mocker):
+        """Testa o fallback para o python-dotenv com interpolação."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("NATIVE_A=base\nNATIVE_B=${NATIVE_A}-derived\n")
+        load_dotenv = mocker.spy(loader_module, "load_dotenv")
+
+        EnvLoader(EnvConfig(env_file=env_file))
+
+        assert load_dotenv.call_count == 1
+        assert os.environ["NATIVE_B"] == "base-derived"
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "NATIVE_A=base\nNATIVE_B='${NATIVE_A}'\n",
+            "NATIVE_B='${NATIVE_C}'\n",
+            "NATIVE_B='a${NATIVE_C}b'\n",
+            'NATIVE_B="${NATIVE_C}"\n',
+        ],
+    )
+    def test_auto_matches_dotenv_interpolation(self, tmp_path, content):
+        """Testa que valores com ${...} seguem o python-dotenv, inclusive entre aspas simples."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(content)
+        expected = dotenv_values(stream=io.StringIO(content))["NATIVE_B"]
+
+        EnvLoader(EnvConfig(env_file=env_file))
+
+        assert os.environ.get("NATIVE_B") == expected
+
+    def test_native_only_raises(self, tmp_path):
+        """Testa que env_parser='native' não faz fallback."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("NATIVE_B=${NATIVE_A}\n")
+
+        with pytest.raises(EnvFileSyntaxError):
+            EnvLoader(EnvConfig(env_file=env_file, env_parser="native"))
+
+    def test_invalid_parser(self):
+        """Testa que um parser desconhecido é rejeitado."""
+        with pytest.raises(ValueError, match="env_parser"):
+            EnvConfig(env_parser="fast")  # type: ignore[arg-type]
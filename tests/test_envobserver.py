@@ -0,0 +1,176 @@
+"""Testes para o observador versionado de os.environ."""
+
+import os
+import threading
+import time
+import warnings
+
+import pytest
+
+import django_env_loader.envobserver as envobserver
+
+from django_env_loader import EnvConfig, EnvLoader
+from django_env_loader.envobserver import (
+    VersionedEnviron,
+    environ_version,
+    install,
+    is_installed,
+    key_version,
+    uninstall,
+)
+from django_env_loader.envview import PrefixedEnvironView
+
+
+@pytest.fixture
+def observed(monkeypatch):
+    """Instala o observador e o remove ao final do teste."""
+    monkeypatch.delenv("OBS_A", raising=False)
+    monkeypatch.delenv("OBS_B", raising=False)
+    environ = install()
+    yield environ
+    uninstall()
+
+
+class TestVersionedEnviron:
+    """Testes do contador de versões."""
+
+    def test_install_is_idempotent(self, observed):
+        """Testa que o próprio os.environ passa a ser versionado."""
+        assert is_installed()
+        assert install() is os.environ is observed
+        assert isinstance(os.environ, VersionedEnviron)
+
+    def test_versions(self, observed, monkeypatch):
+        """Testa versões global e por variável em atribuições e remoções."""
+        start = environ_version()
+
+        monkeypatch.setenv("OBS_A", "1")
+        after_set = environ_version()
+        assert after_set > start
+        assert key_version("OBS_A") == after_set
+        assert key_version("OBS_B") == 0
+
+        monkeypatch.setenv("OBS_A", "1")  # mesmo valor: sem nova versão
+        assert environ_version() == after_set
+
+        os.environ.pop("OBS_A")
+        assert environ_version() > after_set
+        assert observed.changed_since(start) == {"OBS_A"}
+
+    def test_mutation_helpers(self, observed):
+        """Testa update/setdefault (que passam por __setitem__)."""
+        start = environ_version()
+        os.environ.update(OBS_A="x")
+        os.environ.setdefault("OBS_B", "y")
+        del os.environ["OBS_A"], os.environ["OBS_B"]
+
+        assert observed.changed_since(start) == {"OBS_A", "OBS_B"}
+
+    def test_concurrent_writers(self, observed, monkeypatch):
+        """Testa que a versão é monotônica e não perde incrementos entre threads."""
+        counter = envobserver._versions
+
+        class YieldingCounter:
+            """Cede o GIL logo após obter a versão, alargando a janela de corrida."""
+
+            def __next__(self):
+                version = next(counter)
+                time.sleep(0)
+                return version
+
+        monkeypatch.setattr(envobserver, "_versions", YieldingCounter())
+        writers, writes = 8, 100
+        keys = [f"OBS_THREAD_{i}" for i in range(writers)]
+        start = environ_version()
+        samples = []
+        done = threading.Event()
+
+        def write(key):
+            for n in range(writes):
+                os.environ[key] = str(n)
+
+        def read():
+            while not done.is_set():
+                samples.append(environ_version())
+
+        reader = threading.Thread(target=read)
+        threads = [threading.Thread(target=write, args=(key,)) for key in keys]
+        try:
+            reader.start()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            done.set()
+            reader.join()
+            final = environ_version()
+            latest = max(observed.key_version(key) for key in keys)
+        finally:
+            for key in keys:
+                os.environ.pop(key, None)
+
+        assert samples == sorted(samples)
+        assert final == latest == start + writers * writes
+
+    def test_uninstall(self, observed):
+        """Testa a restauração da classe original."""
+        version = environ_version()
+        uninstall()
+
+        assert not is_installed()
+        assert environ_version() is None
+        assert key_version("OBS_A") is None
+        assert install().version > version  # versões nunca se repetem
+
+
+class TestObservedCaches:
+    """Testes dos caches validados pela versão do ambiente."""
+
+    def test_loader_installs_observer(self, monkeypatch):
+        """Testa EnvConfig(observe_environ=True)."""
+        try:
+            EnvLoader(EnvConfig(observe_environ=True))
+            assert is_installed()
+        finally:
+            uninstall()
+
+    def test_view_detects_same_size_swap(self, observed, monkeypatch):
+        """Testa que trocar uma variável por outra (mesmo tamanho) reconstrói o índice."""
+        monkeypatch.setenv("OBS_A", "1")
+        view = PrefixedEnvironView("OBS_")
+        assert set(view) == {"OBS_A"}
+
+        del os.environ["OBS_A"]
+        os.environ["OBS_B"] = "2"
+
+        assert set(view) == {"OBS_B"}
+
+    def test_snapshot_reused_until_change(self, observed, monkeypatch, mocker):
+        """Testa que items_snapshot não relê os.environ enquanto a versão não muda."""
+        monkeypatch.setenv("OBS_A", "1")
+        view = PrefixedEnvironView("OBS_")
+        assert view.items_snapshot() == {"OBS_A": "1"}
+
+        get = mocker.spy(VersionedEnviron, "get")
+        first = view.items_snapshot()
+        first["OBS_A"] = "mutated"  # cópia: não afeta o cache
+        assert view.items_snapshot() == {"OBS_A": "1"}
+        assert get.call_count == 0
+
+        monkeypatch.setenv("OBS_A", "2")
+        assert view.items_snapshot() == {"OBS_A": "2"}
+
+    def test_frozen_debug(self, observed, monkeypatch):
+        """Testa o aviso do freeze(debug=True) com o observador instalado."""
+        monkeypatch.setenv("OBS_A", "1")
+        monkeypatch.setenv("OBS_B", "1")
+        frozen = EnvLoader().freeze(debug=True)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert frozen.get("OBS_A") == "1"
+            monkeypatch.setenv("OBS_B", "2")
+            assert frozen.get("OBS_A") == "1"  # outra variável mudou
+
+        with pytest.warns(RuntimeWarning, match="OBS_B"):
+            assert frozen.get("OBS_B") == "1"
@@ -0,0 +1,109 @@
+"""Testes para a visão indexada por prefixo do ambiente."""
+
+import pytest
+
+from django_env_loader import EnvConfig, EnvLoader
+from django_env_loader.envview import PrefixedEnvironView
+
+
+@pytest.fixture
+def environ():
+    return {"APP_A": "1", "APP_B": "2", "OTHER": "x"}
+
+
+class TestPrefixedEnvironView:
+    """Testes de PrefixedEnvironView."""
+
+    def test_mapping_interface(self, environ):
+        """Testa leitura, pertinência e iteração restritas ao prefixo."""
+        view = PrefixedEnvironView("APP_", environ)
+
+        assert dict(view) == {"APP_A": "1", "APP_B": "2"}
+        assert len(view) == 2
+        assert "APP_A" in view
+        assert "OTHER" not in view
+        with pytest.raises(KeyError):
+            view["OTHER"]
+
+    def test_read_only(self, environ):
+        """Testa que a visão não permite alterações."""
+        view = PrefixedEnvironView("APP_", environ)
+        with pytest.raises(TypeError):
+            view["APP_C"] = "3"  # type: ignore[index]
+
+    def test_values_are_live(self, environ):
+        """Testa que valores alterados aparecem sem reconstruir o índice."""
+        view = PrefixedEnvironView("APP_", environ)
+        list(view)
+        environ["APP_A"] = "changed"
+        assert view["APP_A"] == "changed"
+        assert view.items_snapshot()["APP_A"] == "changed"
+
+    def test_index_rebuilt_on_size_change(self, environ):
+        """Testa que novas variáveis são indexadas."""
+        view = PrefixedEnvironView("APP_", environ)
+        list(view)
+        environ["APP_C"] = "3"
+        assert set(view) == {"APP_A", "APP_B", "APP_C"}
+
+    def test_removed_keys_skipped(self, environ):
+        """Testa que variáveis removidas não aparecem mesmo com índice antigo."""
+        view = PrefixedEnvironView("APP_", environ)
+        list(view)
+        del environ["APP_A"]
+        environ["NEW"] = "y"
+        assert dict(view) == {"APP_B": "2"}
+
+    def test_swap_with_same_size(self, environ):
+        """Testa que trocar uma variável por outra (mesmo tamanho) é detectado."""
+        view = PrefixedEnvironView("APP_", environ)
+        list(view)
+        del environ["APP_A"]
+        environ["APP_C"] = "3"
+        assert dict(view) == {"APP_B": "2", "APP_C": "3"}
+
+    def test_invalidate(self, environ):
+        """Testa a invalidação explícita do índice."""
+        view = PrefixedEnvironView("APP_", environ)
+        list(view)
+        del environ["OTHER"]
+        environ["APP_C"] = "3"
+
+        view.invalidate()
+
+        assert set(view) == {"APP_A", "APP_B", "APP_C"}
+
+
+class TestLoaderEnvView:
+    """Testes de env_view / get_all no EnvLoader."""
+
+    def test_env_view_with_prefix(self, monkeypatch):
+        """Testa que env_view expõe apenas as variáveis com prefixo."""
+        monkeypatch.setenv("VIEW_A", "1")
+        monkeypatch.setenv("NOT_VIEW", "x")
+        loader = EnvLoader(EnvConfig(prefix="VIEW_"))
+
+        view = loader.env_view()
+
+        assert dict(view) == {"VIEW_A": "1"}
+        monkeypatch.setenv("VIEW_B", "2")
+        assert loader.get_all() == {"VIEW_A": "1", "VIEW_B": "2"}
+
+    def test_get_all_after_swap_with_same_size(self, monkeypatch):
+        """Regressão: get_all não pode usar índice antigo quando o tamanho não muda."""
+        monkeypatch.setenv("SWAP_A", "1")
+        monkeypatch.delenv("SWAP_B", raising=False)
+        loader = EnvLoader(EnvConfig(prefix="SWAP_"))
+        assert loader.get_all() == {"SWAP_A": "1"}
+
+        monkeypatch.delenv("SWAP_A")
+        monkeypatch.setenv("SWAP_B", "2")
+
+        assert loader.get_all() == {"SWAP_B": "2"}
+
+    def test_get_all_filters_cached_secrets_by_prefix(self, temp_secrets_dir):
+        """Testa que secrets em cache fora do prefixo não entram em get_all."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, prefix="VIEW_"))
+        loader.get("API_KEY")
+
+        assert str(temp_secrets_dir / "API_KEY") not in loader.get_all(include_secrets=True)
@@ -0,0 +1,183 @@
+"""Testes para o snapshot congelado da configuração."""
+
+import warnings
+
+import pytest
+
+from django_env_loader import EnvConfig, EnvLoader, EnvSchema, Field
+from django_env_loader.exceptions import SecretNotFoundError, ValidationError
+from django_env_loader.frozen import FrozenEnv
+from django_env_loader.loader import FrozenList
+
+
+class FrozenSettings(EnvSchema):
+    PORT = Field(int, default=8000)
+    FEATURE = Field(bool, default=False, env="FROZEN_FEATURE")
+
+
+@pytest.fixture
+def frozen_env(monkeypatch):
+    monkeypatch.setenv("FROZEN_FEATURE", "yes")
+    monkeypatch.setenv("FROZEN_PORT", "9000")
+    monkeypatch.setenv("FROZEN_HOSTS", "a.com, b.com")
+    monkeypatch.delenv("FROZEN_MISSING", raising=False)
+
+
+class TestFreeze:
+    """Testes de EnvLoader.freeze()."""
+
+    def test_typed_reads(self, frozen_env):
+        """Testa as leituras tipadas a partir do snapshot."""
+        frozen = EnvLoader().freeze()
+
+        assert isinstance(frozen, FrozenEnv)
+        assert frozen.get("FROZEN_PORT") == "9000"
+        assert frozen.get_bool("FROZEN_FEATURE") is True
+        assert frozen.get_int("FROZEN_PORT") == 9000
+        assert frozen.get_float("FROZEN_PORT") == 9000.0
+        assert frozen.get_list("FROZEN_HOSTS") == ["a.com", "b.com"]
+        assert frozen.is_set("FROZEN_HOSTS")
+
+    def test_conversion_is_memoized(self, frozen_env, mocker):
+        """Testa que a conversão acontece apenas no primeiro acesso."""
+        loader = EnvLoader()
+        to_bool = mocker.patch.object(loader, "_to_bool", return_value=True)
+        frozen = loader.freeze()
+
+        for _ in range(3):
+            assert frozen.get_bool("FROZEN_FEATURE") is True
+
+        assert to_bool.call_count == 1
+
+    def test_shared_list_is_immutable(self, frozen_env):
+        """Testa que listas memorizadas não podem ser alteradas pelo chamador."""
+        hosts = EnvLoader().freeze().get_list("FROZEN_HOSTS")
+
+        assert isinstance(hosts, FrozenList)
+        with pytest.raises(TypeError):
+            hosts.append("c.com")
+
+    def test_missing_values(self, frozen_env):
+        """Testa defaults e obrigatoriedade para variáveis ausentes."""
+        frozen = EnvLoader().freeze()
+
+        assert frozen.get("FROZEN_MISSING", default="x") == "x"
+        assert frozen.get_int("FROZEN_MISSING", default=1) == 1
+        assert frozen.get_int("FROZEN_MISSING", default=2) == 2
+        assert not frozen.is_set("FROZEN_MISSING")
+        with pytest.raises(SecretNotFoundError):
+            frozen.get_bool("FROZEN_MISSING", required=True)
+
+    def test_snapshot_ignores_later_changes(self, frozen_env, monkeypatch):
+        """Testa que alterações após o freeze não são vistas."""
+        frozen = EnvLoader().freeze()
+        monkeypatch.setenv("FROZEN_PORT", "1")
+        monkeypatch.setenv("FROZEN_MISSING", "now set")
+
+        assert frozen.get_int("FROZEN_PORT") == 9000
+        assert frozen.get("FROZEN_MISSING", default="") == ""
+
+    def test_immutable(self, frozen_env):
+        """Testa que o snapshot não aceita atribuições."""
+        frozen = EnvLoader().freeze()
+        with pytest.raises(AttributeError):
+            frozen.PORT = 1
+        with pytest.raises(AttributeError):
+            del frozen.PORT
+
+    def test_invalid_value(self, monkeypatch):
+        """Testa o default em erro de conversão e a propagação no modo estrito."""
+        monkeypatch.setenv("FROZEN_BAD", "abc")
+
+        assert EnvLoader().freeze().get_int("FROZEN_BAD", default=5) == 5
+
+        EnvLoader.reset_singleton()
+        strict = EnvLoader(EnvConfig(strict_mode=True)).freeze()
+        with pytest.raises(ValidationError):
+            strict.get_int("FROZEN_BAD")
+
+    def test_secrets_take_precedence(self, temp_secrets_dir, monkeypatch):
+        """Testa que secrets encobrem o ambiente, como em get()."""
+        monkeypatch.setenv("API_KEY", "from-env")
+        frozen = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir)).freeze()
+
+        assert frozen.get("API_KEY") == "api_key_value"
+        assert frozen.get("API_KEY", use_secrets=False) == "from-env"
+        assert frozen.get("DB_PASSWORD") == "secret123"
+
+    @pytest.mark.parametrize("strict_mode", [False, True])
+    def test_subdirectory_in_secrets_dir(self, temp_secrets_dir, strict_mode, caplog):
+        """Testa que subdiretórios de secrets_dir são ignorados sem erro."""
+        (temp_secrets_dir / "..data").mkdir()
+        (temp_secrets_dir / "nested").mkdir()
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, strict_mode=strict_mode))
+
+        frozen = loader.freeze()
+
+        assert frozen.get("DB_PASSWORD") == "secret123"
+        assert frozen.get("nested", default="") == ""
+        assert "ERROR" not in caplog.text
+
+    def test_prefix(self, monkeypatch):
+        """Testa chaves com e sem prefixo."""
+        monkeypatch.setenv("FRZ_DEBUG", "true")
+        frozen = EnvLoader(EnvConfig(prefix="FRZ_")).freeze()
+
+        assert frozen.get_bool("DEBUG") is True
+        assert frozen.get_bool("FRZ_DEBUG") is True
+
+
+class TestFreezeSchema:
+    """Testes do freeze com schema."""
+
+    def test_fields_are_attributes(self, frozen_env):
+        """Testa que os campos do schema viram atributos comuns."""
+        frozen = EnvLoader(EnvConfig(prefix="FROZEN_")).freeze(FrozenSettings)
+
+        assert frozen.PORT == 9000
+        assert frozen.FEATURE is True
+        assert "PORT" in vars(frozen)
+        assert frozen.as_dict() == {"PORT": 9000, "FEATURE": True}
+
+    def test_field_name_conflict(self, frozen_env):
+        """Testa a rejeição de campos com o nome de métodos do snapshot."""
+        with pytest.raises(ValueError, match="get_bool"):
+            EnvLoader().freeze({"get_bool": Field(bool)})
+
+    def test_unknown_attribute(self, frozen_env):
+        """Testa AttributeError para campos inexistentes."""
+        with pytest.raises(AttributeError):
+            _ = EnvLoader().freeze().UNKNOWN
+
+
+class TestFreezeDebug:
+    """Testes do modo debug."""
+
+    def test_warns_once_on_change(self, frozen_env, monkeypatch):
+        """Testa o aviso (único) quando o ambiente muda após o freeze."""
+        frozen = EnvLoader().freeze(debug=True)
+        monkeypatch.setenv("FROZEN_PORT", "1")
+
+        with pytest.warns(RuntimeWarning, match="FROZEN_PORT"):
+            assert frozen.get_int("FROZEN_PORT") == 9000
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert frozen.get_int("FROZEN_PORT") == 9000
+
+    def test_no_warning_without_change(self, frozen_env):
+        """Testa que leituras sem alteração não emitem avisos."""
+        frozen = EnvLoader().freeze(debug=True)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert frozen.get_bool("FROZEN_FEATURE") is True
+            assert frozen.get("FROZEN_MISSING", default="x") == "x"
+
+    def test_schema_field_warns(self, frozen_env, monkeypatch):
+        """Testa o aviso na leitura de campos do schema."""
+        frozen = EnvLoader(EnvConfig(prefix="FROZEN_")).freeze(FrozenSettings, debug=True)
+        monkeypatch.setenv("FROZEN_FEATURE", "no")
+
+        with pytest.warns(RuntimeWarning, match="FROZEN_FEATURE"):
+            assert frozen.FEATURE is True
+        assert frozen.debug
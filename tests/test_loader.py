@@ -1,9 +1,15 @@
 """Testes principais do EnvLoader."""
 
+import os
+import subprocess
+import sys
+
 from pathlib import Path
 
 import pytest
 
+import django_env_loader.loader as loader_module
+
 from django_env_loader import EnvConfig, EnvLoader, SecretNotFoundError, ValidationError
 
 
@@ -16,6 +22,47 @@ class TestEnvLoaderBasics:
         loader2 = EnvLoader()
         assert loader1 is loader2
 
+    def test_registry_per_config(self, temp_secrets_dir):
+        """Testa um loader por configuração, sem compartilhamento entre elas."""
+        tenant_a = EnvLoader(EnvConfig(prefix="TENANT_A_", secrets_dir=temp_secrets_dir))
+        tenant_b = EnvLoader(EnvConfig(prefix="TENANT_B_", secrets_dir=temp_secrets_dir))
+
+        assert tenant_a is not tenant_b
+        assert tenant_b.config.prefix == "TENANT_B_"
+        assert EnvLoader(EnvConfig(prefix="TENANT_A_", secrets_dir=temp_secrets_dir)) is tenant_a
+        assert EnvLoader(EnvConfig()) is EnvLoader()
+
+        tenant_a.get("API_KEY")
+        assert tenant_a.cache_stats().size == 1
+        assert tenant_b.cache_stats().size == 0
+
+    def test_registry_per_class(self):
+        """Testa que EnvLoader e DjangoEnvLoader não compartilham instância."""
+        from django_env_loader import DjangoEnvLoader
+
+        loader = EnvLoader()
+        django_loader = DjangoEnvLoader()
+
+        assert type(django_loader) is DjangoEnvLoader
+        assert django_loader.config.prefix == "DJANGO_"
+        assert loader.config.prefix == ""
+
+    def test_env_file_loaded_once(self, temp_env_file, mocker):
+        """Testa que a mesma configuração não recarrega o .env."""
+        load = mocker.spy(EnvLoader, "_load_env_file")
+        config = EnvConfig(env_file=temp_env_file)
+
+        EnvLoader(config)
+        EnvLoader(EnvConfig(env_file=temp_env_file))
+
+        assert load.call_count == 1
+
+    def test_reset_clears_registry(self):
+        """Testa que reset_singleton descarta os loaders registrados."""
+        loader = EnvLoader()
+        EnvLoader.reset_singleton()
+        assert EnvLoader() is not loader
+
     def test_load_from_env_file(self, temp_env_file):
         """Testa carregamento de arquivo .env."""
         config = EnvConfig(env_file=temp_env_file)
@@ -47,6 +94,29 @@ class TestEnvLoaderBasics:
         loader = EnvLoader()
         assert loader.get("MY_VAR") == "env_value"
 
+    def test_searched_locations_with_prefix(self, tmp_path):
+        """Testa os locais buscados informados no erro, com prefixo."""
+        loader = EnvLoader(EnvConfig(secrets_dir=tmp_path, prefix="APP_"))
+
+        with pytest.raises(SecretNotFoundError) as exc_info:
+            loader.get("TOKEN", required=True)
+
+        assert exc_info.value.searched_locations == [
+            f"secret:{tmp_path / 'TOKEN'}",
+            "env:APP_TOKEN",
+        ]
+
+    def test_hit_path_reuses_key_info(self, monkeypatch, mocker):
+        """Testa que chave prefixada e caminho do secret são calculados uma vez."""
+        monkeypatch.setenv("APP_TOKEN", "value")
+        loader = EnvLoader(EnvConfig(prefix="APP_"))
+        prefixed = mocker.spy(loader, "_get_prefixed_key")
+
+        for _ in range(3):
+            assert loader.get("TOKEN") == "value"
+
+        assert prefixed.call_count == 1
+
 
 class TestDockerSecrets:
     """Testes para Docker secrets."""
@@ -88,6 +158,180 @@ class TestDockerSecrets:
         with pytest.raises(SecretNotFoundError):
             loader.get("API_KEY", required=True, use_secrets=True)
 
+    def test_missing_secret_negative_cache(self, temp_secrets_dir, mocker):
+        """Testa que secrets ausentes não voltam a tocar o disco dentro do TTL."""
+        config = EnvConfig(secrets_dir=temp_secrets_dir, secrets_negative_ttl=60)
+        loader = EnvLoader(config)
+        assert loader.get("MISSING_SECRET", default="x") == "x"
+
+        stat = mocker.patch("django_env_loader.loader.os.stat")
+        read = mocker.spy(loader, "_read_secret_file")
+        assert loader.get("MISSING_SECRET", default="x") == "x"
+        stat.assert_not_called()
+        read.assert_not_called()
+
+    def test_negative_cache_expires(self, temp_secrets_dir, mocker):
+        """Testa que o cache negativo expira após o TTL."""
+        config = EnvConfig(secrets_dir=temp_secrets_dir, secrets_negative_ttl=10)
+        loader = EnvLoader(config)
+        monotonic = mocker.patch("django_env_loader.loader.time.monotonic", return_value=100.0)
+
+        assert loader.get("NEW_SECRET", default="x") == "x"
+        (temp_secrets_dir / "NEW_SECRET").write_text("fresh")
+        assert loader.get("NEW_SECRET", default="x") == "x"
+
+        monotonic.return_value = 111.0
+        assert loader.get("NEW_SECRET", default="x") == "fresh"
+
+    def test_negative_cache_bounded(self, temp_secrets_dir, mocker):
+        """Testa que o cache negativo descarta expirados e não cresce sem limite."""
+        mocker.patch.object(loader_module, "_MISSING_SECRETS_LIMIT", 3)
+        monotonic = mocker.patch("django_env_loader.loader.time.monotonic", return_value=100.0)
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, secrets_negative_ttl=10))
+
+        for i in range(3):
+            loader.get(f"ABSENT_{i}", default="x")
+        monotonic.return_value = 105.0
+        loader.get("ABSENT_3", default="x")
+        assert len(loader._missing_secrets) == 1
+
+        monotonic.return_value = 200.0
+        for i in range(4):
+            loader.get(f"OTHER_{i}", default="x")
+        assert len(loader._missing_secrets) <= 3
+        assert str(temp_secrets_dir / "ABSENT_3") not in loader._missing_secrets
+
+    def test_negative_cache_disabled(self, temp_secrets_dir):
+        """Testa que TTL zero desativa o cache negativo."""
+        config = EnvConfig(secrets_dir=temp_secrets_dir, secrets_negative_ttl=0)
+        loader = EnvLoader(config)
+
+        assert loader.get("LATE_SECRET", default="x") == "x"
+        (temp_secrets_dir / "LATE_SECRET").write_text("late")
+        assert loader.get("LATE_SECRET", default="x") == "late"
+
+    def test_missing_secrets_dir(self, tmp_path):
+        """Testa busca com diretório de secrets inexistente."""
+        config = EnvConfig(secrets_dir=tmp_path / "nope")
+        loader = EnvLoader(config)
+        assert loader.get("DB_PASSWORD", default="fallback") == "fallback"
+
+
+class TestBinarySecrets:
+    """Testes de get_bytes/get_buffer e secrets grandes mapeados."""
+
+    def test_get_bytes_shared(self, temp_secrets_dir):
+        """Testa leitura sem strip/decodificação e objeto compartilhado entre chamadas."""
+        (temp_secrets_dir / "TLS_BUNDLE").write_bytes(b"-----BEGIN-----\n\x00\xff\n")
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+
+        first = loader.get_bytes("TLS_BUNDLE")
+        assert first == b"-----BEGIN-----\n\x00\xff\n"
+        assert loader.get_bytes("TLS_BUNDLE") is first
+
+    def test_get_buffer(self, temp_secrets_dir):
+        """Testa a visão somente leitura sobre o arquivo mapeado."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+
+        buffer = loader.get_buffer("DB_PASSWORD")
+        assert isinstance(buffer, memoryview)
+        assert buffer.readonly
+        assert bytes(buffer).strip() == b"secret123"
+        assert loader._secret_maps  # mmap reaproveitado nas próximas chamadas
+
+    def test_env_fallback_and_missing(self, temp_secrets_dir, monkeypatch):
+        """Testa fallback para o ambiente codificado e variáveis ausentes."""
+        monkeypatch.setenv("BIN_FROM_ENV", "olá")
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+
+        assert loader.get_bytes("BIN_FROM_ENV") == "olá".encode()
+        assert bytes(loader.get_buffer("BIN_FROM_ENV")) == "olá".encode()
+        assert loader.get_bytes("BIN_MISSING", default=b"x") == b"x"
+        assert loader.get_buffer("BIN_MISSING") is None
+        with pytest.raises(SecretNotFoundError):
+            loader.get_bytes("BIN_MISSING", required=True)
+
+    def test_large_secret_not_cached_as_str(self, temp_secrets_dir):
+        """Testa que secrets grandes são decodificados do mmap, fora do cache de str."""
+        (temp_secrets_dir / "JWKS").write_text('{"keys": []}' + " " * 100)
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, large_secret_bytes=64))
+
+        assert loader.get("JWKS") == '{"keys": []}'
+        assert loader.get("DB_PASSWORD") == "secret123"
+        assert "JWKS" not in {Path(path).name for path in loader._secrets_cache.snapshot()}
+        assert str(temp_secrets_dir / "DB_PASSWORD") in loader._secrets_cache
+
+    def test_large_secret_in_get_all(self, temp_secrets_dir):
+        """Testa que secrets grandes mapeados aparecem em get_all(include_secrets=True)."""
+        (temp_secrets_dir / "JWKS").write_text('{"keys": []}' + " " * 100)
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, large_secret_bytes=64))
+        loader.get("JWKS")
+
+        assert loader.get_all(include_secrets=True)[str(temp_secrets_dir / "JWKS")] == (
+            '{"keys": []}'
+        )
+
+    def test_mapped_secret_skips_str_cache_and_listing(self, temp_secrets_dir, mocker):
+        """Testa que secrets já mapeados não passam pelo cache de str nem pela listagem."""
+        (temp_secrets_dir / "JWKS").write_text("x" * 100)
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, large_secret_bytes=64))
+        loader.get("JWKS")
+        loader._secrets_cache.reset_stats()
+        listing = mocker.spy(loader, "_is_secret_missing")
+
+        assert loader.get("JWKS") == "x" * 100
+        assert loader.cache_stats().misses == 0
+        listing.assert_not_called()
+
+    def test_large_secret_cache_ttl(self, temp_secrets_dir, mocker):
+        """Testa que secrets grandes seguem secrets_cache_ttl (rotação relida)."""
+        now = [100.0]
+        mocker.patch("django_env_loader.cache.time.monotonic", side_effect=lambda: now[0])
+        (temp_secrets_dir / "JWKS").write_text("a" * 100)
+        loader = EnvLoader(
+            EnvConfig(secrets_dir=temp_secrets_dir, large_secret_bytes=64, secrets_cache_ttl=10)
+        )
+        assert loader.get("JWKS") == "a" * 100
+
+        # Rotação atômica (rename), como Docker e Kubernetes
+        (temp_secrets_dir / "JWKS.new").write_text("b" * 100)
+        os.replace(temp_secrets_dir / "JWKS.new", temp_secrets_dir / "JWKS")
+        assert loader.get("JWKS") == "a" * 100
+
+        now[0] = 111.0
+        assert loader.get("JWKS") == "b" * 100
+
+    def test_binary_caches_bounded(self, temp_secrets_dir):
+        """Testa que os caches binários respeitam secrets_cache_max_entries."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, secrets_cache_max_entries=1))
+        loader.get_bytes("API_KEY")
+        loader.get_bytes("DB_PASSWORD")
+        loader.get_buffer("API_KEY")
+        loader.get_buffer("DB_PASSWORD")
+
+        assert len(loader._secret_bytes) == 1
+        assert len(loader._secret_maps) == 1
+
+    def test_binary_caches_follow_fork_policy(self, temp_secrets_dir):
+        """Testa que clear_cache_on_fork também vale para bytes e mapeamentos."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, clear_cache_on_fork=True))
+        loader.get_buffer("API_KEY")
+
+        loader._secret_maps._after_fork_in_child()
+
+        assert loader._secret_maps.clear_on_fork
+        assert len(loader._secret_maps) == 0
+
+    def test_invalidate_drops_buffers(self, temp_secrets_dir):
+        """Testa que invalidate_secret descarta bytes e mapeamentos."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+        assert loader.get_bytes("API_KEY").strip() == b"api_key_value"
+
+        (temp_secrets_dir / "API_KEY").write_text("rotated")
+        loader.invalidate_secret("API_KEY")
+
+        assert loader.get_bytes("API_KEY") == b"rotated"
+
 
 class TestTypeConversions:
     """Testes para conversões de tipo."""
@@ -127,6 +371,58 @@ class TestTypeConversions:
         assert loader.get_dict("DICT_VAR") == {"key1": "val1", "key2": "val2"}
 
 
+class TestMemoizedGetters:
+    """Testes para o modo memoizado dos getters tipados."""
+
+    def test_repeated_reads_reuse_value(self, monkeypatch, mocker):
+        """Testa que leituras repetidas não reconvertem o valor."""
+        loader = EnvLoader(EnvConfig(memoize_typed=True))
+        monkeypatch.setenv("HOSTS", "a,b")
+        spy = mocker.patch(
+            "django_env_loader.loader.compile_converter", wraps=loader_module.compile_converter
+        )
+
+        first = loader.get_list("HOSTS")
+        second = loader.get_list("HOSTS")
+
+        assert first == ["a", "b"]
+        assert first is second
+        assert spy.call_count == 1
+
+    def test_invalidated_when_raw_value_changes(self, monkeypatch):
+        """Testa invalidação quando o valor bruto muda."""
+        loader = EnvLoader(EnvConfig(memoize_typed=True))
+        monkeypatch.setenv("PORT", "80")
+        assert loader.get_int("PORT") == 80
+
+        monkeypatch.setenv("PORT", "8080")
+        assert loader.get_int("PORT") == 8080
+
+    def test_frozen_containers(self, monkeypatch):
+        """Testa que listas e dicionários memoizados são imutáveis."""
+        loader = EnvLoader(EnvConfig(memoize_typed=True))
+        monkeypatch.setenv("HOSTS", "a,b")
+        monkeypatch.setenv("OPTIONS", "k=v")
+
+        hosts = loader.get_list("HOSTS")
+        options = loader.get_dict("OPTIONS")
+
+        with pytest.raises(TypeError):
+            hosts.append("c")
+        with pytest.raises(TypeError):
+            options["x"] = "y"
+        assert list(hosts) + ["c"] == ["a", "b", "c"]
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Testa que, por padrão, cada chamada retorna uma lista nova e mutável."""
+        loader = EnvLoader()
+        monkeypatch.setenv("HOSTS", "a,b")
+
+        hosts = loader.get_list("HOSTS")
+        hosts.append("c")
+        assert loader.get_list("HOSTS") == ["a", "b"]
+
+
 class TestValidation:
     """Testes para validação customizada."""
 
@@ -248,3 +544,40 @@ class TestStrictMode:
         config = EnvConfig(env_file=Path("nonexistent.env"), strict_mode=False)
         loader = EnvLoader(config)
         assert loader is not None
+
+
+class TestLazyImport:
+    """Testes para o import preguiçoso do pacote."""
+
+    def test_import_does_not_load_dotenv(self):
+        """Testa que importar o pacote não carrega loader nem dotenv."""
+        code = (
+            "import sys, django_env_loader; "
+            "assert 'dotenv' not in sys.modules; "
+            "assert 'django_env_loader.loader' not in sys.modules; "
+            "assert not django_env_loader.env_loader.is_loaded"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+    def test_lazy_exports(self):
+        """Testa que os exports preguiçosos resolvem para as classes reais."""
+        import django_env_loader
+
+        from django_env_loader import loader
+
+        assert django_env_loader.EnvLoader is loader.EnvLoader
+        assert "EnvConfig" in dir(django_env_loader)
+        with pytest.raises(AttributeError):
+            django_env_loader.DoesNotExist  # noqa: B018
+
+    def test_env_loader_proxy(self, monkeypatch):
+        """Testa que o proxy constrói o loader no primeiro acesso."""
+        from django_env_loader.lazy import LazyEnvLoader
+
+        proxy = LazyEnvLoader()
+        assert not proxy.is_loaded
+        monkeypatch.setenv("LAZY_VAR", "lazy")
+        assert proxy.get("LAZY_VAR") == "lazy"
+        assert proxy.is_loaded
+        assert proxy.config is EnvLoader().config
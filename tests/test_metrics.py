@@ -0,0 +1,142 @@
+"""Testes para a instrumentação das buscas."""
+
+import pytest
+
+from django_env_loader import EnvConfig, EnvLoader
+from django_env_loader.backends import EnvBackend
+from django_env_loader.metrics import (
+    Histogram,
+    InMemoryMetrics,
+    MetricsCollector,
+    MetricsExporter,
+)
+
+
+class RecordingExporter:
+    """Exporter que guarda os eventos recebidos."""
+
+    def __init__(self):
+        self.increments = []
+        self.observations = []
+
+    def increment(self, name, value=1, tags=None):
+        self.increments.append((name, value, dict(tags or {})))
+
+    def observe(self, name, value, tags=None):
+        self.observations.append((name, value, dict(tags or {})))
+
+
+@pytest.fixture
+def metrics():
+    return InMemoryMetrics()
+
+
+class TestHistogram:
+    """Testes do histograma de latência."""
+
+    def test_buckets(self):
+        """Testa a distribuição e os buckets cumulativos."""
+        histogram = Histogram((0.001, 0.01))
+        for value in (0.0005, 0.001, 0.005, 0.5):
+            histogram.observe(value)
+
+        data = histogram.as_dict()
+        assert data["count"] == 4
+        assert data["sum"] == pytest.approx(0.5065)
+        assert data["buckets"] == {"0.001": 2, "0.01": 3, "inf": 4}
+
+
+class TestInMemoryMetrics:
+    """Testes do coletor em memória."""
+
+    def test_protocols(self, metrics):
+        """Testa que coletor e exporter seguem as interfaces."""
+        assert isinstance(metrics, MetricsCollector)
+        assert isinstance(RecordingExporter(), MetricsExporter)
+
+    def test_snapshot_and_reset(self, metrics):
+        """Testa a agregação e o reset."""
+        metrics.record_access("A")
+        metrics.record_access("A")
+        metrics.record_lookup("A", "env", "hit")
+        metrics.record_read("secret", 0.002)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["keys"] == {"A": 2}
+        assert snapshot["lookups"] == {"env": {"hit": 1}}
+        assert snapshot["reads"]["secret"]["count"] == 1
+
+        metrics.reset()
+        assert metrics.snapshot() == {"lookups": {}, "reads": {}, "keys": {}}
+
+    def test_exporter_forwarding(self):
+        """Testa o repasse de eventos ao exporter."""
+        exporter = RecordingExporter()
+        metrics = InMemoryMetrics(exporter)
+
+        metrics.record_access("A")
+        metrics.record_lookup("A", "secret", "miss")
+        metrics.record_read("secret", 0.25)
+
+        # Contagem por chave só é exportada com export_keys=True
+        assert exporter.increments == [
+            ("env_loader_lookups_total", 1, {"source": "secret", "outcome": "miss"})
+        ]
+        assert exporter.observations == [("env_loader_read_seconds", 0.25, {"source": "secret"})]
+
+    def test_export_keys(self):
+        """Testa a exportação opcional da contagem por chave."""
+        exporter = RecordingExporter()
+        InMemoryMetrics(exporter, export_keys=True).record_access("A")
+        assert exporter.increments == [("env_loader_key_access_total", 1, {"key": "A"})]
+
+
+class TestLoaderMetrics:
+    """Testes da instrumentação no EnvLoader."""
+
+    def test_secret_read_then_cache_hit(self, temp_secrets_dir, metrics):
+        """Testa leitura de arquivo seguida de acerto no cache."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, metrics=metrics))
+
+        loader.get("DB_PASSWORD")
+        loader.get("DB_PASSWORD")
+
+        snapshot = metrics.snapshot()
+        assert snapshot["lookups"]["secret"] == {"hit": 1}
+        assert snapshot["lookups"]["secret_cache"] == {"hit": 1}
+        assert snapshot["reads"]["secret"]["count"] == 1
+        assert snapshot["keys"] == {"DB_PASSWORD": 2}
+
+    def test_fallback_and_negative(self, temp_secrets_dir, metrics, monkeypatch):
+        """Testa fallback para o ambiente e cache negativo."""
+        monkeypatch.setenv("ONLY_ENV", "value")
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, metrics=metrics))
+
+        loader.get("ONLY_ENV")
+        loader.get("MISSING_KEY", default="x")
+
+        lookups = metrics.snapshot()["lookups"]
+        assert lookups["env"] == {"fallback": 1, "miss": 1}
+        assert lookups["secret"] == {"negative": 2}
+
+    def test_env_hit_without_secrets(self, metrics, monkeypatch):
+        """Testa acerto direto no ambiente com use_secrets=False."""
+        monkeypatch.setenv("ONLY_ENV", "value")
+        loader = EnvLoader(EnvConfig(metrics=metrics))
+
+        loader.get("ONLY_ENV", use_secrets=False)
+
+        assert metrics.snapshot()["lookups"] == {"env": {"hit": 1}}
+
+    def test_backends(self, metrics):
+        """Testa a instrumentação da cadeia de backends."""
+        backend = EnvBackend(environ={"A": "1"}, name="memory")
+        loader = EnvLoader(EnvConfig(backends=[backend], metrics=metrics))
+
+        loader.get("A")
+        loader.get_many(["A", "B"])
+
+        snapshot = metrics.snapshot()
+        assert snapshot["lookups"]["memory"] == {"hit": 2, "miss": 1}
+        assert snapshot["reads"]["memory"]["count"] == 2
+        assert snapshot["keys"] == {"A": 2, "B": 1}
@@ -0,0 +1,131 @@
+"""Testes para schemas declarativos."""
+
+import pytest
+
+from django_env_loader import EnvConfig, EnvLoader, EnvSchema, Field, SchemaError
+from django_env_loader.backends import EnvBackend, FileDirBackend
+from django_env_loader.exceptions import SecretNotFoundError, ValidationError
+
+
+class AppSettings(EnvSchema):
+    """Schema usado nos testes."""
+
+    DEBUG = Field(bool, default=False)
+    PORT = Field(int, default=8000)
+    SECRET_KEY = Field(str, required=True)
+    ALLOWED_HOSTS = Field(list, default=["localhost"])
+    TIMEOUT: float = 1.5
+
+
+class TestEnvSchema:
+    """Testes para resolução de schemas."""
+
+    def test_resolve_class_schema(self, monkeypatch):
+        """Testa resolução de schema declarado como classe."""
+        monkeypatch.delenv("DEBUG", raising=False)
+        monkeypatch.setenv("SECRET_KEY", "abc")
+        monkeypatch.setenv("PORT", "9000")
+        monkeypatch.setenv("ALLOWED_HOSTS", "a.com,b.com")
+
+        settings = EnvLoader().load_schema(AppSettings)
+
+        assert settings.DEBUG is False
+        assert settings.PORT == 9000
+        assert settings.SECRET_KEY == "abc"
+        assert settings.ALLOWED_HOSTS == ["a.com", "b.com"]
+        assert settings.TIMEOUT == 1.5
+
+    def test_settings_are_immutable(self, monkeypatch):
+        """Testa que o objeto resolvido é imutável e sem __dict__."""
+        monkeypatch.setenv("SECRET_KEY", "abc")
+        settings = EnvLoader().load_schema(AppSettings)
+
+        with pytest.raises(AttributeError):
+            settings.PORT = 1
+        with pytest.raises(TypeError):
+            settings.ALLOWED_HOSTS.append("x")
+        assert not hasattr(settings, "__dict__")
+
+    def test_all_errors_reported_together(self, monkeypatch):
+        """Testa que ausências e valores inválidos são reportados juntos."""
+        monkeypatch.setenv("PORT", "not-a-number")
+        monkeypatch.setenv("DEBUG", "maybe")
+
+        with pytest.raises(SchemaError) as exc_info:
+            EnvLoader().load_schema(AppSettings)
+
+        errors = {error.key: error for error in exc_info.value.errors}
+        assert set(errors) == {"PORT", "DEBUG", "SECRET_KEY"}
+        assert isinstance(errors["PORT"], ValidationError)
+        assert isinstance(errors["SECRET_KEY"], SecretNotFoundError)
+
+    def test_dict_schema_with_validator(self, monkeypatch):
+        """Testa schema em dicionário com validador."""
+        monkeypatch.setenv("EMAIL", "ADMIN@EXAMPLE.COM")
+        schema = {
+            "EMAIL": Field(str, validator=str.lower),
+            "WORKERS": int,
+        }
+
+        settings = EnvLoader().load_schema(schema)
+
+        assert settings.EMAIL == "admin@example.com"
+        assert settings.WORKERS == 0
+        assert settings.as_dict() == {"EMAIL": "admin@example.com", "WORKERS": 0}
+
+    def test_secrets_and_prefix(self, temp_secrets_dir, monkeypatch):
+        """Testa leitura de secrets e prefixo no mesmo passo."""
+        monkeypatch.setenv("APP_PORT", "81")
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, prefix="APP_"))
+
+        settings = loader.load_schema(
+            {"DB_PASSWORD": Field(str, required=True), "PORT": Field(int, env="PORT")}
+        )
+
+        assert settings.DB_PASSWORD == "secret123"
+        assert settings.PORT == 81
+
+    def test_nested_secret_key(self, temp_secrets_dir):
+        """Testa que chaves em subdiretórios de secrets_dir não são filtradas pela listagem."""
+        (temp_secrets_dir / "sub").mkdir()
+        (temp_secrets_dir / "sub" / "K").write_text("v")
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+
+        settings = loader.load_schema({"K": Field(str, env="sub/K")})
+
+        assert settings.K == loader.get("sub/K") == "v"
+
+    def test_backends_match_get(self, tmp_path, monkeypatch):
+        """Testa que o schema usa a cadeia de backends, como get()."""
+        (tmp_path / "TOKEN").write_text("from_dir")
+        (tmp_path / "DIR_ONLY").write_text("42")
+        monkeypatch.setenv("TOKEN", "from_env")
+        monkeypatch.delenv("DIR_ONLY", raising=False)
+        loader = EnvLoader(EnvConfig(backends=[EnvBackend(), FileDirBackend(tmp_path, name="kv")]))
+
+        settings = loader.load_schema(
+            {
+                "TOKEN": Field(str, required=True),
+                "DIR_ONLY": Field(int, required=True),
+                "PLAIN": Field(str, default="x", use_secrets=False, env="DIR_ONLY"),
+            }
+        )
+
+        assert settings.TOKEN == loader.get("TOKEN") == "from_env"
+        assert settings.DIR_ONLY == 42
+        assert settings.PLAIN == "x"
+        assert loader.freeze({"DIR_ONLY": int}).DIR_ONLY == 42
+
+    def test_backends_missing_reports_backends(self, tmp_path):
+        """Testa que o erro lista os backends consultados."""
+        loader = EnvLoader(EnvConfig(backends=[FileDirBackend(tmp_path, name="kv")]))
+
+        with pytest.raises(SchemaError) as exc_info:
+            loader.load_schema({"ABSENT": Field(str, required=True)})
+
+        assert exc_info.value.errors[0].searched_locations == ["kv:ABSENT"]
+
+    def test_unsupported_type(self):
+        """Testa erro ao declarar tipo não suportado."""
+        with pytest.raises(TypeError):
+            Field(bytes)
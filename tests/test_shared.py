@@ -0,0 +1,138 @@
+"""Testes para a configuração compartilhada entre processos."""
+
+import os
+import stat
+
+import pytest
+
+from django_env_loader import EnvConfig, EnvLoader
+from django_env_loader.shared import attach, main, publish
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    monkeypatch.delenv("SHARED_VAR", raising=False)
+    path = tmp_path / ".env"
+    path.write_text("SHARED_VAR=from-master\n")
+    return path
+
+
+@pytest.fixture
+def published(tmp_path, env_file, temp_secrets_dir):
+    """Publica a configuração como o processo mestre faria."""
+    loader = EnvLoader(EnvConfig(env_file=env_file, secrets_dir=temp_secrets_dir))
+    target = publish(loader, tmp_path / "shared-config")
+    EnvLoader.reset_singleton()
+    os.environ.pop("SHARED_VAR", None)
+    return target
+
+
+class TestPublishAttach:
+    """Testes de publicação e leitura do arquivo compartilhado."""
+
+    def test_roundtrip(self, published, temp_secrets_dir):
+        """Testa que o arquivo publicado contém .env e secrets."""
+        shared = attach(published)
+
+        assert shared is not None
+        assert shared.env == {"SHARED_VAR": "from-master"}
+        assert shared.secrets["DB_PASSWORD"] == "secret123"
+        assert shared.secrets_dir == str(temp_secrets_dir)
+
+    def test_private_permissions(self, published):
+        """Testa que o arquivo é legível apenas pelo dono."""
+        assert stat.S_IMODE(published.stat().st_mode) == 0o600
+
+    def test_selected_keys(self, tmp_path, temp_secrets_dir):
+        """Testa a publicação apenas dos secrets informados."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+        target = publish(loader, tmp_path / "shared", keys=["API_KEY", "MISSING"])
+
+        assert attach(target).secrets == {"API_KEY": "api_key_value"}
+
+    def test_attach_rejects_foreign_owner(self, published, monkeypatch, caplog):
+        """Testa que arquivo de outro usuário não é carregado."""
+        monkeypatch.setattr(os, "getuid", lambda: published.stat().st_uid + 1)
+
+        assert attach(published) is None
+        assert "dono" in caplog.text
+
+    @pytest.mark.parametrize("mode", [0o640, 0o604])
+    def test_attach_rejects_open_permissions(self, published, mode, caplog):
+        """Testa que arquivo legível por grupo/outros não é carregado."""
+        published.chmod(mode)
+
+        assert attach(published) is None
+        assert "permissões" in caplog.text
+
+    def test_attach_rejects_symlink(self, published, tmp_path):
+        """Testa que links simbólicos não são seguidos."""
+        link = tmp_path / "link"
+        link.symlink_to(published)
+
+        assert attach(link) is None
+
+    def test_attach_missing_or_invalid(self, tmp_path):
+        """Testa que arquivos ausentes ou inválidos são ignorados."""
+        assert attach(tmp_path / "missing") is None
+        for name, content in (("empty", b""), ("garbage", b"\x00garbage")):
+            (tmp_path / name).write_bytes(content)
+            (tmp_path / name).chmod(0o600)
+            assert attach(tmp_path / name) is None
+
+
+class TestLoaderSharedConfig:
+    """Testes do EnvLoader no worker."""
+
+    def test_worker_uses_shared_config(self, published, env_file, temp_secrets_dir, mocker):
+        """Testa que o worker não parseia o .env nem lê secrets do disco."""
+        read_env = mocker.patch("django_env_loader.loader.read_env_file")
+        read_secret = mocker.spy(EnvLoader, "_read_secret_file")
+
+        loader = EnvLoader(
+            EnvConfig(env_file=env_file, secrets_dir=temp_secrets_dir, shared_config=published)
+        )
+
+        assert os.environ["SHARED_VAR"] == "from-master"
+        assert loader.get("DB_PASSWORD") == "secret123"
+        assert read_env.call_count == 0
+        assert read_secret.call_count == 0
+
+    def test_fallback_without_shared_file(self, tmp_path, env_file):
+        """Testa o carregamento normal quando o arquivo não foi publicado."""
+        EnvLoader(EnvConfig(env_file=env_file, shared_config=tmp_path / "missing"))
+        assert os.environ["SHARED_VAR"] == "from-master"
+
+    def test_secrets_dir_mismatch(self, published, env_file, tmp_path, caplog):
+        """Testa que a publicação para outro secrets_dir é ignorada."""
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+
+        loader = EnvLoader(
+            EnvConfig(env_file=env_file, secrets_dir=other_dir, shared_config=published)
+        )
+
+        assert "ignorada" in caplog.text
+        assert loader.get("DB_PASSWORD", default="") == ""
+
+
+class TestSharedCli:
+    """Testes da CLI de publicação."""
+
+    def test_publish_command(self, tmp_path, env_file, temp_secrets_dir, capsys):
+        """Testa a publicação pela linha de comando."""
+        target = tmp_path / "cli-shared"
+        status = main(
+            [
+                "publish",
+                str(target),
+                "--env-file",
+                str(env_file),
+                "--secrets-dir",
+                str(temp_secrets_dir),
+            ]
+        )
+
+        assert status == 0
+        assert capsys.readouterr().out.strip() == str(target)
+        assert attach(target).env == {"SHARED_VAR": "from-master"}
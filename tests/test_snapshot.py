@@ -0,0 +1,118 @@
+"""Testes para o snapshot pré-compilado do .env."""
+
+import os
+
+import pytest
+
+import django_env_loader.snapshot as snapshot_module
+
+from django_env_loader import EnvConfig, EnvFileSyntaxError, EnvLoader
+from django_env_loader.snapshot import (
+    compile_snapshot,
+    load_or_compile,
+    load_snapshot,
+    main,
+    snapshot_path,
+)
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("SNAP_A=1\nSNAP_B='two'\n")
+    return path
+
+
+class TestSnapshot:
+    """Testes de criação e validação do snapshot."""
+
+    def test_compile_and_load(self, env_file):
+        """Testa que o snapshot gravado é carregado sem reparse."""
+        values = compile_snapshot(env_file)
+
+        assert snapshot_path(env_file).is_file()
+        assert load_snapshot(env_file) == values == {"SNAP_A": "1", "SNAP_B": "two"}
+
+    def test_missing_snapshot(self, env_file):
+        """Testa que sem snapshot load_snapshot retorna None."""
+        assert load_snapshot(env_file) is None
+
+    def test_rebuilt_when_source_changes(self, env_file):
+        """Testa que alterações no .env invalidam o snapshot."""
+        compile_snapshot(env_file)
+        env_file.write_text("SNAP_A=changed\n")
+
+        assert load_snapshot(env_file) is None
+        assert load_or_compile(env_file) == {"SNAP_A": "changed"}
+        assert load_snapshot(env_file) == {"SNAP_A": "changed"}
+
+    def test_hash_match_skips_parse(self, env_file, mocker):
+        """Testa que só o mtime alterado não força novo parse."""
+        compile_snapshot(env_file)
+        stat = env_file.stat()
+        os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        parse = mocker.spy(snapshot_module, "parse_env")
+
+        assert load_or_compile(env_file) == {"SNAP_A": "1", "SNAP_B": "two"}
+        assert parse.call_count == 0
+        # O snapshot foi regravado com o novo mtime
+        assert load_snapshot(env_file) is not None
+
+    def test_encoding_mismatch(self, env_file):
+        """Testa que o snapshot é ignorado com outro encoding."""
+        compile_snapshot(env_file)
+        assert load_snapshot(env_file, encoding="latin-1") is None
+
+    def test_corrupted_snapshot(self, env_file):
+        """Testa que um snapshot corrompido é reconstruído."""
+        snapshot_path(env_file).write_bytes(b"not marshal")
+        assert load_or_compile(env_file) == {"SNAP_A": "1", "SNAP_B": "two"}
+
+    def test_unsupported_syntax_not_written(self, tmp_path):
+        """Testa que arquivos que exigem python-dotenv não geram snapshot."""
+        path = tmp_path / ".env"
+        path.write_text("A=${B}\n")
+
+        with pytest.raises(EnvFileSyntaxError):
+            compile_snapshot(path)
+        assert not snapshot_path(path).exists()
+
+    def test_cli(self, env_file, capsys):
+        """Testa a CLI de pré-compilação."""
+        assert main([str(env_file)]) == 0
+        assert snapshot_path(env_file).is_file()
+        assert "2 variáveis" in capsys.readouterr().out
+
+    def test_cli_missing_file(self, tmp_path, capsys):
+        """Testa que a CLI falha para arquivos inexistentes."""
+        assert main([str(tmp_path / "missing.env")]) == 1
+        assert "missing.env" in capsys.readouterr().err
+
+
+class TestLoaderSnapshot:
+    """Testes da integração do snapshot com o EnvLoader."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_env(self, monkeypatch):
+        for key in ("SNAP_A", "SNAP_B"):
+            monkeypatch.delenv(key, raising=False)
+
+    def test_loader_uses_snapshot(self, env_file, mocker):
+        """Testa que o loader carrega o snapshot pré-compilado."""
+        compile_snapshot(env_file)
+        parse = mocker.spy(snapshot_module, "parse_env")
+
+        EnvLoader(EnvConfig(env_file=env_file, env_snapshot=True))
+
+        assert os.environ["SNAP_A"] == "1"
+        assert parse.call_count == 0
+
+    def test_loader_builds_snapshot(self, env_file):
+        """Testa que o loader grava o snapshot na primeira carga."""
+        EnvLoader(EnvConfig(env_file=env_file, env_snapshot=True))
+        assert snapshot_path(env_file).is_file()
+
+    def test_disabled_by_default(self, env_file):
+        """Testa que o snapshot é opcional."""
+        EnvLoader(EnvConfig(env_file=env_file))
+        assert not snapshot_path(env_file).exists()
@@ -0,0 +1,93 @@
+"""Testes para o watcher de secrets e .env."""
+
+import os
+import threading
+
+import pytest
+
+from django_env_loader import EnvConfig, EnvLoader
+from django_env_loader.watcher import SecretsWatcher
+
+
+def _touch_later(path):
+    """Avança o mtime do arquivo para garantir que a alteração seja percebida."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestPollingWatcher:
+    """Testes do watcher em modo polling."""
+
+    def test_secret_change_invalidates_cache(self, temp_secrets_dir):
+        """Testa que só o secret alterado é invalidado no cache."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, cache_secrets=True))
+        assert loader.get("API_KEY") == "api_key_value"
+        assert loader.get("DB_PASSWORD") == "secret123"
+
+        watcher = SecretsWatcher(loader, use_inotify=False)
+        events = []
+        watcher.on_change(events.append)
+
+        (temp_secrets_dir / "API_KEY").write_text("rotated")
+        _touch_later(temp_secrets_dir / "API_KEY")
+        watcher.poll_once()
+
+        assert [event.name for event in events] == ["API_KEY"]
+        assert loader.get("API_KEY") == "rotated"
+        assert str(temp_secrets_dir / "DB_PASSWORD") in loader._secrets_cache
+
+    def test_new_secret_is_visible(self, temp_secrets_dir):
+        """Testa que um secret criado depois é encontrado após o polling."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir, secrets_negative_ttl=60))
+        assert loader.get("NEW_SECRET", default="x") == "x"
+
+        watcher = SecretsWatcher(loader, use_inotify=False)
+        (temp_secrets_dir / "NEW_SECRET").write_text("created")
+        watcher.poll_once()
+
+        assert loader.get("NEW_SECRET", default="x") == "created"
+
+    def test_env_file_reload(self, tmp_path, monkeypatch):
+        """Testa recarga do .env preservando variáveis definidas externamente."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("FROM_FILE=1\nEXTERNAL=file\n")
+        monkeypatch.setenv("EXTERNAL", "orchestrator")
+        monkeypatch.delenv("FROM_FILE", raising=False)
+        loader = EnvLoader(EnvConfig(env_file=env_file, secrets_dir=tmp_path / "s"))
+
+        watcher = SecretsWatcher(loader, use_inotify=False)
+        events = []
+        watcher.on_change(events.append)
+
+        env_file.write_text("FROM_FILE=2\nEXTERNAL=file2\n")
+        _touch_later(env_file)
+        watcher.poll_once()
+
+        assert os.environ["FROM_FILE"] == "2"
+        assert os.environ["EXTERNAL"] == "orchestrator"
+        assert events[0].source == "env_file"
+        monkeypatch.delenv("FROM_FILE")
+
+
+class TestBackgroundWatcher:
+    """Testes do watcher em background."""
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_background_thread_detects_change(self, temp_secrets_dir, use_inotify):
+        """Testa que o thread em background detecta alterações."""
+        loader = EnvLoader(EnvConfig(secrets_dir=temp_secrets_dir))
+        loader.get("API_KEY")
+        changed = threading.Event()
+
+        watcher = loader.watch(
+            interval=0.05, use_inotify=use_inotify, callbacks=[lambda event: changed.set()]
+        )
+        try:
+            (temp_secrets_dir / "API_KEY").write_text("rotated")
+            _touch_later(temp_secrets_dir / "API_KEY")
+            assert changed.wait(5)
+            assert loader.get("API_KEY") == "rotated"
+        finally:
+            watcher.stop()
+
+        assert not watcher.is_running